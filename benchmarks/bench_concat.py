@@ -0,0 +1,38 @@
+#Version 10/18/26
+#python benchmarks/bench_concat.py
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+"""
+Time TensileParsingRun.read_files_procedure vs. total sample count to
+check that accumulating sample blocks stays linear (time per sample should
+be roughly constant as the sample count grows)
+JDL 10/18/26
+"""
+import sys, os
+import tempfile
+import time
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) + os.sep + 'libs'
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+from curve_parse import TensileParsingRun
+from synthetic_files import example_parse_defn, write_synthetic_folder
+
+def bench_sample_counts(lst_n_files, n_samples=50, n_points=200):
+    """
+    Print read_files_procedure time and time per sample for each file count
+    JDL 10/18/26
+    """
+    print('samples  seconds  ms/sample')
+    for n_files in lst_n_files:
+        with tempfile.TemporaryDirectory() as path_folder:
+            write_synthetic_folder(path_folder, n_files, n_samples, n_points)
+            run = TensileParsingRun(example_parse_defn(), path_folder + os.sep)
+
+            t0 = time.perf_counter()
+            run.read_files_procedure()
+            secs = time.perf_counter() - t0
+
+        n_total = n_files * n_samples
+        print(f'{n_total:7d}  {secs:7.2f}  {1000 * secs / n_total:9.2f}')
+
+if __name__ == '__main__':
+    bench_sample_counts([2, 4, 8, 16, 32])
@@ -0,0 +1,51 @@
+#Version 10/18/26
+#python benchmarks/bench_write.py
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+"""
+Compare TensileParsingRun.write_parsed_data time and df_raw output size
+for each output format on a synthetic run
+JDL 10/18/26
+"""
+import sys, os
+import tempfile
+import time
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) + os.sep + 'libs'
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+from curve_parse import TensileParsingRun
+from parse_output import SQLITE_FILENAME
+from synthetic_files import example_parse_defn, write_synthetic_folder
+
+def output_bytes(path):
+    """
+    Return size of an output file or total size of a dataset directory
+    JDL 10/18/26
+    """
+    if os.path.isfile(path): return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(d, f)) for d, _, files in os.walk(path) for f in files)
+
+def bench_output_formats(lst_formats, n_files=10, n_samples=20, n_points=500):
+    """
+    Print write time and df_raw output size for each output format (for
+    sqlite, the size of the database file that holds both tables)
+    JDL 10/18/26
+    """
+    with tempfile.TemporaryDirectory() as path_folder:
+        write_synthetic_folder(path_folder, n_files, n_samples, n_points)
+        run = TensileParsingRun(example_parse_defn(), path_folder + os.sep)
+        run.read_files_procedure()
+        print('df_raw rows:', len(run.df_raw))
+
+        print('format   seconds   df_raw MB')
+        for output_format in lst_formats:
+            t0 = time.perf_counter()
+            run.write_parsed_data(output_format)
+            secs = time.perf_counter() - t0
+
+            path_raw = os.path.join(path_folder, 'df_raw.' + output_format)
+            if output_format == 'sqlite': path_raw = os.path.join(path_folder, SQLITE_FILENAME)
+            mbytes = output_bytes(path_raw) / 1e6
+            print(f'{output_format:7s}  {secs:7.2f}  {mbytes:10.2f}')
+
+if __name__ == '__main__':
+    bench_output_formats(['xlsx', 'csv', 'parquet', 'feather', 'sqlite'])
@@ -0,0 +1,159 @@
+#Version 10/18/26
+#python benchmarks/run_benchmarks.py --files 10 --samples 20 --points 2000 --json bench.json
+#python benchmarks/run_benchmarks.py --compare bench_old.json bench.json
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+"""
+Benchmark suite for curve_parse. Writes a synthetic folder of MTS-format
+analysis files and times TensileParsingRun.read_files_procedure,
+write_parsed_data (per output format) and each ParseAnalysisFile stage
+separately. Results (min/median/mean seconds over repeats) are stored as
+JSON with the git commit so regressions can be compared across commits
+JDL 10/18/26
+"""
+import sys, os
+import argparse
+import json
+import statistics
+import subprocess
+import tempfile
+import time
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) + os.sep + 'libs'
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+from curve_parse import TensileParsingRun, ParseAnalysisFile
+from synthetic_files import example_parse_defn, write_synthetic_folder
+
+#ParseAnalysisFile stages in parse_individual_file order
+FILE_STAGES = ['open_file', 'read_run_id', 'parse_run_id_string', 'read_analysis_id',
+               'parse_analysis_id_string', 'set_param_idx_lists', 'read_params',
+               'set_raw_idx_lists', 'read_raw_var_names', 'read_raw_data']
+
+def time_repeats(func, repeat):
+    """
+    Return list of elapsed seconds for repeat calls of func()
+    JDL 10/18/26
+    """
+    lst_secs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        lst_secs.append(time.perf_counter() - t0)
+    return lst_secs
+
+def summarize(lst_secs):
+    return {'min':min(lst_secs), 'median':statistics.median(lst_secs),
+            'mean':statistics.mean(lst_secs), 'repeat':len(lst_secs)}
+
+def bench_read_files(path_folder, repeat):
+    """
+    Time read_files_procedure for a new run over the folder
+    JDL 10/18/26
+    """
+    def read_files():
+        TensileParsingRun(example_parse_defn(), path_folder).read_files_procedure()
+    return summarize(time_repeats(read_files, repeat))
+
+def bench_write(path_folder, lst_formats, repeat):
+    """
+    Time write_parsed_data for each output format
+    JDL 10/18/26
+    """
+    run = TensileParsingRun(example_parse_defn(), path_folder)
+    run.read_files_procedure()
+
+    dict_results = {}
+    for output_format in lst_formats:
+        lst_secs = time_repeats(lambda: run.write_parsed_data(output_format), repeat)
+        dict_results['write_parsed_data[' + output_format + ']'] = summarize(lst_secs)
+    return dict_results
+
+def bench_file_stages(path_folder, filename, repeat):
+    """
+    Time each ParseAnalysisFile stage for one file. Each repeat runs the
+    stages in order on a new ParseAnalysisFile and times them separately
+    JDL 10/18/26
+    """
+    dict_secs = {stage:[] for stage in FILE_STAGES + ['concat_blocks']}
+    for _ in range(repeat):
+        run = TensileParsingRun(example_parse_defn(), path_folder)
+        run.file = filename
+        parse_file = ParseAnalysisFile(run)
+        for stage in FILE_STAGES:
+            dict_secs[stage].extend(time_repeats(getattr(parse_file, stage), 1))
+        dict_secs['concat_blocks'].extend(time_repeats(run.concat_blocks, 1))
+    return {'ParseAnalysisFile.' + stage:summarize(lst) for stage, lst in dict_secs.items()}
+
+def git_commit():
+    """
+    Return current git commit hash (or None outside a git checkout)
+    JDL 10/18/26
+    """
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=current_dir, \
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_suite(n_files, n_samples, n_points, repeat, lst_formats):
+    """
+    Run all benchmarks on a synthetic folder and return results dictionary
+    JDL 10/18/26
+    """
+    with tempfile.TemporaryDirectory() as path_folder:
+        path_folder += os.sep
+        lst_files = write_synthetic_folder(path_folder, n_files, n_samples, n_points)
+
+        dict_results = {'read_files_procedure':bench_read_files(path_folder, repeat)}
+        dict_results.update(bench_file_stages(path_folder, lst_files[0], repeat))
+        dict_results.update(bench_write(path_folder, lst_formats, repeat))
+
+    config = {'files':n_files, 'samples':n_samples, 'points':n_points,
+              'raw_rows':n_files * n_samples * n_points}
+    return {'commit':git_commit(), 'timestamp':time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python':sys.version.split()[0], 'config':config, 'results':dict_results}
+
+def print_results(results):
+    print('config:', results['config'], 'commit:', results['commit'])
+    for name, res in results['results'].items():
+        print(f"{name:45s} {res['median']:9.4f} s (min {res['min']:.4f})")
+
+def compare_results(results_old, results_new):
+    """
+    Print median time ratio (new/old) for benchmarks present in both
+    JDL 10/18/26
+    """
+    print('old commit:', results_old['commit'], ' new commit:', results_new['commit'])
+    if results_old['config'] != results_new['config']:
+        print('WARNING: configs differ', results_old['config'], results_new['config'])
+    for name, res in results_new['results'].items():
+        if name not in results_old['results']: continue
+        old, new = results_old['results'][name]['median'], res['median']
+        print(f'{name:45s} {old:9.4f} -> {new:9.4f} s  x{new / old:6.2f}')
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='curve_parse benchmark suite')
+    parser.add_argument('--files', type=int, default=4)
+    parser.add_argument('--samples', type=int, default=10)
+    parser.add_argument('--points', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--formats', default='csv,parquet',
+                        help='comma-separated write_parsed_data output formats')
+    parser.add_argument('--json', help='path to write results JSON')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'),
+                        help='compare two results JSON files and exit')
+    args = parser.parse_args(args)
+
+    if args.compare:
+        with open(args.compare[0]) as f_old, open(args.compare[1]) as f_new:
+            compare_results(json.load(f_old), json.load(f_new))
+        return
+
+    results = run_suite(args.files, args.samples, args.points, args.repeat,
+                        args.formats.split(','))
+    print_results(results)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == '__main__':
+    main()
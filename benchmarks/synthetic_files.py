@@ -0,0 +1,89 @@
+#Version 10/18/26
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+import os
+import numpy as np
+"""
+=========================================================================
+Synthetic MTS-format analysis files for benchmarking
+=========================================================================
+"""
+HEADER_ROWS = ['InitialSpeed,305,"  ""mm/min"""',
+               'DataRate,50,"  ""Hz"""',
+               'EndPoint,40,"  ""mm"""',
+               'GageLength,50,"  ""mm"""',
+               'PeelEndExt,40,"  ""mm"""',
+               'StartPoint,3,"  ""mm"""']
+
+def example_parse_defn():
+    """
+    Return the parse definition for the MTS example files
+    JDL 10/18/26
+    """
+    defn = {}
+    defn['run_id'] = ('_AnalysisName', 1, 0, 1) #Flag, col, row offset, col offset
+    defn['analysis_id'] = ('_AnalysisName', 1, 0, 1)
+    defn['params_start'] = ('BeginSample', 1, 1) #Flag, col, row offset
+    defn['params_end'] = ('BeginData', 1, -1)
+    defn['params_col_names'] = 1 #Column with param names
+    defn['params_col_offset'] = 1 #params_col_names to param vals offset
+    defn['raw_start'] = ('BeginData', 1, 3) #Flag, col, row offset
+    defn['raw_end'] = ('EndData', 1, -1) #Flag, col, row offset
+    defn['raw_var_names'] = (1, -2) #colStart, rowOffset from raw_start row
+    return defn
+
+def write_synthetic_file(pathfile, run_id, n_samples, n_points, material='Material X', seed=0):
+    """
+    Write a synthetic analysis file in the format of the MTS example files
+    (e.g. 'Run101620-1_Material X.csv')
+    JDL 10/18/26
+
+    Args:
+    pathfile [String] path of file to write
+    run_id [String] RunID written into the _AnalysisName cell
+    n_samples [Integer] number of samples (BeginSample blocks) in the file
+    n_points [Integer] number of raw data points per sample
+    material [String] material name written into the _AnalysisName cell
+    seed [Integer] random seed for the synthetic load curves
+    """
+    rng = np.random.default_rng(seed)
+    ext = np.round(np.arange(n_points) * 0.1017, 3)
+
+    lines = ['BeginAnalysis,,']
+    lines.append('_AnalysisName," ""' + run_id + '_' + material + '_Analysis 94623.mss""",')
+    lines.append('_MethodName," ""Method 123468_06-Peel Strength.msm""",')
+    lines.extend(HEADER_ROWS)
+
+    for _ in range(n_samples):
+        load = np.round(np.abs(rng.normal(1.0, 0.5, n_points)), 2)
+        lines.append('BeginSample,,')
+        lines.append('AverageLoad,' + str(round(load.mean(), 2)) + ',"  ""N"""')
+        lines.append('AvgNPeaks,' + str(round(np.sort(load)[-5:].mean(), 2)) + ',"  ""N"""')
+        lines.append('PeakLoad,' + str(load.max()) + ',"  ""N"""')
+        lines.append('PeelEnd,' + str(n_points - 1) + ',"  """""')
+        lines.append('PeelStart,0,"  """""')
+        lines.append('BeginData,,')
+        lines.append('_Load, SlackExt,')
+        lines.append('N," ""mm""",')
+        lines.extend([str(l) + ',' + str(e) + ',' for l, e in zip(load, ext)])
+        lines.append('EndData,,')
+        lines.append('EndSample,,')
+    lines.append('EndAnalysis,,')
+
+    with open(pathfile, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+def write_synthetic_folder(path_folder, n_files, n_samples, n_points, seed=0):
+    """
+    Write n_files synthetic analysis files to a folder (created if needed)
+    and return the list of filenames
+    JDL 10/18/26
+    """
+    os.makedirs(path_folder, exist_ok=True)
+    lst_files = []
+    for i in range(n_files):
+        filename = 'Run101620-' + str(i + 1) + '_Material X.csv'
+        pathfile = os.path.join(path_folder, filename)
+        write_synthetic_file(pathfile, 'Run101620-' + str(i + 1), n_samples, \
+                             n_points, seed=seed + i)
+        lst_files.append(filename)
+    return lst_files
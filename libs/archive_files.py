@@ -0,0 +1,132 @@
+#Version 10/18/26
+import os
+import gzip
+import tarfile
+import zipfile
+import threading
+from collections import OrderedDict
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+"""
+=========================================================================
+Analysis files inside compressed archives
+
+Analysis files are read directly from archives without extracting them
+to disk. A file inside a .zip or .tar(.gz/.bz2/.xz) archive is named
+<archive path>::<member name> (e.g. 'batch_1018.zip::Run101620-1_X.csv');
+a gzip-compressed file (.csv.gz) is named by its own path.
+open_analysis_file returns a streaming binary file object for any of these
+or for a loose file, so members are decompressed as they are read rather
+than held in memory. Archive directories are kept open (a few per process)
+so that reading many members does not re-read an archive's directory for
+each one. Discovery of archives and .gz files is opt-in (see
+file_discovery.FileFilter archives option)
+=========================================================================
+"""
+ARCHIVE_SEP = '::'
+ARCHIVE_EXTENSIONS = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz')
+GZIP_EXTENSION = '.gz'
+
+#Open archives by path: (fingerprint, ZipFile or TarFile), least recently
+#used first
+MAX_OPEN_ARCHIVES = 4
+_dict_archives = OrderedDict()
+_lock_archives = threading.Lock()
+
+def is_archive(filename):
+    """
+    Check whether a filename is a .zip or .tar archive
+    JDL 10/18/26
+    """
+    return filename.lower().endswith(ARCHIVE_EXTENSIONS)
+
+def analysis_name(filename, extension='.csv'):
+    """
+    Return the name of a loose, gzip-compressed or archive member analysis
+    file (without folders) if it has the extension, otherwise None
+    JDL 10/18/26
+    """
+    name = filename.split(ARCHIVE_SEP)[-1].replace('\\', '/').split('/')[-1]
+    if name.endswith(extension + GZIP_EXTENSION): name = name[:-len(GZIP_EXTENSION)]
+    return name if name.endswith(extension) else None
+
+def container_path(pathfile):
+    """
+    Return path of the file on disk (the archive for archive members)
+    JDL 10/18/26
+    """
+    return pathfile.split(ARCHIVE_SEP)[0]
+
+def list_archive_members(path_archive, extension='.csv'):
+    """
+    Return archive's member names with the extension in archive order
+    JDL 10/18/26
+    """
+    with _lock_archives:
+        archive = _open_archive(path_archive)
+        if isinstance(archive, zipfile.ZipFile):
+            lst_members = [info.filename for info in archive.infolist() if not info.is_dir()]
+        else:
+            lst_members = [info.name for info in archive.getmembers() if info.isfile()]
+    return [m for m in lst_members if analysis_name(m, extension) is not None]
+
+def open_analysis_file(pathfile):
+    """
+    Return streaming binary file object of a loose, gzip-compressed (.gz)
+    or archive member (<archive>::<member>) analysis file. Zip members
+    share the cached archive's (reference-counted) file handle; tar members
+    are read through their own handle positioned at the member's data
+    JDL 10/18/26
+    """
+    if ARCHIVE_SEP in pathfile:
+        path_archive, member = pathfile.split(ARCHIVE_SEP, 1)
+        with _lock_archives:
+            archive = _open_archive(path_archive)
+            if isinstance(archive, zipfile.ZipFile): return archive.open(member)
+            tarinfo = archive.getmember(member)
+        return _TarMemberFile(path_archive, tarinfo)
+
+    if pathfile.endswith(GZIP_EXTENSION): return gzip.open(pathfile, 'rb')
+    return open(pathfile, 'rb')
+
+def _open_archive(path_archive):
+    """
+    Return open ZipFile/TarFile for path_archive (reopened if the archive
+    changed); caller holds _lock_archives
+    JDL 10/18/26
+    """
+    stat = os.stat(path_archive)
+    fingerprint = (stat.st_size, stat.st_mtime_ns)
+    key = os.path.abspath(path_archive)
+    if key in _dict_archives and _dict_archives[key][0] == fingerprint:
+        _dict_archives.move_to_end(key)
+        return _dict_archives[key][1]
+
+    if key in _dict_archives: _dict_archives.pop(key)[1].close()
+    if path_archive.lower().endswith('.zip'):
+        archive = zipfile.ZipFile(path_archive)
+    else:
+        archive = tarfile.open(path_archive)
+    _dict_archives[key] = (fingerprint, archive)
+
+    while len(_dict_archives) > MAX_OPEN_ARCHIVES:
+        _dict_archives.popitem(last=False)[1][1].close()
+    return archive
+
+class _TarMemberFile(tarfile.ExFileObject):
+    def __init__(self, path_archive, tarinfo):
+        """
+        Initializes a binary file object streaming one tar member through a
+        TarFile opened for it alone (so concurrent readers do not share a
+        file position); closing it closes that TarFile
+        JDL 10/18/26
+
+        Args:
+        path_archive [String] path of the tar archive
+        tarinfo [TarInfo] member (from the cached archive's directory)
+        """
+        self.archive = tarfile.open(path_archive)
+        super().__init__(self.archive, tarinfo)
+
+    def close(self):
+        super().close()
+        self.archive.close()
@@ -0,0 +1,88 @@
+#Version 10/18/26
+import os
+import json
+from urllib.parse import quote
+from curve_parse import ParseAnalysisFile, index_analysis_blocks
+from parse_cache import file_fingerprint, write_durable
+from parse_plan import compile_parse_defn
+from archive_files import ARCHIVE_SEP
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+"""
+=========================================================================
+Block index sidecar files
+
+A block index records the IDs, raw variable names and the row and byte
+ranges of every sample's param and raw block in an analysis file. It is
+saved next to the file as <file>.blockidx.json (or in an
+<archive>.blockidx folder for archive members) so that later reads can
+seek directly to one sample's block. The index is rebuilt automatically
+if the file's size or mtime (or the parse definition) changes
+=========================================================================
+"""
+SIDECAR_SUFFIX = '.blockidx.json'
+SIDECAR_DIR_SUFFIX = '.blockidx'
+
+def build_block_index(pathfile, defn):
+    """
+    Return block index dictionary for an analysis file (single streaming
+    pass over the file) with the file's fingerprint
+    JDL 10/18/26
+    """
+    index = {'fingerprint':file_fingerprint(pathfile, defn)}
+    index.update(index_analysis_blocks(pathfile, compile_parse_defn(defn)))
+    return index
+
+def load_block_index(pathfile, defn):
+    """
+    Return block index for an analysis file from its sidecar, building and
+    writing the sidecar if missing or out of date
+    JDL 10/18/26
+    """
+    path_sidecar = sidecar_path(pathfile)
+    if os.path.exists(path_sidecar):
+        with open(path_sidecar) as f:
+            index = json.load(f)
+        if index['fingerprint'] == file_fingerprint(pathfile, defn): return index
+
+    index = build_block_index(pathfile, defn)
+    os.makedirs(os.path.dirname(path_sidecar) or '.', exist_ok=True)
+    write_durable(path_sidecar, json.dumps(index).encode())
+    return index
+
+def sidecar_path(pathfile):
+    """
+    Return path of an analysis file's sidecar: <file>.blockidx.json, or
+    <archive>.blockidx/<member>.json for archive members (member name
+    percent-encoded so it is a valid file name on any platform)
+    JDL 10/18/26
+    """
+    if ARCHIVE_SEP not in pathfile: return pathfile + SIDECAR_SUFFIX
+    path_archive, member = pathfile.split(ARCHIVE_SEP, 1)
+    return os.path.join(path_archive + SIDECAR_DIR_SUFFIX, quote(member, safe='') + '.json')
+
+"""
+=========================================================================
+IndexedAnalysisFile Class
+=========================================================================
+"""
+class IndexedAnalysisFile(ParseAnalysisFile):
+    def __init__(self, run):
+        """
+        Initializes a ParseAnalysisFile whose block index is persisted in a
+        sidecar so that later runs skip the indexing pass (for use with
+        TensileParsingRun.samples(file_class=IndexedAnalysisFile))
+        JDL 10/18/26
+
+        Args:
+        run [ParsingRun] reference to parent ParsingRun object
+        """
+        super().__init__(run)
+        self.pathfile = run.path_folder + run.file
+
+    def index_samples(self):
+        """
+        Load (or build) the block index sidecar and set IDs, raw variable
+        names and block row index lists from it
+        JDL 10/18/26
+        """
+        self.set_block_index(load_block_index(self.pathfile, self.run.defn))
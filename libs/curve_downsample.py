@@ -0,0 +1,75 @@
+#Version 10/18/26
+import numpy as np
+from ragged_curves import RaggedCurves
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+"""
+=========================================================================
+Shape-preserving downsampling of raw curves
+
+Reduces df_raw for visualization by min/max-per-bucket decimation, applied
+to all samples at once. Each sample with more than n_points points is
+split into (n_points - 2) // 2 equal-count buckets of consecutive points
+and only each bucket's min and max load points plus the sample's first
+and last points are kept, so every sample keeps its peak load and the
+shape of its envelope. Kept rows retain their original idx
+=========================================================================
+"""
+def downsample_df_raw(df_raw, n_points=500, y_var='_Load'):
+    """
+    Return df_raw reduced to at most n_points rows per sample
+    JDL 10/18/26
+
+    Args:
+    df_raw [DataFrame] parsed raw data (samples in consecutive rows)
+    n_points [Integer] target max points per sample (>= 4)
+    y_var [String] raw variable whose min/max are kept in each bucket
+    """
+    curves = RaggedCurves.from_frame(df_raw)
+    is_kept = minmax_bucket_mask(curves.var(y_var), curves.offsets, n_points)
+    return df_raw[is_kept].reset_index(drop=True)
+
+def minmax_bucket_mask(y, offsets, n_points):
+    """
+    Return boolean mask of points kept by min/max-per-bucket decimation of
+    each segment (segments with <= n_points points are kept whole)
+    JDL 10/18/26
+
+    Args:
+    y [ndarray] values of all segments
+    offsets [ndarray] start of each segment in y (n_segments + 1)
+    n_points [Integer] target max points per segment (>= 4)
+    """
+    if n_points < 4:
+        raise ValueError('n_points must be >= 4 (first and last points plus a min/max pair '
+                         'per bucket); got ' + str(n_points))
+
+    lengths = np.diff(offsets)
+    seg = np.repeat(np.arange(len(lengths)), lengths)
+    pos = np.arange(len(y)) - offsets[seg]
+
+    #Short segments are kept whole; first/last points of all are kept
+    is_kept = lengths[seg] <= n_points
+    is_nonempty = lengths > 0
+    is_kept[offsets[:-1][is_nonempty]] = True
+    is_kept[offsets[1:][is_nonempty] - 1] = True
+
+    #Equal-count buckets of consecutive points of long segments
+    n_buckets = (n_points - 2) // 2
+    idx_long = np.flatnonzero(lengths[seg] > n_points)
+    if len(idx_long) == 0: return is_kept
+    bucket = seg[idx_long] * n_buckets + pos[idx_long] * n_buckets // lengths[seg[idx_long]]
+    y_long = y[idx_long]
+
+    #Sort by bucket then value (NaN never chosen as min or max unless the
+    #bucket is all NaN); first of each bucket is its min and last its max
+    is_nan = np.isnan(y_long)
+    for y_key, is_max in [(np.where(is_nan, np.inf, y_long), False),
+                          (np.where(is_nan, -np.inf, y_long), True)]:
+        order = np.lexsort((y_key, bucket))
+        bucket_sorted = bucket[order]
+        if is_max:
+            is_edge = np.append(bucket_sorted[1:] != bucket_sorted[:-1], True)
+        else:
+            is_edge = np.insert(bucket_sorted[1:] != bucket_sorted[:-1], 0, True)
+        is_kept[idx_long[order[is_edge]]] = True
+    return is_kept
@@ -1,67 +1,563 @@
 #Version 10/5/23
 import pandas as pd
 import numpy as np
-import regex as re
 import os
+import io
+import csv
+import copy
+from collections import deque
+import functools
+import json
+import logging
+import time
+import threading
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, Future
+from parse_plan import compile_parse_defn, as_parse_plan, KEYS_ID, KEYS_MARKER
+from ragged_curves import RaggedCurves, ID_COLS_SAMPLE
+from curve_store import write_curve_store
+from curve_metrics import compute_curve_metrics
+from curve_resample import resample_curves
+from curve_downsample import downsample_df_raw
+from parse_output import OUTPUT_WRITERS, typed_columns
+from file_discovery import FileFilter
+from archive_files import open_analysis_file
+from parse_checkpoint import ParseError
 #2345678901234567890123456789012345678901234567890123456789012345678901234567890
+#ID and index columns of df_raw (other columns are raw data variables)
+ID_COLS_RAW = ['RunID', 'AnalysisID', 'SampleID', 'idx']
+
+logger = logging.getLogger(__name__)
+
+"""
+=========================================================================
+Stage instrumentation (TensileParsingRun instrument option)
+=========================================================================
+"""
+def instrumented_stage(rows=None):
+    """
+    Decorator for a parsing stage method. If the run's instrument option is
+    True, record wall time, rows processed (rows(self) after the stage) and
+    peak allocated memory during the stage to run.lst_stage_records and
+    log it as a JSON line. Otherwise the method is called directly.
+    tracemalloc is process-wide, so peak memory is only measured for
+    stages run in the main thread (peak_bytes is None in worker threads,
+    e.g. FolderWatcher parses)
+    JDL 10/18/26
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            run = getattr(self, 'run', self)
+            if not run.instrument: return func(self, *args, **kwargs)
+
+            is_main = threading.current_thread() is threading.main_thread()
+            if is_main:
+                is_tracing = tracemalloc.is_tracing()
+                if not is_tracing: tracemalloc.start()
+                tracemalloc.reset_peak()
+                bytes_start = tracemalloc.get_traced_memory()[0]
+            t0 = time.perf_counter()
+
+            result = func(self, *args, **kwargs)
+
+            secs = time.perf_counter() - t0
+            peak_bytes = None
+            if is_main:
+                peak_bytes = tracemalloc.get_traced_memory()[1] - bytes_start
+                if not is_tracing: tracemalloc.stop()
+
+            record = {'file':run.file, 'stage':func.__name__, 'secs':secs,
+                      'rows':rows(self) if rows is not None else None,
+                      'peak_bytes':peak_bytes}
+            run.lst_stage_records.append(record)
+            logger.info(json.dumps(record))
+            return result
+        return wrapper
+    return decorator
+
+def _df_file_rows(parse_file):
+    return len(parse_file.df_file)
+
+def _raw_block_rows(parse_file):
+    return parse_file.run.n_raw_rows
+
+def _raw_idx_rows(parse_file):
+    indices = zip(parse_file.lst_idx_raw_start, parse_file.lst_idx_raw_end)
+    return sum(idx_end - idx_start + 1 for idx_start, idx_end in indices)
+
 """
 =========================================================================
 TensileParsingRun Class
 =========================================================================
 """
 class TensileParsingRun:
-    def __init__(self, parse_defn, path_folder):
+    def __init__(self, parse_defn, path_folder, streaming=False, workers=1, cache=None,
+                 compact_dtypes=False, raw_float32=False, sink=None, instrument=False,
+                 raw_chunk_rows=None, file_filter=None, checkpoint=None):
         """
         Initializes a ParsingRun object
-        JDL 10/5/23
+        JDL 10/5/23; optional args JDL 10/18/26
 
         Args:
-        parse_defn [Dictionary] description of how to parse
+        parse_defn [Dictionary] description of how to parse (compiled to
+                                a ParsePlan and validated on creation)
         path_folder [String] directory path of folder containing raw data files
+        streaming [Boolean] if True, read each file in a single line-by-line
+                            pass instead of loading it as a DataFrame
+                            (trades speed for memory: lines are tokenized
+                            by Python's csv module, so parsing takes about
+                            1.5x as long as the pd.read_csv default)
+        workers [Integer] number of processes for parsing files in parallel
+                          (1 parses files serially in this process)
+        cache [ParseCache] optional cache of parsed blocks so that only new
+                           or changed files are re-parsed
+        compact_dtypes [Boolean] if True, build df_raw with categorical ID
+                                 columns and small integer SampleID/idx
+        raw_float32 [Boolean] if True (with compact_dtypes), store raw data
+                              variables as float32
+        sink [Object] optional sink (see parse_sinks.py) that parsed sample
+                      blocks are written to instead of being held in
+                      df_params and df_raw. Serial parses (workers 1, no
+                      cache or checkpoint) write each sample block (or
+                      raw chunk) as it is parsed; otherwise a file's
+                      blocks are written once the file is parsed, so
+                      memory is bounded per file
+        instrument [Boolean] if True, record time, rows and peak memory of
+                             each parsing stage per file (see stage_summary)
+        raw_chunk_rows [Integer] optional max rows (>= 1) per raw data
+                                 block; long sample raw blocks are read,
+                                 converted and output in chunks of this
+                                 many rows (idx numbers continuously across
+                                 chunks). Memory is only bounded by the
+                                 chunk with streaming=True (and a sink);
+                                 the default path still loads each whole
+                                 file as df_file
+        file_filter [FileFilter] optional recursive/filtered discovery of
+                                 analysis files (see file_discovery.py)
+        checkpoint [ParseCheckpoint] optional checkpoint that completed
+                                     files are flushed and journaled to so
+                                     that a restarted run resumes; files
+                                     that fail to parse are quarantined
         """
 
         #User inputs
         self.defn = parse_defn 
+        self.plan = compile_parse_defn(parse_defn)
+
+        #Fail fast on a chunk size that could never advance through a block
+        is_int = isinstance(raw_chunk_rows, int) and not isinstance(raw_chunk_rows, bool)
+        if raw_chunk_rows is not None and not (is_int and raw_chunk_rows >= 1):
+            raise ValueError('raw_chunk_rows must be None or an integer >= 1')
         self.path_folder = path_folder
+        self.streaming = streaming
+        self.workers = workers
+        self.cache = cache
+        self.compact_dtypes = compact_dtypes
+        self.raw_float32 = raw_float32
+        self.sink = sink
+        self.instrument = instrument
+        self.raw_chunk_rows = raw_chunk_rows
+        self.file_filter = file_filter
+        self.checkpoint = checkpoint
 
         #Current file while looping
         self.file = ''
 
-        #Output DataFrames
-        self.df_raw = pd.DataFrame()
-        self.df_params = pd.DataFrame()
+        #Output DataFrames (see df_raw and df_params properties)
+        self._df_raw = pd.DataFrame()
+        self._df_params = pd.DataFrame()
+
+        #Buffers of per-sample blocks not yet concatenated to outputs
+        self.lst_raw_blocks = []
+        self.lst_params_blocks = []
+        self.n_raw_rows = 0
+
+        #Stage instrumentation records (if instrument is True)
+        self.lst_stage_records = []
+
+    @property
+    def df_raw(self):
+        """
+        Stacked raw data for all parsed samples
+        JDL 10/18/26
+        """
+        self.concat_buffers()
+        return self._df_raw
+
+    @df_raw.setter
+    def df_raw(self, df):
+        self._df_raw = df
+        self.lst_raw_blocks = []
+
+    @property
+    def df_params(self):
+        """
+        Param data (one row per sample) for all parsed samples
+        JDL 10/18/26
+        """
+        self.concat_buffers()
+        return self._df_params
+
+    @df_params.setter
+    def df_params(self, df):
+        self._df_params = df
+        self.lst_params_blocks = []
+
+    @instrumented_stage()
+    def concat_blocks(self):
+        """
+        Append buffered sample blocks to df_raw and df_params with a single
+        concatenation each. Buffering keeps total parse time linear in the
+        number of samples (vs. re-copying the outputs once per sample)
+        JDL 10/18/26
+        """
+        self.concat_buffers()
+
+    def concat_buffers(self):
+        """
+        Uninstrumented concat_blocks (called by the df_raw and df_params
+        properties so that reading them adds no stage records)
+        JDL 10/18/26
+        """
+        if self.lst_raw_blocks:
+            #Compact each block before concatenating so a full-size float64/
+            #object df_raw never exists alongside the compact one
+            if self.compact_dtypes:
+                self.lst_raw_blocks = [compact_df_raw(block, self.raw_float32)
+                                       for block in self.lst_raw_blocks]
+            self._df_raw = concat_with_blocks(self._df_raw, self.lst_raw_blocks)
+            self.lst_raw_blocks = []
+
+        if self.lst_params_blocks:
+            self._df_params = concat_with_blocks(self._df_params, self.lst_params_blocks)
+            self.lst_params_blocks = []
+
+    def samples(self, lst_files=None, file_class=None):
+        """
+        Generator of SampleHandle objects for each sample in the folder's
+        analysis files (or the listed files). Files are opened and indexed
+        as they are reached; raw data are only read when accessed
+        JDL 10/18/26
+
+        Args:
+        lst_files [List] optional filenames (default all analysis files)
+        file_class [Class] ParseAnalysisFile (default) or a subclass such
+                           as block_index.IndexedAnalysisFile
+        """
+        if lst_files is None: lst_files = self.iter_analysis_files()
+        if file_class is None: file_class = ParseAnalysisFile
+        for filename in lst_files:
+            run = self.blank_copy()
+            run.file = filename
+            parse_file = file_class(run)
+            parse_file.index_samples()
+
+            for i in range(len(parse_file.lst_idx_raw_start)):
+                yield SampleHandle(parse_file, i + 1)
+
+    def read_raw_curves(self, lst_files=None):
+        """
+        Return RaggedCurves with all samples' raw data as float64 arrays
+        (fast path that skips building per-sample DataFrames; use
+        to_frame() for a df_raw-style DataFrame)
+        JDL 10/18/26
+        """
+        if lst_files is None: lst_files = self.iter_analysis_files()
+        lst_curves = []
+        for filename in lst_files:
+            run = self.blank_copy()
+            run.file = filename
+            lst_curves.append(ParseAnalysisFile(run).read_raw_arrays())
+        return RaggedCurves.concat(lst_curves)
+
+    def curve_metrics(self, n_peaks=5):
+        """
+        Return DataFrame of per-sample curve metrics computed from df_raw
+        and df_params PeelStart/PeelEnd (see curve_metrics.py)
+        JDL 10/18/26
+        """
+        curves = RaggedCurves.from_frame(self.df_raw)
+        return compute_curve_metrics(curves, self.df_params, n_peaks=n_peaks)
+
+    def resampled_curves(self, grid=None, n_grid=200):
+        """
+        Return DataFrame (samples x grid) of _Load resampled onto a common
+        SlackExt grid (see curve_resample.py)
+        JDL 10/18/26
+        """
+        curves = RaggedCurves.from_frame(self.df_raw)
+        return resample_curves(curves, grid=grid, n_grid=n_grid)
+
+    def write_raw_store(self, path_store=None):
+        """
+        Persist raw curves to a memory-mapped store (see curve_store.py).
+        Uses df_raw if data have been parsed; otherwise reads the folder's
+        files with read_raw_curves. Returns the store path
+        JDL 10/18/26
+
+        Args:
+        path_store [String] store directory (default <path_folder>/df_raw.curves)
+        """
+        if path_store is None: path_store = os.path.join(self.path_folder, 'df_raw.curves')
+        if len(self.df_raw) > 0:
+            curves = RaggedCurves.from_frame(self.df_raw)
+        else:
+            curves = self.read_raw_curves()
+        write_curve_store(curves, path_store)
+        return path_store
+
+    def stage_summary(self, by_stage=False):
+        """
+        Return DataFrame of instrumented stage records (file, stage, secs,
+        rows, peak_bytes) or, if by_stage, totals by stage (max peak_bytes)
+        JDL 10/18/26
+        """
+        cols = ['file', 'stage', 'secs', 'rows', 'peak_bytes']
+        df = pd.DataFrame(self.lst_stage_records, columns=cols)
+        if not by_stage: return df
+
+        dict_aggs = {'secs':'sum', 'rows':'sum', 'peak_bytes':'max', 'file':'nunique'}
+        df = df.groupby('stage', sort=False).agg(dict_aggs)
+        return df.rename(columns={'file':'files'})
+
+    def raw_memory_report(self):
+        """
+        Return DataFrame of df_raw memory use by column (bytes and bytes per
+        row) with default dtypes ("before") and compact dtypes ("after")
+        JDL 10/18/26
+        """
+        df_before = expand_df_raw(self.df_raw)
+        df_after = compact_df_raw(self.df_raw, self.raw_float32)
+        return memory_report(df_before, df_after)
 
     def read_files_procedure(self):
         """
         Read all analysis files in specified folder and append data to 
-        df_raw and df_params
-        JDL 10/6/23
+        df_raw and df_params (or write them to sink). Files are parsed (or
+        loaded from cache) and appended in discovery order (see
+        iter_analysis_files), starting as soon as files are discovered
+        JDL 10/6/23; workers, cache, sink, file_filter, checkpoint JDL 10/18/26
         """
-        for filename in os.listdir(self.path_folder):
+        if self.checkpoint is not None:
+            self.read_files_checkpointed()
+            return
 
-            #Skip non-csv files
-            if not filename.endswith('.csv'): continue
+        for filename, (lst_params, lst_raw) in self.iter_file_blocks(self.iter_analysis_files()):
+            self.append_file_blocks(lst_params, lst_raw)
 
-            #Set filename attribute and instance ParseAnalysisFile
-            self.file = filename
-            parse_file = ParseAnalysisFile(self)
-            parse_file.parse_individual_file()
-    
-    def write_parsed_data(self):
+        #Build df_raw and df_params from the buffered sample blocks
+        self.concat_blocks()
+
+    def read_files_checkpointed(self):
         """
-        Write parsed data DataFrames to output file
-        JDL 10/6/23
+        read_files_procedure with a checkpoint: restore the sink (if any)
+        to the checkpoint, skip files completed by an earlier run, record
+        parsed files to the checkpoint (flushed periodically), quarantine
+        files that fail to parse and build the outputs from the completed
+        files of the current discovery list in discovery order. A sink is
+        append-only, so it keeps blocks in completion order (including
+        files since deleted or filtered out)
+        JDL 10/18/26
         """
-        params_filepath = os.path.join(self.path_folder, 'df_params.xlsx')
-        raw_filepath = os.path.join(self.path_folder, 'df_raw.xlsx')
-        
-        # Write df_params to Excel file
-        with pd.ExcelWriter(params_filepath) as writer:
-            self.df_params.to_excel(writer, index=False)
-        
-        # Write df_raw to Excel file
-        with pd.ExcelWriter(raw_filepath) as writer:
-            self.df_raw.to_excel(writer, index=False)
+        self.checkpoint.resume(self)
+        lst_files = self.list_analysis_files()
+        files = self.checkpoint.iter_pending(self, lst_files)
+        for filename, blocks in self.iter_file_blocks(files):
+            if isinstance(blocks, ParseError):
+                logger.warning('Quarantined %s: %s', filename, blocks.error)
+                self.checkpoint.quarantine(self, blocks)
+                continue
+            self.checkpoint.add(self, filename, blocks)
+        self.checkpoint.flush(self)
+
+        #Outputs from completed files' parts (sink already has them)
+        if self.sink is None:
+            for filename, (lst_params, lst_raw) in self.checkpoint.iter_completed_blocks(lst_files):
+                self.append_file_blocks(lst_params, lst_raw)
+        self.concat_blocks()
+
+    def append_file_blocks(self, lst_params, lst_raw):
+        """
+        Write a file's sample blocks to sink if there is one; otherwise
+        buffer them for concat to df_params and df_raw
+        JDL 10/18/26
+        """
+        for df_params in lst_params:
+            self.append_params_block(df_params)
+        for df_raw in lst_raw:
+            self.append_raw_block(df_raw)
+
+    def append_params_block(self, df_params):
+        """
+        Write a sample's params block to sink if there is one; otherwise
+        buffer it for concat to df_params
+        JDL 10/18/26
+        """
+        if self.sink is None:
+            self.lst_params_blocks.append(df_params)
+        else:
+            self.sink.write_params(df_params)
+
+    def append_raw_block(self, df_raw):
+        """
+        Write a sample's raw block (or chunk) to sink if there is one;
+        otherwise buffer it for concat to df_raw
+        JDL 10/18/26
+        """
+        self.n_raw_rows += len(df_raw)
+        if self.sink is None:
+            self.lst_raw_blocks.append(df_raw)
+        else:
+            self.sink.write_raw(df_raw)
+
+    def list_analysis_files(self):
+        """
+        Return list of analysis filenames in discovery order (see
+        iter_analysis_files)
+        JDL 10/18/26
+        """
+        return list(self.iter_analysis_files())
+
+    def iter_analysis_files(self):
+        """
+        Generator of analysis filenames (relative to path_folder). Without
+        a file_filter, these are the .csv (or .csv.gz) files in path_folder
+        in sorted order (excluding parsed output files such as df_raw.csv);
+        .csv members of .zip/.tar archives are only listed with
+        FileFilter(archives=True). With a file_filter, files are discovered
+        (recursively by default) and filtered as they are scanned
+        JDL 10/18/26
+        """
+        file_filter = self.file_filter
+        if file_filter is None: file_filter = FileFilter(recursive=False)
+        yield from file_filter.iter_files(self.path_folder)
+
+    def iter_file_blocks(self, files):
+        """
+        Generator of (filename, (lst_params_blocks, lst_raw_blocks)) in
+        the order of the files iterable (consumed as it is iterated).
+        Files with a current cache entry are loaded from cache; others are
+        parsed (in a process pool if workers > 1) and stored to the cache
+        if there is one
+        JDL 10/18/26
+        """
+        for filename, result in self.iter_parse_files(files):
+            if isinstance(result, ParseError):
+                yield filename, result
+                continue
+            lst_params, lst_raw, lst_stages = result
+            blocks = (lst_params, lst_raw)
+
+            #Cached blocks have no stage records; store parsed blocks
+            if lst_stages is not None:
+                self.lst_stage_records.extend(lst_stages)
+                if self.cache is not None:
+                    self.cache.store(self.path_folder + filename, self.defn, *blocks)
+            yield filename, blocks
+
+    def is_cached(self, filename):
+        """
+        Check whether a file has a current cache entry
+        JDL 10/18/26
+        """
+        if self.cache is None: return False
+        return self.cache.is_current(self.path_folder + filename, self.defn)
+
+    def load_cached(self, filename):
+        """
+        Return (lst_params_blocks, lst_raw_blocks, None) from the cache or
+        None if the file has no current entry
+        JDL 10/18/26
+        """
+        if self.cache is None: return None
+        blocks = self.cache.load(self.path_folder + filename, self.defn)
+        return None if blocks is None else blocks + (None,)
+
+    def iter_parse_files(self, files):
+        """
+        Generator of (filename, (lst_params_blocks, lst_raw_blocks,
+        lst_stage_records)) in the order of the files iterable. Cached
+        files are loaded (with lst_stage_records None). With workers > 1,
+        files are parsed in a process pool with at most 2 * workers results
+        pending at a time. With a checkpoint, a file that fails to parse
+        yields a ParseError instead of raising. Serial parses without a
+        cache or checkpoint (which keep each file's blocks) write sample
+        blocks straight to the sink (if any) and yield empty block lists
+        JDL 10/18/26
+        """
+        run_blank = self.blank_copy()
+        parse = parse_file_blocks if self.checkpoint is None else parse_file_blocks_or_error
+        if self.workers <= 1:
+            is_direct = self.cache is None and self.checkpoint is None
+            for filename in files:
+                result = self.load_cached(filename)
+                if result is None:
+                    run_file = run_blank.blank_copy()
+                    if is_direct: run_file.sink = self.sink
+                    result = parse(run_file, filename)
+                yield filename, result
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = deque()
+            for filename in files:
+                result = self.load_cached(filename)
+                if result is None:
+                    future = executor.submit(parse, run_blank, filename)
+                else:
+                    future = Future()
+                    future.set_result(result)
+                futures.append((filename, future))
+                if len(futures) >= 2 * self.workers:
+                    filename, future = futures.popleft()
+                    yield filename, future.result()
+            while futures:
+                filename, future = futures.popleft()
+                yield filename, future.result()
+
+    def blank_copy(self):
+        """
+        Return a copy of the run with its settings but no parsed data (e.g.
+        to send to worker processes)
+        JDL 10/18/26
+        """
+        run = copy.copy(self)
+        run.cache, run.sink, run.checkpoint = None, None, None
+        run._df_raw, run._df_params = pd.DataFrame(), pd.DataFrame()
+        run.lst_raw_blocks, run.lst_params_blocks = [], []
+        run.n_raw_rows = 0
+        run.lst_stage_records = []
+        return run
+
+    def write_parsed_data(self, output_format='xlsx', raw_points=None, full_raw=True):
+        """
+        Write parsed data DataFrames to output files df_params and df_raw
+        in path_folder
+        JDL 10/6/23; output_format, raw_points and full_raw JDL 10/18/26
+
+        Args:
+        output_format [String] key of parse_output.OUTPUT_WRITERS ('xlsx',
+                               'csv', 'parquet' partitioned by RunID,
+                               'feather' or 'sqlite' tables df_params and
+                               df_raw in parsed_data.sqlite)
+        raw_points [Integer] if specified, also write df_raw_reduced with at
+                             most this many points per sample (min/max per
+                             bucket downsampling; see curve_downsample.py)
+        full_raw [Boolean] if False (with raw_points), write df_raw_reduced
+                           instead of the full-resolution df_raw
+        """
+        write_output = OUTPUT_WRITERS[output_format]
+
+        dict_outputs = {'df_params':self.df_params}
+        if full_raw or raw_points is None: dict_outputs['df_raw'] = self.df_raw
+        if raw_points is not None:
+            dict_outputs['df_raw_reduced'] = downsample_df_raw(self.df_raw, raw_points)
+
+        #Excel output is written as is; other formats get typed ID columns
+        for basename, df in dict_outputs.items():
+            if output_format != 'xlsx': df = typed_columns(df)
+            write_output(df, os.path.join(self.path_folder, basename))
     
 class ParseAnalysisFile:
     def __init__(self, run):
@@ -86,6 +582,7 @@ class ParseAnalysisFile:
         self.lst_idx_raw_start = []
         self.lst_idx_raw_end = []
         self.lst_varnames = []
+        self.block_index = None
         self.run = run
 
     """
@@ -98,6 +595,10 @@ class ParseAnalysisFile:
         Overall procedure to parse a single file
         JDL 10/6/23
         """
+        if self.run.streaming:
+            self.stream_individual_file()
+            return
+
         self.open_and_read_ids()
         self.parse_file_params_data()
         self.parse_file_raw_data()
@@ -139,25 +640,69 @@ class ParseAnalysisFile:
         #Read the raw data for all samples
         self.read_raw_data()
 
+    @instrumented_stage(rows=_raw_block_rows)
+    def stream_individual_file(self):
+        """
+        Parse a single file in one line-by-line pass (streaming mode). IDs,
+        param blocks and raw blocks are appended as they are reached so
+        that only one sample block is held in memory at a time
+        JDL 10/18/26
+        """
+        pathfile = self.run.path_folder + self.run.file
+        param_sample_id, raw_sample_id = 0, 0
+        chunk_rows = self.run.raw_chunk_rows
+        for event in stream_analysis_blocks(pathfile, self.run.plan, chunk_rows):
+
+            if event[0] == 'run_id':
+                self.run_id = event[1]
+                self.parse_run_id_string()
+
+            elif event[0] == 'analysis_id':
+                self.analysis_id = event[1]
+                self.parse_analysis_id_string()
+
+            elif event[0] == 'params':
+                param_sample_id += 1
+                names, vals = event[1], convert_to_numeric(event[2])
+                self.append_param_row(param_sample_id, names, vals)
+
+            elif event[0] == 'raw':
+                raw_sample_id += 1
+
+                #Variable names are set from the first sample (as in
+                #read_raw_var_names)
+                if not self.lst_varnames: self.lst_varnames = event[1]
+                df_temp = convert_rows_to_block(event[2], len(self.lst_varnames))
+                self.append_raw_values(raw_sample_id, df_temp)
+
+            #Chunks of a long raw block (if raw_chunk_rows); a new sample
+            #starts at idx 0
+            elif event[0] == 'raw_chunk':
+                idx_first = event[3]
+                if idx_first == 0: raw_sample_id += 1
+                if not self.lst_varnames: self.lst_varnames = event[1]
+                df_temp = convert_rows_to_block(event[2], len(self.lst_varnames))
+                self.append_raw_values(raw_sample_id, df_temp, idx_first)
+
+    @instrumented_stage(rows=_df_file_rows)
     def open_file(self):
         """
         Open the analysis file to be parsed
         JDL 10/5/23
         """
         pathfile = self.run.path_folder + self.run.file
-        self.df_file = pd.read_csv(pathfile, header=None)
+        with open_analysis_file(pathfile) as f:
+            self.df_file = pd.read_csv(f, header=None)
 
+    @instrumented_stage(rows=_df_file_rows)
     def read_run_id(self):
         """
         Read the RunID from the analysis file
         JDL 10/5/23
         """
-        flag = self.run.defn['run_id'][0]
-        idx_col_flag = self.run.defn['run_id'][1] - 1
-        idx_col_val = idx_col_flag + self.run.defn['run_id'][3]
-        
-        fil = self.df_file[idx_col_flag] == flag
-        self.run_id = self.df_file.loc[fil, idx_col_val].values[0]
+        cell = self.run.plan.run_id
+        fil = self.df_file[cell.idx_col_flag] == cell.flag
+        self.run_id = self.df_file.loc[fil, cell.idx_col_val].values[0]
 
     def parse_run_id_string(self):
         """
@@ -174,30 +719,24 @@ class ParseAnalysisFile:
     def id_string_cleanup(self, id_string):
         """
         Strip leading/trailing spaces and quotes from an ID string
-        JDL 10/5/23
+        JDL 10/5/23; precompiled patterns JDL 10/18/26
         """
-        # Define regular expression patterns
-        leading_space_pattern = r'^\s+'
-        trailing_space_pattern = r'\s+$'
-        quote_pattern = r'^"|"$'
-        
-        # Use regular expression to strip leading/trailing spaces and quotes
-        id_string = re.sub(leading_space_pattern, '', id_string)
-        id_string = re.sub(trailing_space_pattern, '', id_string)
-        id_string = re.sub(quote_pattern, '', id_string)
+        # Use precompiled patterns to strip leading/trailing spaces and quotes
+        plan = self.run.plan
+        id_string = plan.leading_space_pattern.sub('', id_string)
+        id_string = plan.trailing_space_pattern.sub('', id_string)
+        id_string = plan.quote_pattern.sub('', id_string)
         return id_string
     
+    @instrumented_stage(rows=_df_file_rows)
     def read_analysis_id(self):
         """
         Read the AnalysisID from the analysis file
         JDL 10/5/23
         """
-        flag = self.run.defn['analysis_id'][0]
-        idx_col_flag = self.run.defn['analysis_id'][1] - 1
-        idx_col_val = idx_col_flag + self.run.defn['analysis_id'][3]
-        
-        fil = self.df_file[idx_col_flag] == flag
-        self.analysis_id = self.df_file.loc[fil, idx_col_val].values[0]
+        cell = self.run.plan.analysis_id
+        fil = self.df_file[cell.idx_col_flag] == cell.flag
+        self.analysis_id = self.df_file.loc[fil, cell.idx_col_val].values[0]
 
     def parse_analysis_id_string(self):
         """
@@ -211,6 +750,7 @@ class ParseAnalysisFile:
         lst = self.analysis_id.split('_')
         self.analysis_id = lst[2].split('.')[0]
 
+    @instrumented_stage(rows=_df_file_rows)
     def set_param_idx_lists(self):
         """
         Populate lists of parameter block start and end indices within 
@@ -227,16 +767,16 @@ class ParseAnalysisFile:
         (helper function to set_param_idx_lists and set_raw_idx_lists)
         JDL 10/5/23
         """
-        #Get the flag string, column index and row offset from defn dict tuple
-        tup = self.run.defn[defn_key]
-        flag, idx_col_flag, row_offset = tup[0], tup[1] - 1, tup[2]
+        #Get the flag string, column index and row offset from parse plan
+        marker = getattr(self.run.plan, defn_key)
 
         #Get list of indices of rows with the flag string and apply offset
-        fil = self.df_file[idx_col_flag] == flag
+        fil = self.df_file[marker.idx_col_flag] == marker.flag
         lst = self.df_file[fil].index.tolist()
-        lst = [x + row_offset for x in lst]
+        lst = [x + marker.row_offset for x in lst]
         return lst
 
+    @instrumented_stage(rows=_df_file_rows)
     def set_raw_idx_lists(self):
         """
         Populate lists of raw data block start and end indices within 
@@ -246,13 +786,14 @@ class ParseAnalysisFile:
         self.lst_idx_raw_start = self.set_param_idx_list('raw_start')
         self.lst_idx_raw_end = self.set_param_idx_list('raw_end')
 
+    @instrumented_stage()
     def read_raw_var_names(self):
         """
         Read the raw data variable names from the first sample in
         df_file
         JDL 10/6/23
         """
-        row_offset = self.run.defn['raw_var_names'][1]
+        row_offset = self.run.plan.names_row_offset
         idx_names = self.lst_idx_raw_start[0] + row_offset
                 
         for val in self.df_file.loc[idx_names]:
@@ -266,14 +807,15 @@ class ParseAnalysisFile:
                 val = val.strip()
             self.lst_varnames.append(val)
 
+    @instrumented_stage(rows=lambda self: len(self.lst_idx_param_start))
     def read_params(self):
         """
         Iterate over file's samples and append param data to df_params
         JDL 10/6/23
         """
-        #Set column indices for param names and values from defn dict tuple
-        idx_col_names = self.run.defn['params_col_names'] - 1
-        idx_col_vals = idx_col_names + self.run.defn['params_col_offset']
+        #Set column indices for param names and values from parse plan
+        idx_col_names = self.run.plan.idx_col_names
+        idx_col_vals = self.run.plan.idx_col_vals
 
         #Iterate over samples and read params
         indices = zip(self.lst_idx_param_start, self.lst_idx_param_end)
@@ -292,7 +834,14 @@ class ParseAnalysisFile:
         #Read values and convert to numeric if possible
         vals = self.df_file.loc[idx_start:idx_end, idx_col_vals].tolist()
         vals = convert_to_numeric(vals)
+        self.append_param_row(sample_id, names, vals)
 
+    def append_param_row(self, sample_id, names, vals):
+        """
+        Append a sample's param names and (converted) values to df_params
+        (helper function to append_param_block and stream_individual_file)
+        JDL 10/18/26
+        """
         #Append params row to df_params
         df_temp = pd.DataFrame([vals], columns=names)
         
@@ -305,16 +854,17 @@ class ParseAnalysisFile:
         cols = ['RunID', 'AnalysisID', 'SampleID'] + names
         df_temp = df_temp[cols]
 
-        #Concat sample's params data block to df_raw
-        self.run.df_params = pd.concat([self.run.df_params, df_temp], ignore_index=True)
+        #Write sample's params data block to sink or buffer it for concat
+        self.run.append_params_block(df_temp)
 
+    @instrumented_stage(rows=_raw_idx_rows)
     def read_raw_data(self):
         """
         Iterate over file's samples and append raw data to df_raw
         JDL 10/6/23
         """
-        #Set column indices for param names and values from defn dict tuple
-        idx_col_start = self.run.defn['raw_var_names'][0] - 1
+        #Set column indices for raw data from parse plan
+        idx_col_start = self.run.plan.idx_col_raw
         idx_col_end = idx_col_start + len(self.lst_varnames) - 1
 
         #Iterate over samples and read params
@@ -325,36 +875,590 @@ class ParseAnalysisFile:
 
     def append_raw_block(self, sample_id, idx_col_start, idx_col_end, idx_start, idx_end):
         """
-        Append an individual sample's raw data to df_raw
-        JDL 10/6/23
+        Append an individual sample's raw data to df_raw (in chunks of
+        run.raw_chunk_rows rows if specified)
+        JDL 10/6/23; chunks JDL 10/18/26
+        """
+        chunk_rows = self.run.raw_chunk_rows
+        if chunk_rows is None or idx_end - idx_start < chunk_rows:
+            df_temp = self.df_file.loc[idx_start:idx_end, idx_col_start:idx_col_end]
+            self.append_raw_values(sample_id, df_temp)
+            return
+
+        for idx_chunk in range(idx_start, idx_end + 1, chunk_rows):
+            idx_chunk_end = min(idx_chunk + chunk_rows - 1, idx_end)
+            df_temp = self.df_file.loc[idx_chunk:idx_chunk_end, idx_col_start:idx_col_end]
+            self.append_raw_values(sample_id, df_temp, idx_chunk - idx_start)
+
+    def append_raw_values(self, sample_id, df_temp, idx_first=0):
+        """
+        Convert a sample's raw data values and append them to df_raw
+        (helper function to append_raw_block and stream_individual_file)
+        JDL 10/18/26
+
+        Args:
+        sample_id [Integer] sample number within the file
+        df_temp [DataFrame] sample's raw data values (or a chunk of them)
+        idx_first [Integer] idx of the first row (for chunks after the first)
+        """
+        df_temp = self.format_raw_block(sample_id, df_temp, idx_first)
+
+        #Write sample's raw data block to sink or buffer it for concat
+        self.run.append_raw_block(df_temp)
+
+    def format_raw_block(self, sample_id, df_temp, idx_first=0):
+        """
+        Convert a sample's raw data values and return them as a df_raw
+        block with ID and idx columns (idx numbered from idx_first)
+        JDL 10/18/26
         """
         #Read values and convert to numeric if possible
-        df_temp = self.df_file.loc[idx_start:idx_end, idx_col_start:idx_col_end]
-        df_temp = df_temp.apply(convert_to_numeric)
+        df_temp = convert_block_to_numeric(df_temp)
         df_temp.columns = self.lst_varnames
+        df_temp.index = pd.RangeIndex(len(df_temp))
 
-        #Populate ID columns
-        df_temp['SampleID'] = sample_id
-        df_temp['RunID'] = self.run_id
-        df_temp['AnalysisID'] = self.analysis_id
+        #Build ID and idx columns in one step and join them to the values
+        n = len(df_temp)
+        df_ids = pd.DataFrame({'RunID':[self.run_id] * n,
+                               'AnalysisID':[self.analysis_id] * n,
+                               'SampleID':np.full(n, sample_id, dtype=np.int64),
+                               'idx':np.arange(idx_first, idx_first + n, dtype=np.int64)})
+        return pd.concat([df_ids, df_temp], axis=1)
 
-        #Reset the index
-        df_temp.reset_index(drop=True, inplace=True)
-        df_temp.index.name = 'idx'
-        df_temp.reset_index(drop=False, inplace=True)
+    def read_raw_arrays(self):
+        """
+        Read the file's raw data blocks directly into a RaggedCurves object
+        with one bulk float64 conversion (non-numeric cells become NaN)
+        JDL 10/18/26
+        """
+        self.open_and_read_ids()
+        self.set_raw_idx_lists()
+        self.read_raw_var_names()
 
-        #Reorder the columns
-        cols = ['RunID', 'AnalysisID', 'SampleID', 'idx'] + self.lst_varnames
-        df_temp = df_temp[cols]
+        #Gather df_file rows of all raw blocks and convert them in one step
+        indices = list(zip(self.lst_idx_raw_start, self.lst_idx_raw_end))
+        lst_rows = [np.arange(idx_start, idx_end + 1) for idx_start, idx_end in indices]
+        idx_rows = np.concatenate(lst_rows) if lst_rows else np.zeros(0, dtype=np.int64)
+        idx_col_start = self.run.plan.idx_col_raw
+        idx_cols = list(range(idx_col_start, idx_col_start + len(self.lst_varnames)))
+        values = self.df_file.to_numpy(dtype=object)[np.ix_(idx_rows, idx_cols)]
+        values = convert_array_to_float(values).T
+
+        lengths = [len(rows) for rows in lst_rows]
+        offsets = np.concatenate([[0], np.cumsum(lengths, dtype=np.int64)])
+        df_ids = pd.DataFrame({'RunID':self.run_id, 'AnalysisID':self.analysis_id,
+                               'SampleID':np.arange(1, len(lengths) + 1)},
+                               columns=ID_COLS_SAMPLE)
+        return RaggedCurves(np.ascontiguousarray(values), offsets, df_ids, self.lst_varnames)
+
+    """
+    =========================================================================
+    Per-sample (lazy) access to an analysis file
+    =========================================================================
+    """
+    def index_samples(self):
+        """
+        Locate the param and raw data blocks (rows and byte ranges) of all
+        samples with one streaming pass over the file. Only IDs, variable
+        names and block positions are kept; data are read per sample
+        JDL 10/18/26
+        """
+        pathfile = self.run.path_folder + self.run.file
+        self.set_block_index(index_analysis_blocks(pathfile, self.run.plan))
+
+    def set_block_index(self, block_index):
+        """
+        Set IDs, raw variable names and block row index lists from a block
+        index dictionary (see index_analysis_blocks)
+        JDL 10/18/26
+        """
+        self.block_index = block_index
+        self.run_id = block_index['run_id']
+        self.parse_run_id_string()
+        self.analysis_id = block_index['analysis_id']
+        self.parse_analysis_id_string()
+        self.lst_varnames = list(block_index['varnames'])
+
+        self.lst_idx_param_start = [p['row_start'] for p in block_index['params']]
+        self.lst_idx_param_end = [p['row_end'] for p in block_index['params']]
+        self.lst_idx_raw_start = [p['row_start'] for p in block_index['raw']]
+        self.lst_idx_raw_end = [p['row_end'] for p in block_index['raw']]
+
+    def read_sample_params(self, sample_id):
+        """
+        Return dictionary of a sample's param values by param name (reads
+        only the sample's param block byte range)
+        JDL 10/18/26
+        """
+        pathfile = self.run.path_folder + self.run.file
+        rows = read_indexed_rows(pathfile, self.block_index['params'][sample_id - 1])
+        idx_col_names = self.run.plan.idx_col_names
+        idx_col_vals = self.run.plan.idx_col_vals
+
+        names = [_cell(row, idx_col_names) for row in rows]
+        vals = [_cell(row, idx_col_vals) for row in rows]
+        return dict(zip(names, convert_to_numeric(vals)))
+
+    def read_sample_raw(self, sample_id):
+        """
+        Return a sample's raw data as a df_raw block (reads only the
+        sample's raw block byte range)
+        JDL 10/18/26
+        """
+        pathfile = self.run.path_folder + self.run.file
+        rows = read_indexed_rows(pathfile, self.block_index['raw'][sample_id - 1])
+        idx_col_start = self.run.plan.idx_col_raw
+        rows = [row[idx_col_start:] for row in rows]
+        df_temp = convert_rows_to_block(rows, len(self.lst_varnames))
+        return self.format_raw_block(sample_id, df_temp)
 
-        #Concat sample's raw data block to df_raw
-        self.run.df_raw = pd.concat([self.run.df_raw, df_temp], ignore_index=True)
+"""
+=========================================================================
+SampleHandle Class
+=========================================================================
+"""
+class SampleHandle:
+    def __init__(self, parse_file, sample_id):
+        """
+        Initializes a lightweight handle to one parsed sample. IDs and
+        params are set on creation; the raw curve is only read and
+        converted when df_raw is first accessed
+        JDL 10/18/26
+
+        Args:
+        parse_file [ParseAnalysisFile] indexed file containing the sample
+        sample_id [Integer] 1-based sample number within the file
+        """
+        self.parse_file = parse_file
+        self.run_id = parse_file.run_id
+        self.analysis_id = parse_file.analysis_id
+        self.sample_id = sample_id
+        self.params = parse_file.read_sample_params(sample_id)
+        self._df_raw = None
+
+    @property
+    def df_raw(self):
+        """
+        Sample's raw data (read on first access)
+        JDL 10/18/26
+        """
+        if self._df_raw is None:
+            self._df_raw = self.parse_file.read_sample_raw(self.sample_id)
+        return self._df_raw
+
+def parse_file_blocks(run, filename):
+    """
+    Parse one file with a (blank) run and return its buffered param and
+    raw blocks and stage records (worker function for
+    TensileParsingRun.iter_parse_files). If the run has a sink, blocks
+    are written to it as they are parsed and the block lists are empty
+    JDL 10/18/26
+    """
+    run.file = filename
+    parse_file = ParseAnalysisFile(run)
+    parse_file.parse_individual_file()
+    return run.lst_params_blocks, run.lst_raw_blocks, run.lst_stage_records
+
+def parse_file_blocks_or_error(run, filename):
+    """
+    parse_file_blocks that returns a ParseError (filename and error text)
+    if the file fails to parse (worker function for checkpointed runs)
+    JDL 10/18/26
+    """
+    try:
+        return parse_file_blocks(run, filename)
+    except Exception as e:
+        return ParseError(filename, type(e).__name__ + ': ' + str(e))
+
+"""
+=========================================================================
+Streaming tokenizer for analysis files
+=========================================================================
+"""
+def stream_analysis_blocks(pathfile, defn, chunk_rows=None):
+    """
+    Generator that walks an analysis file once, line by line, and yields
+    its contents as they are reached:
+        ('run_id', value) and ('analysis_id', value) raw ID cell values
+        ('params', names, vals, block_pos) for each sample's param block
+        ('raw', varnames, rows, block_pos) for each sample's raw data block
+    Raw rows are lists of the raw columns' cell strings (short rows are
+    not padded; see convert_rows_to_block). Rows are buffered from the
+    params_start flag row until the sample's raw block is complete, so
+    memory tracks one sample block. block_pos is a dictionary of the
+    block's first/last file row ('row_start', 'row_end') and byte range
+    ('byte_start', 'byte_end' exclusive).
+
+    If chunk_rows is specified, raw blocks are instead yielded as
+    ('raw_chunk', varnames, rows, idx_first) events of up to chunk_rows
+    rows as soon as the rows are known to be raw data, and yielded rows are
+    released, so memory tracks one chunk of a long raw block
+    JDL 10/18/26
+
+    Args:
+    pathfile [String] path to the analysis file
+    defn [Dictionary or ParsePlan] parse definition (see TensileParsingRun)
+    chunk_rows [Integer] optional max rows per yielded raw chunk
+    """
+    plan = as_parse_plan(defn)
+    markers = {key:getattr(plan, key) for key in KEYS_MARKER}
+    ids = {key:getattr(plan, key) for key in KEYS_ID}
+    lst_flags = [(key, markers[key].idx_col_flag, markers[key].flag) for key in KEYS_MARKER]
+
+    block, pos, params_done, chunker = None, {}, False, None
+    line_pos = [-1, 0, 0]
+    with open_analysis_file(pathfile) as f:
+        for row in csv.reader(_iter_decoded_lines(f, line_pos)):
+
+            #Yield each ID the first time its flag is encountered
+            for key in list(ids.keys()):
+                if _row_has_flag(row, ids[key]):
+                    yield (key, _cell(row, ids[key].idx_col_val))
+                    del ids[key]
+
+            #A params_start flag begins a new sample block
+            if _row_has_flag(row, markers['params_start']):
+                block, block_lines, pos, params_done = [], [], {}, False
+            if block is None: continue
+
+            #Buffer the row and its file position and record block markers
+            #(block index counts rows already released by the chunker)
+            block.append(row)
+            block_lines.append(tuple(line_pos))
+            idx_row = len(block) - 1 + (chunker.n_released if chunker is not None else 0)
+            for key, idx_col, flag in lst_flags:
+                if idx_col < len(row) and row[idx_col] == flag: pos[key] = idx_row
+
+            #Yield param block once its last row is buffered
+            if not params_done and 'params_end' in pos:
+                idx_start = pos['params_start'] + plan.params_start.row_offset
+                idx_end = pos['params_end'] + plan.params_end.row_offset
+                if len(block) > idx_end:
+                    rows = block[idx_start:idx_end + 1]
+                    names = [_cell(r, plan.idx_col_names) for r in rows]
+                    vals = [_cell(r, plan.idx_col_vals) for r in rows]
+                    params_done = True
+                    yield ('params', names, vals, _block_pos(block_lines, idx_start, idx_end))
+
+            #Yield chunks of raw rows once they are confirmed raw data (only
+            #checked once a full chunk or the raw_end flag could be buffered)
+            if chunk_rows is not None and 'raw_start' in pos:
+                chunker = chunker or _RawChunker(block, block_lines, pos['raw_start'],
+                                                 plan, chunk_rows)
+                if 'raw_end' in pos or chunker.n_rows() - chunker.idx_next >= chunk_rows:
+                    yield from chunker.iter_chunks(pos.get('raw_end'))
+                if chunker.done: block, chunker = None, None
+                continue
+
+            #Yield raw block once its last row is buffered and reset block
+            if 'raw_end' in pos and 'raw_start' in pos:
+                idx_start = pos['raw_start'] + plan.raw_start.row_offset
+                idx_end = pos['raw_end'] + plan.raw_end.row_offset
+                if len(block) > idx_end:
+                    row_names = block[idx_start + plan.names_row_offset]
+                    varnames = _read_var_names(row_names, plan.idx_col_raw)
+                    idx_col_end = plan.idx_col_raw + len(varnames)
+                    rows = [r[plan.idx_col_raw:idx_col_end] for r in block[idx_start:idx_end + 1]]
+                    block_pos = _block_pos(block_lines, idx_start, idx_end)
+                    block = None
+                    yield ('raw', varnames, rows, block_pos)
+
+def index_analysis_blocks(pathfile, defn):
+    """
+    Return dictionary of an analysis file's IDs, raw variable names and
+    the row and byte ranges ('params' and 'raw' lists of block_pos) of
+    every sample's blocks from a single streaming pass over the file
+    JDL 10/18/26
+    """
+    index = {'run_id':None, 'analysis_id':None, 'varnames':[], 'params':[], 'raw':[]}
+    for event in stream_analysis_blocks(pathfile, defn):
+        if event[0] in ['run_id', 'analysis_id']:
+            index[event[0]] = event[1]
+        elif event[0] == 'params':
+            index['params'].append(event[3])
+        elif event[0] == 'raw':
+            if not index['varnames']: index['varnames'] = event[1]
+            index['raw'].append(event[3])
+    return index
+
+def read_indexed_rows(pathfile, block_pos):
+    """
+    Seek to a block's byte range and return its rows as lists of strings
+    JDL 10/18/26
+    """
+    with open_analysis_file(pathfile) as f:
+        f.seek(block_pos['byte_start'])
+        text = f.read(block_pos['byte_end'] - block_pos['byte_start']).decode('utf-8')
+    return list(csv.reader(io.StringIO(text, newline='')))
+
+class _RawChunker:
+    def __init__(self, block, block_lines, idx_flag, plan, chunk_rows):
+        """
+        Helper to stream_analysis_blocks that yields a sample's raw rows in
+        chunks from its (growing) row buffer
+        JDL 10/18/26
+
+        Args:
+        block [List] buffered rows of the sample block
+        block_lines [List] file positions of the buffered rows
+        idx_flag [Integer] block index of the raw_start flag row
+        plan [ParsePlan] compiled parse definition
+        chunk_rows [Integer] max rows per chunk
+        """
+        self.block = block
+        self.block_lines = block_lines
+        self.plan = plan
+        self.chunk_rows = chunk_rows
+        self.idx_start = idx_flag + plan.raw_start.row_offset
+        self.idx_next = self.idx_start
+        self.n_released = 0
+        self.varnames = None
+        self.done = False
+
+    def n_rows(self):
+        """
+        Return number of rows buffered so far including released rows
+        (block indices of later rows are offset by the released rows)
+        JDL 10/18/26
+        """
+        return self.n_released + len(self.block)
+
+    def iter_chunks(self, idx_end_flag):
+        """
+        Yield full chunks of confirmed raw rows and the final (partial)
+        chunk once the raw_end flag row (block index idx_end_flag) and the
+        rows it offsets to are buffered
+        JDL 10/18/26
+        """
+        plan, n_rows = self.plan, self.n_rows()
+        if self.varnames is None:
+            idx_names = self.idx_start + plan.names_row_offset
+            if n_rows <= idx_names: return
+            row_names = self.block[idx_names - self.n_released]
+            self.varnames = _read_var_names(row_names, plan.idx_col_raw)
+
+        #Last row known to be raw data: raw_end offset row if the flag was
+        #found; otherwise rows up to where the flag could next appear
+        if idx_end_flag is None:
+            idx_last, is_final = n_rows + plan.raw_end.row_offset, False
+        else:
+            idx_last = idx_end_flag + plan.raw_end.row_offset
+            is_final = n_rows > idx_last
+            if not is_final: idx_last = n_rows - 1
+        idx_last = min(idx_last, n_rows - 1)
+
+        while idx_last - self.idx_next + 1 >= self.chunk_rows:
+            yield self.take_chunk(self.idx_next + self.chunk_rows - 1)
+
+        if is_final:
+            if idx_last >= self.idx_next or self.idx_next == self.idx_start:
+                yield self.take_chunk(idx_last)
+            self.done = True
+
+    def take_chunk(self, idx_end):
+        """
+        Return a 'raw_chunk' event of block rows idx_next to idx_end and
+        delete those rows from the buffer (so the buffer holds at most
+        about one chunk of raw rows however long the raw block is)
+        JDL 10/18/26
+        """
+        idx_col_start = self.plan.idx_col_raw
+        idx_col_end = idx_col_start + len(self.varnames)
+        i_start, i_end = self.idx_next - self.n_released, idx_end + 1 - self.n_released
+        rows = [row[idx_col_start:idx_col_end] for row in self.block[i_start:i_end]]
+        del self.block[i_start:i_end]
+        del self.block_lines[i_start:i_end]
+        self.n_released += i_end - i_start
+        event = ('raw_chunk', self.varnames, rows, self.idx_next - self.idx_start)
+        self.idx_next = idx_end + 1
+        return event
+
+def _iter_decoded_lines(f, line_pos):
+    """
+    Generator of decoded lines from a binary file object that updates
+    line_pos in place to [row number, byte start, byte end] of the line
+    last yielded
+    JDL 10/18/26
+    """
+    for line in f:
+        line_pos[0] += 1
+        line_pos[1] = line_pos[2]
+        line_pos[2] += len(line)
+        yield line.decode('utf-8')
+
+def _block_pos(block_lines, idx_start, idx_end):
+    """
+    Return file rows and byte range of block rows idx_start to idx_end
+    JDL 10/18/26
+    """
+    return {'row_start':block_lines[idx_start][0], 'row_end':block_lines[idx_end][0],
+            'byte_start':block_lines[idx_start][1], 'byte_end':block_lines[idx_end][2]}
+
+def _cell(row, idx_col):
+    """
+    Return a csv row's cell value or NaN if blank/missing (matching
+    pd.read_csv handling of blank cells)
+    JDL 10/18/26
+    """
+    if idx_col >= len(row) or row[idx_col] == '': return np.nan
+    return row[idx_col]
+
+def _row_has_flag(row, marker):
+    """
+    Check whether a csv row has a marker's (or IdCell's) flag string in
+    its flag column
+    JDL 10/18/26
+    """
+    return _cell(row, marker.idx_col_flag) == marker.flag
+
+def _read_var_names(row, idx_col_start):
+    """
+    Read stripped raw variable names from a csv row until a blank cell
+    JDL 10/18/26
+    """
+    varnames = []
+    for idx_col in range(idx_col_start, len(row)):
+        val = _cell(row, idx_col)
+        if not isinstance(val, str): break
+        varnames.append(val.strip())
+    return varnames
 
 """
 =========================================================================
 Utility functions - move to util.py
 =========================================================================
 """
+def concat_with_blocks(df, lst_blocks):
+    """
+    Concatenate a list of blocks onto an (optionally empty) DataFrame.
+    Categorical columns keep a categorical dtype (union of the blocks'
+    categories) instead of falling back to object
+    JDL 10/18/26
+    """
+    if len(df.columns) > 0: lst_blocks = [df] + lst_blocks
+    return pd.concat(union_block_categories(lst_blocks), ignore_index=True)
+
+def union_block_categories(lst_blocks):
+    """
+    Return blocks with each categorical column recast to the union of its
+    categories across all blocks (pd.concat returns object otherwise)
+    JDL 10/18/26
+    """
+    cols_cat = [col for col in lst_blocks[0].columns
+                if isinstance(lst_blocks[0][col].dtype, pd.CategoricalDtype)]
+    if not cols_cat or len(lst_blocks) < 2: return lst_blocks
+
+    dict_dtypes = {}
+    for col in cols_cat:
+        lst_cats = [block[col].cat.categories for block in lst_blocks]
+        dict_dtypes[col] = pd.CategoricalDtype(pd.Index(np.concatenate(lst_cats)).unique())
+    return [block.astype(dict_dtypes) for block in lst_blocks]
+
+def compact_df_raw(df, raw_float32=False):
+    """
+    Return df_raw with compact dtypes: categorical RunID/AnalysisID, the
+    smallest unsigned integer type for SampleID/idx and (optionally)
+    float32 raw data variables
+    JDL 10/18/26
+    """
+    df = df.copy()
+    for col in ['RunID', 'AnalysisID']:
+        df[col] = df[col].astype('category')
+    for col in ['SampleID', 'idx']:
+        df[col] = pd.to_numeric(df[col], downcast='unsigned')
+    if raw_float32:
+        cols_raw = [col for col in df.columns if col not in ID_COLS_RAW]
+        df[cols_raw] = df[cols_raw].astype(np.float32)
+    return df
+
+def expand_df_raw(df):
+    """
+    Return df_raw with the default (non-compact) dtypes of a parse
+    JDL 10/18/26
+    """
+    dtypes = {'RunID':str, 'AnalysisID':str, 'SampleID':np.int64, 'idx':np.int64}
+    cols_raw = [col for col in df.columns if col not in ID_COLS_RAW]
+    dtypes.update({col:np.float64 for col in cols_raw})
+    return df.astype(dtypes)
+
+def memory_report(df_before, df_after):
+    """
+    Return DataFrame comparing memory use by column (and total) of two
+    versions of a DataFrame with the same columns and rows
+    JDL 10/18/26
+    """
+    df = pd.DataFrame({'bytes_before':df_before.memory_usage(index=False, deep=True),
+                       'bytes_after':df_after.memory_usage(index=False, deep=True)})
+    df.loc['total'] = df.sum()
+    nrows = max(len(df_before), 1)
+    df['bytes_per_row_before'] = df['bytes_before'] / nrows
+    df['bytes_per_row_after'] = df['bytes_after'] / nrows
+    return df
+
+def convert_array_to_float(arr):
+    """
+    Convert an object array to float64 in one step if all values parse;
+    otherwise coerce column by column with non-numeric cells as NaN
+    JDL 10/18/26
+    """
+    try:
+        return arr.astype(np.float64)
+    except (ValueError, TypeError):
+        df = pd.DataFrame(arr).apply(pd.to_numeric, errors='coerce')
+        return df.to_numpy(dtype=np.float64)
+
+def convert_rows_to_block(rows, ncols):
+    """
+    Return csv rows (lists of cell strings) as a numeric raw block of
+    their first ncols cells. Full rows of numbers are parsed to float64 in
+    one bulk step; otherwise rows are padded (blank and missing cells as
+    NaN) and converted with convert_block_to_numeric
+    JDL 10/18/26
+    """
+    try:
+        vals = np.array(rows, dtype=np.float64)
+        if vals.ndim == 2 and vals.shape[1] >= ncols:
+            return pd.DataFrame(vals[:, :ncols], columns=range(ncols))
+    except (ValueError, TypeError):
+        pass
+    rows = [[_cell(row, c) for c in range(ncols)] for row in rows]
+    return convert_block_to_numeric(pd.DataFrame(rows, columns=range(ncols)))
+
+def convert_block_to_numeric(df):
+    """
+    Vectorized equivalent of df.apply(convert_to_numeric) for a block of
+    raw data. An all-numeric block is bulk-parsed to float64 in one step
+    (or returned as is if already float64). Otherwise each column is
+    converted separately, and cells that do not parse (such as units row
+    strings) keep their original values
+    JDL 10/18/26
+    """
+    if all(dtype == np.float64 for dtype in df.dtypes): return df
+    try:
+        vals = df.to_numpy(dtype=object).astype(np.float64)
+        return pd.DataFrame(vals, index=df.index, columns=df.columns)
+    except (ValueError, TypeError):
+        return df.apply(convert_column_to_numeric)
+
+def convert_column_to_numeric(ser):
+    """
+    Convert a column to float64 if all values parse; otherwise convert
+    the parseable values and leave non-numeric cells as is (object dtype)
+    (helper function to convert_block_to_numeric)
+    JDL 10/18/26
+    """
+    try:
+        return pd.Series(ser.to_numpy(dtype=object).astype(np.float64), \
+                         index=ser.index, name=ser.name)
+    except (ValueError, TypeError):
+        pass
+
+    #Bulk parse, then fall back to float() only for cells that did not parse
+    ser_num = pd.to_numeric(ser, errors='coerce').astype(object)
+    fil = ser_num.isna() & ser.notna()
+    ser_num[fil] = convert_to_numeric(ser[fil].tolist())
+    return ser_num
+
 def convert_to_numeric(lst):
     new_lst = []
     
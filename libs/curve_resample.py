@@ -0,0 +1,99 @@
+#Version 10/18/26
+import numpy as np
+import pandas as pd
+from ragged_curves import ID_COLS_SAMPLE
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+"""
+=========================================================================
+Batched resampling of raw curves onto a common grid
+
+All samples' y vs x curves (e.g. _Load vs SlackExt) in a RaggedCurves
+buffer are linearly interpolated onto one shared x grid in a single set
+of NumPy operations (one sort and one searchsorted over all points). The
+result is a dense (samples x grid points) DataFrame indexed by RunID,
+AnalysisID and SampleID with the grid as columns, so per-run mean and
+envelope curves are simple groupby reductions (see curve_envelopes)
+=========================================================================
+"""
+def resample_curves(curves, grid=None, n_grid=200, x_var='SlackExt', y_var='_Load'):
+    """
+    Return DataFrame (samples x grid) of y interpolated at grid x values.
+    NaN points are skipped; grid values outside a sample's x range (or all
+    values for samples with < 2 points) are NaN
+    JDL 10/18/26
+
+    Args:
+    curves [RaggedCurves] raw curves of all samples
+    grid [Array] optional x grid values (default n_grid points spanning
+                 all samples' x values)
+    n_grid [Integer] number of default grid points
+    x_var [String] raw variable name of grid variable
+    y_var [String] raw variable name of resampled variable
+    """
+    x, y = curves.var(x_var), curves.var(y_var)
+    seg = curves.segment_ids()
+
+    #Drop NaN points and sort each sample's points by x
+    is_valid = ~(np.isnan(x) | np.isnan(y))
+    x, y, seg = x[is_valid], y[is_valid], seg[is_valid]
+    order = np.lexsort((x, seg))
+    x, y, seg = x[order], y[order], seg[order]
+    offsets = np.searchsorted(seg, np.arange(curves.n_samples + 1))
+
+    if grid is None:
+        grid = np.linspace(x.min(), x.max(), n_grid) if len(x) else np.zeros(0)
+    grid = np.asarray(grid, dtype=np.float64)
+
+    vals = interp_segments(x, y, seg, offsets, grid)
+    index = pd.MultiIndex.from_frame(curves.df_ids[ID_COLS_SAMPLE])
+    return pd.DataFrame(vals, index=index, columns=pd.Index(grid, name=x_var))
+
+def interp_segments(x, y, seg, offsets, grid):
+    """
+    Return (n_samples, len(grid)) array of y linearly interpolated at grid
+    for each segment of points sorted by (seg, x)
+    JDL 10/18/26
+    """
+    n_samples, n_grid = len(offsets) - 1, len(grid)
+    if len(x) == 0 or n_grid == 0: return np.full((n_samples, n_grid), np.nan)
+
+    #Offset each segment's x by a span larger than the x range so one
+    #searchsorted locates grid values within every segment
+    x_min = min(x.min(), grid.min())
+    span = max(x.max(), grid.max()) - x_min + 1.0
+    keys = seg * span + (x - x_min)
+    samples = np.arange(n_samples)[:, None]
+    pos = np.searchsorted(keys, samples * span + (grid[None, :] - x_min), side='right')
+
+    #Bracketing points (clipped to each segment's first/last pair)
+    starts, ends = offsets[:-1, None], offsets[1:, None]
+    idx_left = np.clip(pos - 1, starts, np.maximum(ends - 2, starts))
+    idx_right = np.minimum(idx_left + 1, np.maximum(ends - 1, 0))
+    idx_left, idx_right = np.minimum(idx_left, len(x) - 1), np.minimum(idx_right, len(x) - 1)
+    x_left, x_right = x[idx_left], x[idx_right]
+    dx = x_right - x_left
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t = np.where(dx > 0, (grid[None, :] - x_left) / dx, 0.0)
+    vals = y[idx_left] + t * (y[idx_right] - y[idx_left])
+
+    #Grid values outside each sample's x range (or < 2 points) are NaN
+    is_short = (ends - starts) < 2
+    x_first, x_last = x[np.minimum(starts, len(x) - 1)], x[np.maximum(ends - 1, 0)]
+    is_out = is_short | (grid[None, :] < x_first) | (grid[None, :] > x_last)
+    vals[is_out] = np.nan
+    return vals
+
+def curve_envelopes(df_grid, level='RunID', stats=('mean', 'min', 'max')):
+    """
+    Return DataFrame of per-group statistic curves (index group and stat)
+    from a resampled (samples x grid) DataFrame
+    JDL 10/18/26
+
+    Args:
+    df_grid [DataFrame] output of resample_curves
+    level [String or List] index level(s) to group samples by
+    stats [Tuple] groupby reductions to compute for each group
+    """
+    grouped = df_grid.groupby(level=level)
+    df = pd.concat({stat:getattr(grouped, stat)() for stat in stats}, names=['stat'])
+    return df.swaplevel(0, -1).sort_index(level=0, sort_remaining=False)
@@ -0,0 +1,54 @@
+#Version 10/18/26
+import os
+import json
+import shutil
+import numpy as np
+import pandas as pd
+from ragged_curves import RaggedCurves, ID_COLS_SAMPLE
+from parse_cache import write_durable
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+"""
+=========================================================================
+Memory-mapped binary store of parsed raw curves
+
+A store is a directory with values.npy (the RaggedCurves float64 buffer)
+and index.json (offsets, sample IDs and raw variable names). Opening a
+store memory-maps values.npy, so reopening is near-instant and selecting
+one curve reads only that curve's pages
+=========================================================================
+"""
+FILE_VALUES = 'values.npy'
+FILE_INDEX = 'index.json'
+
+def write_curve_store(curves, path_store):
+    """
+    Write RaggedCurves to a store directory (replacing any existing store)
+    JDL 10/18/26
+    """
+    #Write durable files to a temp directory and rename it so a partial
+    #store (values and index out of step) is never opened
+    path_tmp = path_store.rstrip(os.sep) + '.tmp'
+    if os.path.isdir(path_tmp): shutil.rmtree(path_tmp)
+    os.makedirs(path_tmp)
+
+    values = np.ascontiguousarray(curves.values)
+    write_durable(os.path.join(path_tmp, FILE_VALUES), lambda f: np.save(f, values))
+    index = {'varnames':curves.varnames, 'offsets':curves.offsets.tolist()}
+    for col in ID_COLS_SAMPLE:
+        index[col] = curves.df_ids[col].tolist()
+    write_durable(os.path.join(path_tmp, FILE_INDEX), json.dumps(index).encode())
+
+    if os.path.isdir(path_store): shutil.rmtree(path_store)
+    os.rename(path_tmp, path_store)
+
+def open_curve_store(path_store):
+    """
+    Return RaggedCurves whose values are a read-only memory map of the store
+    JDL 10/18/26
+    """
+    with open(os.path.join(path_store, FILE_INDEX)) as f:
+        index = json.load(f)
+    values = np.load(os.path.join(path_store, FILE_VALUES), mmap_mode='r')
+    df_ids = pd.DataFrame({col:index[col] for col in ID_COLS_SAMPLE}, columns=ID_COLS_SAMPLE)
+    df_ids['SampleID'] = df_ids['SampleID'].astype(np.int64)
+    return RaggedCurves(values, index['offsets'], df_ids, index['varnames'])
@@ -0,0 +1,150 @@
+#Version 10/18/26
+import os
+import fnmatch
+import regex as re
+from parse_output import OUTPUT_BASENAMES
+from archive_files import ARCHIVE_SEP, is_archive, list_archive_members, analysis_name
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+"""
+=========================================================================
+FileFilter Class
+
+Streamed discovery of analysis files in a folder tree with os.scandir.
+Filenames are yielded (relative to the top folder, so path_folder +
+filename is the file's path) as each directory is scanned, in name order
+within each directory, so parsing can start before the whole tree is
+walked. With archives=True, gzip-compressed files (.csv.gz) and .csv
+members of .zip/.tar archives (named <archive>::<member>, see
+archive_files.py) are also included:
+
+    file_filter = FileFilter(exclude=['*_val.csv'], run_ids=['Run101620-1'],
+                             archives=True)
+    run = TensileParsingRun(defn, path_archive, file_filter=file_filter)
+=========================================================================
+"""
+RUN_ID_PATTERN = r'^([^_]+)_'
+
+class FileFilter:
+    def __init__(self, recursive=True, include=None, exclude=None, run_ids=None,
+                 run_id_pattern=RUN_ID_PATTERN, extension='.csv', exclude_names=OUTPUT_BASENAMES,
+                 archives=False):
+        """
+        Initializes a filter for discovering analysis files
+        JDL 10/18/26
+
+        Args:
+        recursive [Boolean] if True, also search subfolders
+        include [List] glob strings or compiled regex patterns; if given,
+                       files must match at least one
+        exclude [List] glob strings or compiled regex patterns; matching
+                       files are skipped and matching folders are not
+                       searched
+        run_ids [Collection or Function] RunIDs to keep (or a function of
+                                         RunID returning True to keep)
+        run_id_pattern [String] regex whose first group is the RunID in a
+                                filename (files without a match are skipped
+                                if run_ids is given)
+        extension [String] file extension of analysis files
+        exclude_names [List] file name stems to skip (default parsed outputs
+                             such as df_raw.csv)
+        archives [Boolean] if True, also include .gz files and members of
+                           .zip/.tar archives
+
+        Glob strings containing '/' match the relative path (with '/'
+        separators); others match the file or folder name. Regex patterns
+        are searched in the relative path.
+        """
+        self.recursive = recursive
+        self.include = list(include or [])
+        self.exclude = list(exclude or [])
+        self.run_ids = run_ids
+        self.run_id_regex = re.compile(run_id_pattern)
+        self.extension = extension
+        self.exclude_names = set(exclude_names)
+        self.archives = archives
+
+    def iter_files(self, path_folder):
+        """
+        Generator of filenames (relative to path_folder) of matching files
+        JDL 10/18/26
+        """
+        stack = ['']
+        while stack:
+            rel_dir = stack.pop()
+            with os.scandir(os.path.join(path_folder, rel_dir)) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+
+            #Yield the folder's files, then search subfolders in name order
+            lst_dirs = []
+            for entry in entries:
+                rel_path = rel_dir + entry.name
+                if entry.is_dir():
+                    if self.recursive and not self.is_excluded(rel_path, entry.name):
+                        lst_dirs.append(rel_path + os.sep)
+                elif self.archives and is_archive(entry.name):
+                    yield from self.iter_archive_files(path_folder, rel_path)
+                elif self.is_match(rel_path, self.file_name(entry.name)):
+                    yield rel_path
+            stack.extend(reversed(lst_dirs))
+
+    def iter_archive_files(self, path_folder, rel_path):
+        """
+        Generator of <archive>::<member> filenames of matching archive members
+        JDL 10/18/26
+        """
+        if self.is_excluded(rel_path, os.path.basename(rel_path)): return
+        for member in list_archive_members(os.path.join(path_folder, rel_path), self.extension):
+            rel_member = rel_path + ARCHIVE_SEP + member
+            if self.is_match(rel_member, analysis_name(member, self.extension)):
+                yield rel_member
+
+    def file_name(self, name):
+        """
+        Return a file's analysis file name (without .gz if archives is True)
+        or None if it is not an analysis file
+        JDL 10/18/26
+        """
+        if self.archives: return analysis_name(name, self.extension)
+        return name if name.endswith(self.extension) else None
+
+    def is_match(self, rel_path, name):
+        """
+        Check whether a file passes extension, name, include/exclude and
+        RunID filters (name is None for files without the extension)
+        JDL 10/18/26
+        """
+        if name is None: return False
+        if name[:-len(self.extension)] in self.exclude_names: return False
+        if self.include and not any_match(self.include, rel_path, name): return False
+        if self.is_excluded(rel_path, name): return False
+        if self.run_ids is None: return True
+
+        run_id = self.run_id(name)
+        if run_id is None: return False
+        if callable(self.run_ids): return bool(self.run_ids(run_id))
+        return run_id in self.run_ids
+
+    def is_excluded(self, rel_path, name):
+        return any_match(self.exclude, rel_path, name)
+
+    def run_id(self, name):
+        """
+        Return RunID read from a filename with run_id_pattern (or None)
+        JDL 10/18/26
+        """
+        match = self.run_id_regex.search(name)
+        return None if match is None else match.group(1)
+
+def any_match(lst_patterns, rel_path, name):
+    """
+    Check whether a relative path/name matches any glob or regex pattern
+    JDL 10/18/26
+    """
+    rel_path = rel_path.replace(os.sep, '/')
+    for pattern in lst_patterns:
+        if isinstance(pattern, str):
+            target = rel_path if '/' in pattern else name
+            if fnmatch.fnmatchcase(target, pattern): return True
+        elif pattern.search(rel_path):
+            return True
+    return False
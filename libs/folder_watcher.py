@@ -0,0 +1,175 @@
+#Version 10/18/26
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from curve_parse import parse_file_blocks
+from parse_cache import file_fingerprint
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+"""
+=========================================================================
+FolderWatcher Class
+
+Long-running ingest mode: polls a TensileParsingRun's path_folder for new
+analysis files, waits until each has finished writing (size and mtime
+unchanged for settle_secs), parses it on a bounded thread pool and appends
+its blocks to the run's sink (flushed after each file) or to df_params and
+df_raw. Blocks are appended in the thread that polls, in the order files
+finish parsing (so memory is bounded per file, not per sample):
+
+    with SQLiteSink(path_db) as sink:
+        run = TensileParsingRun(defn, path_folder, sink=sink)
+        FolderWatcher(run).run_forever()
+=========================================================================
+"""
+logger = logging.getLogger(__name__)
+
+class FolderWatcher:
+    def __init__(self, run, poll_secs=2.0, settle_secs=2.0, workers=2, ingest_existing=True):
+        """
+        Initializes a watcher of run.path_folder
+        JDL 10/18/26
+
+        Args:
+        run [TensileParsingRun] run whose folder is watched and whose sink
+                                (or buffers) parsed blocks are appended to
+        poll_secs [Float] seconds between polls of the folder
+        settle_secs [Float] seconds a file's size and mtime must be
+                            unchanged before it is considered complete
+        workers [Integer] max threads parsing files at a time
+        ingest_existing [Boolean] if False, files already in the folder
+                                  when the watcher starts are skipped
+        """
+        self.run = run
+        self.poll_secs = poll_secs
+        self.settle_secs = settle_secs
+        self.workers = workers
+
+        #File states: (fingerprint, time first seen with it) of files not
+        #yet submitted, fingerprints of failed files and ingested files
+        self.dict_pending = {}
+        self.dict_failed = {}
+        self.set_ingested = set()
+        if not ingest_existing: self.set_ingested.update(run.list_analysis_files())
+
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.dict_futures = {}
+
+    def run_forever(self, stop_event=None, max_polls=None):
+        """
+        Poll the folder every poll_secs until stop_event is set (or
+        max_polls polls), then finish parsing submitted files
+        JDL 10/18/26
+
+        Args:
+        stop_event [threading.Event] optional event to stop watching
+        max_polls [Integer] optional number of polls before stopping
+        """
+        if stop_event is None: stop_event = threading.Event()
+        n_polls = 0
+        try:
+            while not stop_event.is_set():
+                self.poll()
+                n_polls += 1
+                if max_polls is not None and n_polls >= max_polls: break
+                stop_event.wait(self.poll_secs)
+        finally:
+            self.drain()
+            self.executor.shutdown()
+
+    def poll(self):
+        """
+        Append blocks of files that finished parsing and submit newly
+        completed files for parsing. Return list of appended filenames
+        JDL 10/18/26
+        """
+        lst_appended = self.append_done(wait=False)
+        for filename in self.ready_files():
+            if len(self.dict_futures) >= self.workers: break
+            self.submit(filename)
+        return lst_appended
+
+    def drain(self):
+        """
+        Wait for submitted files and append their blocks. Return list of
+        appended filenames
+        JDL 10/18/26
+        """
+        return self.append_done(wait=True)
+
+    def ready_files(self):
+        """
+        Return sorted list of new files whose size and mtime have been
+        unchanged for at least settle_secs
+        JDL 10/18/26
+        """
+        now = time.monotonic()
+        lst_ready = []
+        for filename in self.run.list_analysis_files():
+            if filename in self.set_ingested or filename in self.dict_futures: continue
+            try:
+                fingerprint = file_fingerprint(self.run.path_folder + filename)
+            except FileNotFoundError:
+                continue
+
+            #Failed files are retried only once they change
+            if self.dict_failed.get(filename) == fingerprint: continue
+
+            #(Re)start settle timer when a file is first seen or changes
+            if filename not in self.dict_pending or self.dict_pending[filename][0] != fingerprint:
+                self.dict_pending[filename] = (fingerprint, now)
+                if self.settle_secs > 0: continue
+
+            if fingerprint[0] > 0 and now - self.dict_pending[filename][1] >= self.settle_secs:
+                lst_ready.append(filename)
+        return lst_ready
+
+    def submit(self, filename):
+        """
+        Load a file's blocks from the run's cache or submit it for parsing
+        JDL 10/18/26
+        """
+        fingerprint = self.dict_pending.pop(filename)[0]
+
+        #Cached blocks are a completed future with no stage records
+        result = self.run.load_cached(filename)
+        if result is not None:
+            future = Future()
+            future.set_result(result)
+        else:
+            future = self.executor.submit(parse_file_blocks, self.run.blank_copy(), filename)
+        self.dict_futures[filename] = (future, fingerprint)
+
+    def append_done(self, wait):
+        """
+        Append blocks of finished files to the run and flush its sink
+        JDL 10/18/26
+
+        Args:
+        wait [Boolean] if True, wait for all submitted files to finish
+        """
+        lst_appended = []
+        for filename, (future, fingerprint) in list(self.dict_futures.items()):
+            if not wait and not future.done(): continue
+            del self.dict_futures[filename]
+            try:
+                lst_params, lst_raw, lst_stages = future.result()
+            except Exception as e:
+                logger.warning('Failed to parse %s: %r', filename, e)
+                self.dict_failed[filename] = fingerprint
+                continue
+
+            self.run.append_file_blocks(lst_params, lst_raw)
+            if self.run.sink is not None: self.run.sink.flush()
+
+            #Store parsed (not cached) files' blocks to cache
+            if lst_stages is not None:
+                self.run.lst_stage_records.extend(lst_stages)
+            if self.run.cache is not None and lst_stages is not None:
+                self.run.cache.store(self.run.path_folder + filename, self.run.defn,
+                                     lst_params, lst_raw)
+            self.set_ingested.add(filename)
+            self.dict_failed.pop(filename, None)
+            lst_appended.append(filename)
+            logger.info('Ingested %s', filename)
+        return lst_appended
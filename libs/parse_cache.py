@@ -0,0 +1,162 @@
+#Version 10/18/26
+import os
+import pickle
+import hashlib
+from archive_files import container_path
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+"""
+=========================================================================
+ParseCache Class
+=========================================================================
+"""
+class ParseCache:
+    def __init__(self, path_cache, max_bytes=2**30):
+        """
+        Initializes a persistent cache of parsed file blocks. Each entry
+        holds one analysis file's param and raw blocks and is keyed by the
+        file's path. An entry is only used if the file's size and mtime
+        and the parse definition match those stored with it
+        JDL 10/18/26
+
+        Args:
+        path_cache [String] directory for cache entry files (created if needed)
+        max_bytes [Integer] size limit; least recently used entries are
+                            evicted once the cache exceeds it
+        """
+        self.path_cache = path_cache
+        self.max_bytes = max_bytes
+        os.makedirs(path_cache, exist_ok=True)
+
+    def load(self, pathfile, defn):
+        """
+        Return (lst_params_blocks, lst_raw_blocks) for a file or None if
+        there is no current entry
+        JDL 10/18/26
+        """
+        entry_path = self.entry_path(pathfile)
+        if not os.path.exists(entry_path): return None
+
+        with open(entry_path, 'rb') as f:
+            header = pickle.load(f)
+            if header['fingerprint'] != self.fingerprint(pathfile, defn): return None
+            entry = pickle.load(f)
+
+        #Mark the entry as recently used for eviction ordering
+        os.utime(entry_path)
+        return entry['lst_params_blocks'], entry['lst_raw_blocks']
+
+    def is_current(self, pathfile, defn):
+        """
+        Check whether a file has a current entry (reads only the entry
+        header, not the stored blocks)
+        JDL 10/18/26
+        """
+        entry_path = self.entry_path(pathfile)
+        if not os.path.exists(entry_path): return False
+
+        with open(entry_path, 'rb') as f:
+            header = pickle.load(f)
+        return header['fingerprint'] == self.fingerprint(pathfile, defn)
+
+    def store(self, pathfile, defn, lst_params_blocks, lst_raw_blocks):
+        """
+        Write (or replace) a file's cache entry and evict old entries if
+        the cache is over its size limit
+        JDL 10/18/26
+        """
+        header = {'pathfile':os.path.abspath(pathfile),
+                  'fingerprint':self.fingerprint(pathfile, defn)}
+        entry = {'lst_params_blocks':lst_params_blocks,
+                 'lst_raw_blocks':lst_raw_blocks}
+
+        #Write header then blocks (header is read alone by is_current)
+        def write_entry(f):
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        write_durable(self.entry_path(pathfile), write_entry)
+        self.evict()
+
+    def evict(self):
+        """
+        Delete least recently used entries until total size <= max_bytes
+        JDL 10/18/26
+        """
+        lst_entries = []
+        for entry in os.scandir(self.path_cache):
+            if not entry.name.endswith('.pkl'): continue
+            stat = entry.stat()
+            lst_entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        total_bytes = sum(size for _, size, _ in lst_entries)
+        for _, size, entry_path in sorted(lst_entries):
+            if total_bytes <= self.max_bytes: break
+            os.remove(entry_path)
+            total_bytes -= size
+
+    def clear(self):
+        """
+        Delete all cache entries
+        JDL 10/18/26
+        """
+        for entry in os.scandir(self.path_cache):
+            if entry.name.endswith('.pkl'): os.remove(entry.path)
+
+    def entry_path(self, pathfile):
+        """
+        Return path of the cache entry file for an analysis file
+        JDL 10/18/26
+        """
+        key = hashlib.sha1(os.path.abspath(pathfile).encode()).hexdigest()
+        return os.path.join(self.path_cache, key + '.pkl')
+
+    def fingerprint(self, pathfile, defn):
+        """
+        Return fingerprint used to check that an entry is current (see
+        file_fingerprint)
+        JDL 10/18/26
+        """
+        return file_fingerprint(pathfile, defn)
+
+def file_fingerprint(pathfile, defn=None):
+    """
+    Return [size, mtime_ns] of a file (of the archive for archive members)
+    plus the parse definition hash if defn is given. Shared by the parse
+    cache, checkpoint journal, block index sidecars and folder watcher (a
+    list, so it compares equal to fingerprints read back from JSON)
+    JDL 10/18/26
+    """
+    stat = os.stat(container_path(pathfile))
+    fingerprint = [stat.st_size, stat.st_mtime_ns]
+    if defn is not None: fingerprint.append(defn_hash(defn))
+    return fingerprint
+
+def write_durable(filepath, data, path_tmp=None):
+    """
+    Write data to a temp file, fsync and rename it to filepath so that a
+    partial file is never read (the one durable-write helper for cache
+    entries, checkpoint parts, sidecars, stores, manifests and parts)
+    JDL 10/18/26
+
+    Args:
+    filepath [String] path of the file to write
+    data [Bytes or Function] bytes, or function that writes to the open
+                             binary file object
+    path_tmp [String] optional temp file path (default filepath + '.tmp')
+    """
+    if path_tmp is None: path_tmp = filepath + '.tmp'
+    with open(path_tmp, 'wb') as f:
+        if callable(data):
+            data(f)
+        else:
+            f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(path_tmp, filepath)
+
+def defn_hash(defn):
+    """
+    Return a stable hash string of a parse definition dictionary
+    JDL 10/18/26
+    """
+    s = repr(sorted(defn.items()))
+    return hashlib.sha1(s.encode()).hexdigest()
@@ -0,0 +1,267 @@
+#Version 10/18/26
+import os
+import json
+import time
+import pickle
+from typing import NamedTuple
+from parse_cache import file_fingerprint, write_durable
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+"""
+=========================================================================
+ParseCheckpoint Class
+
+Checkpoint of a TensileParsingRun(checkpoint=...) batch parse in a folder:
+    part_NNNNN.pkl   param and raw blocks of completed files, written
+                     every flush_files files or flush_secs seconds
+    journal.jsonl    one line per flush (part, fingerprints of its completed
+                     files, sink state) appended only after the part is
+                     durably written (or the sink flushed)
+    quarantine.jsonl one line per file that failed to parse (file, error,
+                     fingerprint)
+Fingerprints hold the file's size, mtime and parse definition hash. A
+restarted run with the same checkpoint folder skips journaled files and
+unchanged quarantined files (with the same parse definition) and builds
+its outputs from the parts. With a (resumable) sink, blocks go to the
+sink instead of parts, and a restarted run first restores the sink to its
+state at the last journaled flush (see parse_sinks.BaseSink)
+=========================================================================
+"""
+FILE_JOURNAL = 'journal.jsonl'
+FILE_QUARANTINE = 'quarantine.jsonl'
+
+class ParseError(NamedTuple):
+    filename: str
+    error: str
+
+class ParseCheckpoint:
+    def __init__(self, path_checkpoint, flush_files=100, flush_secs=60.0):
+        """
+        Initializes a checkpoint (reading its journal if it exists)
+        JDL 10/18/26
+
+        Args:
+        path_checkpoint [String] checkpoint directory (created if needed)
+        flush_files [Integer] completed files buffered before a flush
+        flush_secs [Float] max seconds between flushes of completed files
+        """
+        self.path_checkpoint = path_checkpoint
+        self.flush_files = flush_files
+        self.flush_secs = flush_secs
+        os.makedirs(path_checkpoint, exist_ok=True)
+
+        #Journal and quarantine entries by file (latest entry wins) and
+        #sink state at the last journaled flush
+        self.dict_completed, self.sink_state = read_journal(self.filepath(FILE_JOURNAL))
+        self.dict_quarantine = read_jsonl(self.filepath(FILE_QUARANTINE))
+
+        #Completed files not yet flushed
+        self.dict_pending = {}
+        self.time_flush = time.monotonic()
+
+    def filepath(self, filename):
+        return os.path.join(self.path_checkpoint, filename)
+
+    def resume(self, run):
+        """
+        Prepare run's outputs for resuming: restore a sink to its state at
+        the last journaled flush (or journal its initial state for a new
+        checkpoint). Raise ValueError if the sink is not resumable or the
+        checkpoint's completed files were written to the other kind of
+        output (sink vs. parts)
+        JDL 10/18/26
+        """
+        has_parts = any(entry['part'] is not None for entry in self.dict_completed.values())
+        if run.sink is None:
+            if len(self.dict_completed) > 0 and not has_parts:
+                raise ValueError('Checkpoint files were written to a sink; resume with that sink')
+            return
+
+        if not run.sink.is_resumable:
+            raise ValueError(type(run.sink).__name__ + ' cannot resume from a checkpoint')
+        if has_parts:
+            raise ValueError('Checkpoint files were written to parts; resume without a sink')
+        if self.sink_state is None:
+            self.append_journal({'part':None, 'files':{}, 'sink':run.sink.state()})
+        else:
+            run.sink.restore(self.sink_state)
+
+    def iter_pending(self, run, files):
+        """
+        Generator of files not completed (or changed, or completed with a
+        different parse definition, since completed or quarantined)
+        JDL 10/18/26
+        """
+        for filename in files:
+            fingerprint = file_fingerprint(run.path_folder + filename, run.defn)
+            entry = self.dict_completed.get(filename, self.dict_quarantine.get(filename))
+            if entry is not None and entry['fingerprint'] == fingerprint: continue
+            yield filename
+
+    def add(self, run, filename, blocks):
+        """
+        Record a parsed file's blocks (written to run's sink if it has one)
+        and flush if flush_files or flush_secs is reached
+        JDL 10/18/26
+        """
+        if run.sink is not None:
+            run.append_file_blocks(*blocks)
+            blocks = None
+        fingerprint = file_fingerprint(run.path_folder + filename, run.defn)
+        self.dict_pending[filename] = (fingerprint, blocks)
+
+        is_due = time.monotonic() - self.time_flush >= self.flush_secs
+        if len(self.dict_pending) >= self.flush_files or is_due: self.flush(run)
+
+    def flush(self, run):
+        """
+        Durably write pending files' blocks to a new part (or flush the
+        run's sink), then journal the files as completed
+        JDL 10/18/26
+        """
+        self.time_flush = time.monotonic()
+        if not self.dict_pending: return
+
+        part, sink_state = None, None
+        if run.sink is not None:
+            run.sink.flush()
+            sink_state = run.sink.state()
+        else:
+            part = 'part_%05d.pkl' % self.next_part_number()
+            dict_blocks = {f:blocks for f, (_, blocks) in self.dict_pending.items()}
+            write_durable(self.filepath(part),
+                          lambda f: pickle.dump(dict_blocks, f, protocol=pickle.HIGHEST_PROTOCOL))
+
+        dict_files = {f:fingerprint for f, (fingerprint, _) in self.dict_pending.items()}
+        self.append_journal({'part':part, 'files':dict_files, 'sink':sink_state})
+        for filename in dict_files:
+            self.dict_quarantine.pop(filename, None)
+        self.dict_pending = {}
+
+    def append_journal(self, entry):
+        """
+        Append a flush's journal line (one line, so a flush's files and
+        sink state are journaled together) and record its completed files
+        JDL 10/18/26
+        """
+        append_jsonl(self.filepath(FILE_JOURNAL), [entry])
+        add_journal_entry(self.dict_completed, entry)
+        if entry['sink'] is not None: self.sink_state = entry['sink']
+
+    def quarantine(self, run, parse_error):
+        """
+        Record a file that failed to parse so that it is skipped until it
+        changes
+        JDL 10/18/26
+        """
+        entry = {'file':parse_error.filename, 'error':parse_error.error,
+                 'fingerprint':file_fingerprint(run.path_folder + parse_error.filename,
+                                                run.defn)}
+        append_jsonl(self.filepath(FILE_QUARANTINE), [entry])
+        self.dict_quarantine[parse_error.filename] = entry
+
+    def quarantined(self):
+        """
+        Return dictionary of errors of quarantined files by filename
+        JDL 10/18/26
+        """
+        return {f:entry['error'] for f, entry in self.dict_quarantine.items()}
+
+    def iter_completed_blocks(self, files):
+        """
+        Generator of (filename, (lst_params_blocks, lst_raw_blocks)) of the
+        completed files among files, in the order of files (so journaled
+        files that were since deleted or filtered out are left out and a
+        re-parsed file keeps its place). Each part is loaded once
+        JDL 10/18/26
+
+        Args:
+        files [List] current analysis filenames in discovery order
+        """
+        dict_parts = {}
+        for filename in files:
+            entry = self.dict_completed.get(filename)
+            if entry is None or entry['part'] is None: continue
+            if entry['part'] not in dict_parts:
+                with open(self.filepath(entry['part']), 'rb') as f:
+                    dict_parts[entry['part']] = pickle.load(f)
+            yield filename, dict_parts[entry['part']].pop(filename)
+
+    def next_part_number(self):
+        lst_parts = [f for f in os.listdir(self.path_checkpoint) if f.startswith('part_')]
+        return max([int(f[5:10]) for f in lst_parts], default=-1) + 1
+
+    def clear(self):
+        """
+        Delete the checkpoint's journal, quarantine list and parts
+        JDL 10/18/26
+        """
+        for filename in os.listdir(self.path_checkpoint):
+            if filename.startswith('part_') or filename in [FILE_JOURNAL, FILE_QUARANTINE]:
+                os.remove(self.filepath(filename))
+        self.dict_completed, self.dict_quarantine, self.dict_pending = {}, {}, {}
+        self.sink_state = None
+
+def append_jsonl(filepath, lst_entries):
+    """
+    Append entries as JSON lines and fsync (starting a new line if an
+    interrupted write left the last line incomplete)
+    JDL 10/18/26
+    """
+    is_partial = False
+    if os.path.exists(filepath) and os.path.getsize(filepath) > 0:
+        with open(filepath, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            is_partial = f.read(1) != b'\n'
+    with open(filepath, 'a') as f:
+        if is_partial: f.write('\n')
+        for entry in lst_entries:
+            f.write(json.dumps(entry) + '\n')
+        f.flush()
+        os.fsync(f.fileno())
+
+def read_journal(filepath):
+    """
+    Return (dictionary of completed files' {'part', 'fingerprint'} by file
+    in completion order, sink state of the last flush with a sink or None)
+    JDL 10/18/26
+    """
+    dict_completed, sink_state = {}, None
+    for entry in iter_jsonl(filepath):
+        add_journal_entry(dict_completed, entry)
+        if entry['sink'] is not None: sink_state = entry['sink']
+    return dict_completed, sink_state
+
+def add_journal_entry(dict_completed, entry):
+    """
+    Add (or move to the end) a journal line's completed files
+    JDL 10/18/26
+    """
+    for filename, fingerprint in entry['files'].items():
+        dict_completed.pop(filename, None)
+        dict_completed[filename] = {'part':entry['part'], 'fingerprint':fingerprint}
+
+def read_jsonl(filepath):
+    """
+    Return dictionary of JSON line entries by 'file' (latest entry last)
+    JDL 10/18/26
+    """
+    dict_entries = {}
+    for entry in iter_jsonl(filepath):
+        dict_entries.pop(entry['file'], None)
+        dict_entries[entry['file']] = entry
+    return dict_entries
+
+def iter_jsonl(filepath):
+    """
+    Generator of a JSON lines file's entries (an incomplete last line from
+    an interrupted write is ignored)
+    JDL 10/18/26
+    """
+    if not os.path.exists(filepath): return
+    with open(filepath) as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            yield entry
@@ -0,0 +1,221 @@
+#Version 10/18/26
+import os
+import shutil
+import sqlite3
+import pandas as pd
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+"""
+=========================================================================
+Output writers for parsed df_params and df_raw DataFrames
+
+Each writer takes a DataFrame and a base path without extension (e.g.
+<path_folder>/df_raw) and writes one output. Writers are looked up by
+format name in OUTPUT_WRITERS; add an entry to support another format
+=========================================================================
+"""
+#Output file base names for df_params, df_raw and downsampled df_raw
+OUTPUT_BASENAMES = ['df_params', 'df_raw', 'df_raw_reduced']
+
+#Column dtypes for ID and index columns of parsed outputs
+ID_DTYPES = {'RunID':'string', 'AnalysisID':'string', 'SampleID':'int64', 'idx':'int64'}
+
+def write_excel(df, path_base):
+    """
+    Write DataFrame to <path_base>.xlsx
+    JDL 10/6/23; moved from TensileParsingRun.write_parsed_data JDL 10/18/26
+    """
+    with pd.ExcelWriter(path_base + '.xlsx') as writer:
+        df.to_excel(writer, index=False)
+
+def write_csv(df, path_base):
+    """
+    Write DataFrame to <path_base>.csv
+    JDL 10/18/26
+    """
+    df.to_csv(path_base + '.csv', index=False)
+
+def write_parquet(df, path_base):
+    """
+    Write DataFrame as a Parquet dataset directory <path_base>.parquet
+    partitioned by RunID (requires pyarrow). An existing dataset is
+    replaced rather than appended to
+    JDL 10/18/26
+    """
+    path_dataset = path_base + '.parquet'
+    if os.path.isdir(path_dataset): shutil.rmtree(path_dataset)
+    df.to_parquet(path_dataset, index=False, partition_cols=['RunID'])
+
+def write_feather(df, path_base):
+    """
+    Write DataFrame to <path_base>.feather (requires pyarrow)
+    JDL 10/18/26
+    """
+    df.reset_index(drop=True).to_feather(path_base + '.feather')
+
+#SQLite output database (in the output folder) and its table keys
+SQLITE_FILENAME = 'parsed_data.sqlite'
+SQLITE_FILE_COLS = ['RunID', 'AnalysisID']
+SQLITE_KEY_COLS = {'df_params':['RunID', 'AnalysisID', 'SampleID'],
+                   'df_raw':['RunID', 'AnalysisID', 'SampleID', 'idx'],
+                   'df_raw_reduced':['RunID', 'AnalysisID', 'SampleID', 'idx']}
+
+def write_sqlite(df, path_base, batch_rows=100000):
+    """
+    Write DataFrame to table <basename> of <folder>/parsed_data.sqlite
+    (see SQLiteWriter). Rows of files (RunID, AnalysisID) already in the
+    table are replaced, so re-parsing a file replaces its rows. All rows
+    are written in one transaction
+    JDL 10/18/26
+
+    Args:
+    df [DataFrame] df_params or df_raw
+    path_base [String] <path_folder>/<basename> (basename is the table)
+    batch_rows [Integer] rows per executemany batch
+    """
+    path_db = os.path.join(os.path.dirname(path_base), SQLITE_FILENAME)
+    with SQLiteWriter(path_db, batch_rows) as writer:
+        writer.write(os.path.basename(path_base), df)
+
+class SQLiteWriter:
+    def __init__(self, path_db, batch_rows=100000):
+        """
+        Initializes a writer of parsed DataFrames (or blocks of them) to
+        tables of a SQLite database (WAL journal). Tables are created on
+        first use with a unique index on their key columns (SQLITE_KEY_COLS)
+        and gain columns that later blocks add. The first time the writer
+        sees a file (RunID, AnalysisID), the table's existing rows of that
+        file are deleted; rows are then inserted (or replaced by key) as
+        batches of prepared inserts. Rows are durable once commit() is
+        called (also on close)
+        JDL 10/18/26
+
+        Args:
+        path_db [String] path of the SQLite database file
+        batch_rows [Integer] rows per executemany batch
+        """
+        self.batch_rows = batch_rows
+        self.conn = sqlite3.connect(path_db)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.dict_files = {}
+        self.dict_cols = {}
+
+    def write(self, table, df):
+        """
+        Write DataFrame rows to table (uncommitted)
+        JDL 10/18/26
+        """
+        set_cols = self.dict_cols.setdefault(table, set())
+        if not set_cols.issuperset(df.columns):
+            create_sqlite_table(self.conn, table, df)
+            set_cols.update(df.columns)
+
+        set_files = self.dict_files.setdefault(table, set())
+        if all(col in df.columns for col in SQLITE_FILE_COLS):
+            df_files = df[SQLITE_FILE_COLS].drop_duplicates()
+            fil = [tup not in set_files for tup in sqlite_rows(df_files)]
+            df_files = df_files[fil]
+            delete_sqlite_files(self.conn, table, df_files)
+            set_files.update(sqlite_rows(df_files))
+        insert_sqlite_rows(self.conn, table, df, self.batch_rows)
+
+    def commit(self):
+        self.conn.commit()
+
+    def rollback(self):
+        self.conn.rollback()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None: self.rollback()
+        self.close()
+
+def create_sqlite_table(conn, table, df):
+    """
+    Create table with df's columns and key index if it does not exist, or
+    add any of df's columns that it is missing
+    JDL 10/18/26
+    """
+    cols_existing = [row[1] for row in conn.execute('PRAGMA table_info(' + quote(table) + ')')]
+    if not cols_existing:
+        cols = ', '.join(quote(col) + ' ' + sqlite_type(df[col]) for col in df.columns)
+        conn.execute('CREATE TABLE ' + quote(table) + ' (' + cols + ')')
+    for col in df.columns:
+        if cols_existing and col not in cols_existing:
+            conn.execute('ALTER TABLE ' + quote(table) + ' ADD COLUMN ' + quote(col) + ' ' + \
+                         sqlite_type(df[col]))
+
+    key_cols = [col for col in SQLITE_KEY_COLS.get(table, []) if col in df.columns]
+    if key_cols:
+        conn.execute('CREATE UNIQUE INDEX IF NOT EXISTS ' + quote('ix_' + table + '_keys') + \
+                     ' ON ' + quote(table) + ' (' + ', '.join(quote(col) for col in key_cols) + ')')
+
+def delete_sqlite_files(conn, table, df):
+    """
+    Delete table rows of the files (RunID, AnalysisID) that are in df
+    JDL 10/18/26
+    """
+    if not all(col in df.columns for col in SQLITE_FILE_COLS): return
+    df_files = df[SQLITE_FILE_COLS].drop_duplicates()
+    where = ' AND '.join(quote(col) + ' = ?' for col in SQLITE_FILE_COLS)
+    conn.executemany('DELETE FROM ' + quote(table) + ' WHERE ' + where, \
+                     sqlite_rows(df_files))
+
+def insert_sqlite_rows(conn, table, df, batch_rows):
+    """
+    Insert (or replace by key) df's rows in batches with one prepared
+    statement
+    JDL 10/18/26
+    """
+    cols = ', '.join(quote(col) for col in df.columns)
+    sql = 'INSERT OR REPLACE INTO ' + quote(table) + ' (' + cols + ') VALUES (' + \
+          ', '.join(['?'] * len(df.columns)) + ')'
+    for i in range(0, len(df), batch_rows):
+        conn.executemany(sql, sqlite_rows(df.iloc[i:i + batch_rows]))
+
+def sqlite_rows(df):
+    """
+    Return iterator of row tuples of Python values (missing values None)
+    for binding to SQLite statements
+    JDL 10/18/26
+    """
+    lst_cols = []
+    for col in df.columns:
+        ser = df[col]
+        if ser.dtype.kind not in 'iufb':
+            ser = ser.astype(object).where(ser.notna(), None)
+        lst_cols.append(ser.tolist())
+    return zip(*lst_cols)
+
+def sqlite_type(ser):
+    """
+    Return SQLite column type for a Series
+    JDL 10/18/26
+    """
+    if ser.dtype.kind in 'iub': return 'INTEGER'
+    if ser.dtype.kind == 'f': return 'REAL'
+    return 'TEXT'
+
+def quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+OUTPUT_WRITERS = {'xlsx':write_excel,
+                  'csv':write_csv,
+                  'parquet':write_parquet,
+                  'feather':write_feather,
+                  'sqlite':write_sqlite}
+
+def typed_columns(df):
+    """
+    Return DataFrame with explicit dtypes for ID and index columns (string
+    RunID/AnalysisID and int64 SampleID/idx) for typed output formats
+    JDL 10/18/26
+    """
+    dtypes = {col:dtype for col, dtype in ID_DTYPES.items() if col in df.columns}
+    return df.astype(dtypes)
@@ -0,0 +1,115 @@
+#Version 10/18/26
+from typing import NamedTuple
+import regex as re
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+"""
+=========================================================================
+Compiled parse definition
+
+compile_parse_defn validates a parse_defn dictionary once and returns an
+immutable ParsePlan with 0-based column indices, row offsets and
+precompiled ID cleanup patterns. TensileParsingRun compiles its defn on
+creation (so a malformed defn fails before any file is parsed) and shares
+the plan with every ParseAnalysisFile and worker process
+=========================================================================
+"""
+#parse_defn keys by tuple layout
+KEYS_ID = ['run_id', 'analysis_id'] #(flag, col, row offset, col offset)
+KEYS_MARKER = ['params_start', 'params_end', 'raw_start', 'raw_end'] #(flag, col, row offset)
+
+class IdCell(NamedTuple):
+    flag: str
+    idx_col_flag: int
+    idx_col_val: int
+
+class Marker(NamedTuple):
+    flag: str
+    idx_col_flag: int
+    row_offset: int
+
+class ParsePlan(NamedTuple):
+    run_id: IdCell
+    analysis_id: IdCell
+    params_start: Marker
+    params_end: Marker
+    raw_start: Marker
+    raw_end: Marker
+    idx_col_names: int
+    idx_col_vals: int
+    idx_col_raw: int
+    names_row_offset: int
+    leading_space_pattern: object
+    trailing_space_pattern: object
+    quote_pattern: object
+
+def compile_parse_defn(defn):
+    """
+    Validate a parse definition dictionary and return a ParsePlan
+    (raises ValueError describing the first malformed entry)
+    JDL 10/18/26
+    """
+    if not isinstance(defn, dict): raise ValueError('parse_defn must be a dictionary')
+
+    dict_fields = {}
+    for key in KEYS_ID:
+        flag, col, _, col_offset = _defn_tuple(defn, key, 4)
+        _check_flag(key, flag)
+        _check_col(key, col)
+        _check_int(key, col_offset)
+        _require(key, col - 1 + col_offset >= 0, 'value column must be >= 1')
+        dict_fields[key] = IdCell(flag, col - 1, col - 1 + col_offset)
+
+    for key in KEYS_MARKER:
+        flag, col, row_offset = _defn_tuple(defn, key, 3)
+        _check_flag(key, flag)
+        _check_col(key, col)
+        _check_int(key, row_offset)
+        dict_fields[key] = Marker(flag, col - 1, row_offset)
+
+    col_names = _defn_value(defn, 'params_col_names')
+    col_offset = _defn_value(defn, 'params_col_offset')
+    _check_col('params_col_names', col_names)
+    _check_int('params_col_offset', col_offset)
+    _require('params_col_offset', col_names - 1 + col_offset >= 0, 'value column must be >= 1')
+
+    col_raw, names_row_offset = _defn_tuple(defn, 'raw_var_names', 2)
+    _check_col('raw_var_names', col_raw)
+    _check_int('raw_var_names', names_row_offset)
+
+    return ParsePlan(**dict_fields,
+                     idx_col_names=col_names - 1, idx_col_vals=col_names - 1 + col_offset,
+                     idx_col_raw=col_raw - 1, names_row_offset=names_row_offset,
+                     leading_space_pattern=re.compile(r'^\s+'),
+                     trailing_space_pattern=re.compile(r'\s+$'),
+                     quote_pattern=re.compile(r'^"|"$'))
+
+def as_parse_plan(defn_or_plan):
+    """
+    Return a ParsePlan from a parse_defn dictionary or existing ParsePlan
+    JDL 10/18/26
+    """
+    if isinstance(defn_or_plan, ParsePlan): return defn_or_plan
+    return compile_parse_defn(defn_or_plan)
+
+def _defn_value(defn, key):
+    if key not in defn: raise ValueError("parse_defn is missing key '" + key + "'")
+    return defn[key]
+
+def _defn_tuple(defn, key, length):
+    val = _defn_value(defn, key)
+    if not isinstance(val, (tuple, list)) or len(val) != length:
+        raise ValueError("parse_defn['" + key + "'] must be a tuple of length " + str(length))
+    return val
+
+def _check_flag(key, flag):
+    _require(key, isinstance(flag, str) and flag != '', 'flag must be a non-empty string')
+
+def _check_col(key, col):
+    _check_int(key, col)
+    _require(key, col >= 1, 'column must be >= 1')
+
+def _check_int(key, val):
+    _require(key, isinstance(val, int) and not isinstance(val, bool), 'values must be integers')
+
+def _require(key, is_valid, msg):
+    if not is_valid: raise ValueError("parse_defn['" + key + "'] " + msg)
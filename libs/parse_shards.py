@@ -0,0 +1,179 @@
+#Version 10/18/26
+import os
+import json
+import shutil
+import argparse
+import pandas as pd
+from curve_parse import TensileParsingRun, concat_with_blocks
+from archive_files import container_path
+from parse_cache import write_durable
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+"""
+=========================================================================
+Manifest-based sharding for multi-node parsing
+
+A manifest (JSON) fixes a folder's analysis files in single-run discovery
+order, the parse definition and each file's shard. Shards are contiguous
+runs of files balanced by bytes, so concatenating shard outputs in shard
+order reproduces a single-node run's df_params and df_raw. Each shard is
+parsed independently (any node with the folder mounted, at the
+manifest's path_folder or at the node's own --path-folder) and writes its
+outputs to <path_output>/shard_NNNN; merge_shards then combines them:
+
+    create_manifest(defn, path_folder, path_manifest, n_shards=4)
+    python parse_shards.py <path_manifest> <shard_index> <path_output> \
+        [--path-folder PATH]
+    df_params, df_raw = merge_shards(path_manifest, path_output)
+=========================================================================
+"""
+OUTPUT_FILES = {'df_params':'df_params.pkl', 'df_raw':'df_raw.pkl'}
+
+def create_manifest(parse_defn, path_folder, path_manifest, n_shards, file_filter=None):
+    """
+    Write manifest of a folder's analysis files assigned to n_shards shards
+    and return it as a dictionary
+    JDL 10/18/26
+
+    Args:
+    parse_defn [Dictionary] parse definition (see TensileParsingRun)
+    path_folder [String] folder of analysis files (with trailing separator)
+    path_manifest [String] path of manifest JSON file to write
+    n_shards [Integer] number of shards
+    file_filter [FileFilter] optional discovery filter (see file_discovery.py)
+    """
+    run = TensileParsingRun(parse_defn, path_folder, file_filter=file_filter)
+    lst_files = run.list_analysis_files()
+    lst_sizes = [os.path.getsize(container_path(path_folder + f)) for f in lst_files]
+
+    manifest = {'path_folder':path_folder, 'parse_defn':parse_defn, 'n_shards':n_shards,
+                'files':[{'file':f, 'size':size, 'shard':shard} for f, size, shard
+                         in zip(lst_files, lst_sizes, assign_shards(lst_sizes, n_shards))]}
+    write_durable(path_manifest, json.dumps(manifest, indent=1).encode())
+    return manifest
+
+def assign_shards(lst_sizes, n_shards):
+    """
+    Return shard index of each file so that shards are contiguous runs of
+    files with about equal total bytes (shard of the file's midpoint)
+    JDL 10/18/26
+    """
+    total, start, lst_shards = sum(lst_sizes), 0, []
+    for i, size in enumerate(lst_sizes):
+        if total > 0:
+            shard = int((start + size / 2) * n_shards // total)
+        else:
+            shard = i * n_shards // len(lst_sizes)
+        lst_shards.append(min(shard, n_shards - 1))
+        start += size
+    return lst_shards
+
+def load_manifest(path_manifest):
+    """
+    Return manifest dictionary with the parse definition's lists restored
+    to tuples
+    JDL 10/18/26
+    """
+    with open(path_manifest) as f:
+        manifest = json.load(f)
+    manifest['parse_defn'] = {key:tuple(val) if isinstance(val, list) else val
+                              for key, val in manifest['parse_defn'].items()}
+    return manifest
+
+class ManifestShard:
+    def __init__(self, manifest, shard_index):
+        """
+        Initializes a file filter (duck-typed FileFilter, see
+        TensileParsingRun file_filter) yielding one shard's files
+        JDL 10/18/26
+
+        Args:
+        manifest [Dictionary] manifest from load_manifest
+        shard_index [Integer] shard to yield files of
+        """
+        self.lst_files = [entry['file'] for entry in manifest['files']
+                          if entry['shard'] == shard_index]
+
+    def iter_files(self, path_folder):
+        yield from self.lst_files
+
+def shard_path(path_output, shard_index):
+    return os.path.join(path_output, 'shard_%04d' % shard_index)
+
+def run_shard(path_manifest, shard_index, path_output, path_folder=None, **run_kwargs):
+    """
+    Parse one shard's files and write its df_params and df_raw to
+    <path_output>/shard_NNNN (replaced as a whole so that a partial shard
+    output is never merged). Return the TensileParsingRun
+    JDL 10/18/26
+
+    Args:
+    path_manifest [String] manifest JSON file
+    shard_index [Integer] shard to parse
+    path_output [String] folder for shard outputs
+    path_folder [String] optional folder of the analysis files on this
+                         node (default the manifest's path_folder)
+    run_kwargs [Keywords] optional TensileParsingRun arguments (e.g.
+                          workers, streaming, cache)
+    """
+    manifest = load_manifest(path_manifest)
+    if path_folder is None: path_folder = manifest['path_folder']
+    run = TensileParsingRun(manifest['parse_defn'], path_folder,
+                            file_filter=ManifestShard(manifest, shard_index), **run_kwargs)
+    run.read_files_procedure()
+
+    path_shard = shard_path(path_output, shard_index)
+    path_tmp = path_shard + '.tmp'
+    if os.path.isdir(path_tmp): shutil.rmtree(path_tmp)
+    os.makedirs(path_tmp)
+    for name, filename in OUTPUT_FILES.items():
+        write_durable(os.path.join(path_tmp, filename), getattr(run, name).to_pickle)
+    lst_files = ManifestShard(manifest, shard_index).lst_files
+    write_durable(os.path.join(path_tmp, 'files.json'), json.dumps(lst_files).encode())
+
+    if os.path.isdir(path_shard): shutil.rmtree(path_shard)
+    os.rename(path_tmp, path_shard)
+    return run
+
+def merge_shards(path_manifest, path_output):
+    """
+    Return (df_params, df_raw) concatenated from all shard outputs in
+    shard order (categorical columns of compact_dtypes shards keep the
+    union of the shards' categories). Raises ValueError if a shard output
+    is missing or was written for a different file list
+    JDL 10/18/26
+    """
+    manifest = load_manifest(path_manifest)
+    dict_blocks = {name:[] for name in OUTPUT_FILES}
+    for shard_index in range(manifest['n_shards']):
+        path_shard = shard_path(path_output, shard_index)
+        if not os.path.isdir(path_shard):
+            raise ValueError('Missing output of shard ' + str(shard_index))
+        with open(os.path.join(path_shard, 'files.json')) as f:
+            if json.load(f) != ManifestShard(manifest, shard_index).lst_files:
+                raise ValueError('Output of shard ' + str(shard_index) + ' does not match manifest')
+
+        for name, filename in OUTPUT_FILES.items():
+            df = pd.read_pickle(os.path.join(path_shard, filename))
+            if len(df) > 0: dict_blocks[name].append(df)
+
+    return tuple(concat_with_blocks(pd.DataFrame(), dict_blocks[name]) if dict_blocks[name]
+                 else pd.DataFrame() for name in OUTPUT_FILES)
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Parse one shard of a manifest')
+    parser.add_argument('manifest', help='path of manifest JSON file')
+    parser.add_argument('shard', type=int, help='shard index')
+    parser.add_argument('output', help='folder for shard outputs')
+    parser.add_argument('--path-folder', help='folder of the analysis files on this node '
+                        '(default the path_folder in the manifest)')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--streaming', action='store_true')
+    parser.add_argument('--compact-dtypes', action='store_true')
+    args = parser.parse_args(args)
+    path_folder = args.path_folder
+    if path_folder is not None and not path_folder.endswith(os.sep): path_folder += os.sep
+    run_shard(args.manifest, args.shard, args.output, path_folder=path_folder,
+              workers=args.workers, streaming=args.streaming, compact_dtypes=args.compact_dtypes)
+
+if __name__ == '__main__':
+    main()
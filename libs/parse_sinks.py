@@ -0,0 +1,342 @@
+#Version 10/18/26
+import os
+import shutil
+import pandas as pd
+from parse_output import typed_columns, SQLiteWriter
+from parse_cache import write_durable
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+"""
+=========================================================================
+Sinks for streaming parsed sample blocks
+
+A sink receives each sample's params row (write_params) and raw data block
+(write_raw) as TensileParsingRun(sink=...) parses files, so parsed data
+are not held in memory. flush() makes blocks written so far durable (e.g.
+after each file in FolderWatcher). Sinks are context managers; close()
+finalizes their outputs:
+
+    with CSVSink(path_folder) as sink:
+        TensileParsingRun(defn, path_folder, sink=sink).read_files_procedure()
+
+Resumable sinks (is_resumable) can be used with a ParseCheckpoint: state()
+describes the flushed output and is journaled after each flush, and a
+resumed run calls restore(state) to discard blocks written after the last
+journaled flush before appending to the output again:
+
+    with CSVSink(path_folder, overwrite=False) as sink:
+        TensileParsingRun(defn, path_folder, sink=sink,
+                          checkpoint=ParseCheckpoint(path_checkpoint)).read_files_procedure()
+=========================================================================
+"""
+class BaseSink:
+    is_resumable = False
+
+    def write_params(self, df):
+        raise NotImplementedError
+
+    def write_raw(self, df):
+        raise NotImplementedError
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+    def state(self):
+        """
+        Return JSON-serializable description of the flushed output (for
+        checkpoint resume)
+        JDL 10/18/26
+        """
+        return {}
+
+    def restore(self, state):
+        """
+        Discard output written after state; raise ValueError if the output
+        no longer contains state (e.g. it was overwritten)
+        JDL 10/18/26
+        """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+"""
+=========================================================================
+CSVSink Class
+=========================================================================
+"""
+class CSVSink(BaseSink):
+    is_resumable = True
+
+    def __init__(self, path_folder, overwrite=True):
+        """
+        Initializes a sink that appends blocks to df_params.csv and
+        df_raw.csv in path_folder (resumable; use overwrite=False when
+        resuming from a checkpoint)
+        JDL 10/18/26
+
+        Args:
+        path_folder [String] directory for the output files
+        overwrite [Boolean] if True, delete existing output files first;
+                            otherwise append to them
+        """
+        self.params_filepath = os.path.join(path_folder, 'df_params.csv')
+        self.raw_filepath = os.path.join(path_folder, 'df_raw.csv')
+        self.dict_cols = {}
+        if overwrite:
+            for filepath in [self.params_filepath, self.raw_filepath]:
+                if os.path.exists(filepath): os.remove(filepath)
+
+    def write_params(self, df):
+        self.append_block(self.params_filepath, df)
+
+    def write_raw(self, df):
+        self.append_block(self.raw_filepath, df)
+
+    def append_block(self, filepath, df):
+        """
+        Append a block to a csv file, keeping the file's header columns
+        JDL 10/18/26
+        """
+        self.dict_cols[filepath] = append_csv(df, filepath, self.dict_cols.get(filepath))
+
+    def flush(self):
+        """
+        fsync the output files so appended blocks are durable
+        JDL 10/18/26
+        """
+        for filepath in [self.params_filepath, self.raw_filepath]:
+            if not os.path.exists(filepath): continue
+            with open(filepath, 'rb+') as f:
+                os.fsync(f.fileno())
+
+    def state(self):
+        """
+        Return byte sizes of the output files by name
+        JDL 10/18/26
+        """
+        return {os.path.basename(filepath):file_size(filepath)
+                for filepath in [self.params_filepath, self.raw_filepath]}
+
+    def restore(self, state):
+        """
+        Truncate output files to their sizes in state
+        JDL 10/18/26
+        """
+        for filepath in [self.params_filepath, self.raw_filepath]:
+            size = state.get(os.path.basename(filepath), 0)
+            if file_size(filepath) < size:
+                msg = filepath + ' is smaller than when checkpointed (was it overwritten? ' + \
+                      'use CSVSink(overwrite=False) to resume)'
+                raise ValueError(msg)
+            if os.path.exists(filepath): os.truncate(filepath, size)
+        self.dict_cols = {}
+
+def file_size(filepath):
+    return os.path.getsize(filepath) if os.path.exists(filepath) else 0
+
+def append_csv(df, filepath, cols=None):
+    """
+    Append DataFrame rows to a csv file (with header if file is new/empty).
+    Rows are written in the file's header column order (see
+    conform_columns). Returns list of the file's columns
+    JDL 10/18/26
+
+    Args:
+    df [DataFrame] rows to append
+    filepath [String] path of the csv file
+    cols [List] optional known header columns (default read from file)
+    """
+    is_new = not os.path.exists(filepath) or os.path.getsize(filepath) == 0
+    if is_new:
+        cols = list(df.columns)
+    elif cols is None:
+        cols = pd.read_csv(filepath, nrows=0).columns.tolist()
+    conform_columns(df, cols, filepath).to_csv(filepath, mode='a', header=is_new, index=False)
+    return cols
+
+def conform_columns(df, cols, target):
+    """
+    Return block reindexed to an output's fixed column list (columns the
+    block lacks are left blank). Raise ValueError if the block has columns
+    that the output does not, since they cannot be added to it
+    JDL 10/18/26
+
+    Args:
+    df [DataFrame] block to be written
+    cols [List] output's columns in order
+    target [String] output name for the error message
+    """
+    lst_extra = [col for col in df.columns if col not in cols]
+    if lst_extra:
+        msg = 'Block columns ' + str(lst_extra) + ' are not in the columns of ' + \
+              str(target) + ' ' + str(list(cols))
+        raise ValueError(msg)
+    if list(df.columns) == list(cols): return df
+    return df.reindex(columns=cols)
+
+"""
+=========================================================================
+ParquetSink Class
+=========================================================================
+"""
+class ParquetSink(BaseSink):
+    is_resumable = True
+
+    def __init__(self, path_folder, rows_per_group=100000, overwrite=True):
+        """
+        Initializes a sink that writes blocks to df_params.parquet and
+        df_raw.parquet dataset directories in path_folder. Each group of
+        about rows_per_group rows (and any rows buffered at flush) is
+        written as a complete part file, so the datasets are readable
+        (e.g. pd.read_parquet) while parsing continues (requires pyarrow)
+        JDL 10/18/26
+
+        Args:
+        path_folder [String] directory for the output datasets
+        rows_per_group [Integer] rows buffered before writing a part file
+        overwrite [Boolean] if True, delete existing datasets first;
+                            otherwise add part files to them
+        """
+        import pyarrow.parquet
+        self.pq = pyarrow.parquet
+        self.rows_per_group = rows_per_group
+        self.dict_paths = {'params':os.path.join(path_folder, 'df_params.parquet'),
+                           'raw':os.path.join(path_folder, 'df_raw.parquet')}
+        self.dict_schemas = {'params':None, 'raw':None}
+        self.dict_buffers = {'params':[], 'raw':[]}
+        self.dict_parts = {}
+        for key, path_dataset in self.dict_paths.items():
+            if overwrite and os.path.isdir(path_dataset): shutil.rmtree(path_dataset)
+            os.makedirs(path_dataset, exist_ok=True)
+            lst_parts = list_parquet_parts(path_dataset)
+            self.dict_parts[key] = len(lst_parts)
+            if lst_parts:
+                self.dict_schemas[key] = self.pq.read_schema(os.path.join(path_dataset, lst_parts[0]))
+
+    def write_params(self, df):
+        self.buffer_block('params', df)
+
+    def write_raw(self, df):
+        self.buffer_block('raw', df)
+
+    def buffer_block(self, key, df):
+        """
+        Buffer a block and write a part file once rows_per_group is reached
+        JDL 10/18/26
+        """
+        self.dict_buffers[key].append(df)
+        if sum(len(df) for df in self.dict_buffers[key]) >= self.rows_per_group:
+            self.write_part(key)
+
+    def write_part(self, key):
+        """
+        Write buffered blocks as the dataset's next part file (with the
+        schema of the dataset's first part). The file is written under a
+        hidden temporary name and renamed so readers never see a partial
+        part
+        JDL 10/18/26
+        """
+        if not self.dict_buffers[key]: return
+        df = typed_columns(pd.concat(self.dict_buffers[key], ignore_index=True))
+        self.dict_buffers[key] = []
+
+        import pyarrow
+        schema = self.dict_schemas[key]
+        if schema is None:
+            table = pyarrow.Table.from_pandas(df, preserve_index=False)
+            self.dict_schemas[key] = table.schema
+        else:
+            df = conform_columns(df, schema.names, self.dict_paths[key])
+            table = pyarrow.Table.from_pandas(df, schema=schema, preserve_index=False)
+
+        filename = parquet_part_name(self.dict_parts[key])
+        path_tmp = os.path.join(self.dict_paths[key], '.' + filename + '.tmp')
+        write_durable(os.path.join(self.dict_paths[key], filename),
+                      lambda f: self.pq.write_table(table, f), path_tmp)
+        self.dict_parts[key] += 1
+
+    def flush(self):
+        """
+        Write buffered blocks as part files
+        JDL 10/18/26
+        """
+        for key in self.dict_paths:
+            self.write_part(key)
+
+    def close(self):
+        self.flush()
+
+    def state(self):
+        return dict(self.dict_parts)
+
+    def restore(self, state):
+        """
+        Delete part files written after state and discard buffered blocks
+        JDL 10/18/26
+        """
+        for key, path_dataset in self.dict_paths.items():
+            n_parts = state.get(key, 0)
+            if self.dict_parts[key] < n_parts:
+                msg = path_dataset + ' has fewer parts than when checkpointed (was it ' + \
+                      'overwritten? use ParquetSink(overwrite=False) to resume)'
+                raise ValueError(msg)
+            for filename in list_parquet_parts(path_dataset)[n_parts:]:
+                os.remove(os.path.join(path_dataset, filename))
+            self.dict_parts[key] = n_parts
+            self.dict_buffers[key] = []
+            if n_parts == 0: self.dict_schemas[key] = None
+
+def parquet_part_name(i):
+    return 'part-' + str(i).zfill(5) + '.parquet'
+
+def list_parquet_parts(path_dataset):
+    """
+    Return sorted list of a dataset directory's part file names
+    JDL 10/18/26
+    """
+    return sorted(name for name in os.listdir(path_dataset)
+                  if name.startswith('part-') and name.endswith('.parquet'))
+
+"""
+=========================================================================
+SQLiteSink Class
+=========================================================================
+"""
+class SQLiteSink(BaseSink):
+    is_resumable = True
+
+    def __init__(self, path_db, batch_rows=100000):
+        """
+        Initializes a sink that writes blocks to the df_params and df_raw
+        tables of a SQLite database with the same writer (tables, key
+        indexes and replacement of re-parsed files' rows) as
+        write_parsed_data('sqlite'). Blocks are committed at each flush
+        (resumable, since uncommitted blocks are rolled back)
+        JDL 10/18/26
+
+        Args:
+        path_db [String] path of the SQLite database file
+        batch_rows [Integer] rows per executemany batch
+        """
+        self.writer = SQLiteWriter(path_db, batch_rows)
+
+    def write_params(self, df):
+        self.writer.write('df_params', typed_columns(df))
+
+    def write_raw(self, df):
+        self.writer.write('df_raw', typed_columns(df))
+
+    def flush(self):
+        self.writer.commit()
+
+    def restore(self, state):
+        self.writer.rollback()
+
+    def close(self):
+        self.writer.close()
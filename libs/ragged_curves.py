@@ -0,0 +1,135 @@
+#Version 10/18/26
+import numpy as np
+import pandas as pd
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+"""
+=========================================================================
+RaggedCurves Class
+
+Ragged-array layout of all samples' raw curves in a run. The raw variables
+are stored in one shared float64 buffer, values (n_vars x n_points total),
+with each variable's row C-contiguous. Sample i occupies columns
+offsets[i]:offsets[i + 1]. df_ids holds RunID, AnalysisID and SampleID for
+each sample. A df_raw-style DataFrame is only built on request (to_frame)
+=========================================================================
+"""
+ID_COLS_SAMPLE = ['RunID', 'AnalysisID', 'SampleID']
+
+class RaggedCurves:
+    def __init__(self, values, offsets, df_ids, varnames):
+        """
+        Initializes a RaggedCurves object
+        JDL 10/18/26
+
+        Args:
+        values [ndarray] (n_vars, n_points) float64 raw variable values
+        offsets [ndarray] (n_samples + 1) int64 start of each sample in values
+        df_ids [DataFrame] RunID, AnalysisID, SampleID (one row per sample)
+        varnames [List] raw variable names (rows of values)
+        """
+        self.values = values
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.df_ids = df_ids.reset_index(drop=True)
+        self.varnames = list(varnames)
+
+    @classmethod
+    def from_blocks(cls, lst_arrays, df_ids, varnames):
+        """
+        Build from a list of per-sample (n_vars, n_points) arrays
+        JDL 10/18/26
+        """
+        lengths = [arr.shape[1] for arr in lst_arrays]
+        offsets = np.concatenate([[0], np.cumsum(lengths, dtype=np.int64)])
+        if lst_arrays:
+            values = np.ascontiguousarray(np.concatenate(lst_arrays, axis=1), dtype=np.float64)
+        else:
+            values = np.empty((len(varnames), 0), dtype=np.float64)
+        return cls(values, offsets, df_ids, varnames)
+
+    @classmethod
+    def from_frame(cls, df_raw):
+        """
+        Build from a df_raw-style DataFrame (samples are runs of consecutive
+        rows with the same RunID, AnalysisID and SampleID)
+        JDL 10/18/26
+        """
+        varnames = [col for col in df_raw.columns if col not in ID_COLS_SAMPLE + ['idx']]
+        df_keys = df_raw[ID_COLS_SAMPLE].reset_index(drop=True)
+        is_start = (df_keys != df_keys.shift()).any(axis=1).to_numpy()
+        idx_starts = np.flatnonzero(is_start)
+
+        values = df_raw[varnames].to_numpy(dtype=np.float64).T
+        offsets = np.append(idx_starts, len(df_raw))
+        return cls(np.ascontiguousarray(values), offsets, df_keys.iloc[idx_starts], varnames)
+
+    @classmethod
+    def concat(cls, lst_curves):
+        """
+        Concatenate RaggedCurves objects with the same raw variables
+        JDL 10/18/26
+        """
+        lst_curves = [c for c in lst_curves if c.n_samples > 0]
+        if not lst_curves: return cls.from_blocks([], pd.DataFrame(columns=ID_COLS_SAMPLE), [])
+
+        values = np.ascontiguousarray(np.concatenate([c.values for c in lst_curves], axis=1))
+        lst_offsets, start = [np.zeros(1, dtype=np.int64)], 0
+        for c in lst_curves:
+            lst_offsets.append(c.offsets[1:] + start)
+            start += c.offsets[-1]
+        df_ids = pd.concat([c.df_ids for c in lst_curves], ignore_index=True)
+        return cls(values, np.concatenate(lst_offsets), df_ids, lst_curves[0].varnames)
+
+    @property
+    def n_samples(self):
+        return len(self.offsets) - 1
+
+    @property
+    def lengths(self):
+        return np.diff(self.offsets)
+
+    def segment_ids(self):
+        """
+        Return sample (segment) number of each point in values
+        JDL 10/18/26
+        """
+        return np.repeat(np.arange(self.n_samples), self.lengths)
+
+    def var(self, varname):
+        """
+        Return a raw variable's values for all samples (contiguous view)
+        JDL 10/18/26
+        """
+        return self.values[self.varnames.index(varname)]
+
+    def sample_index(self, run_id, sample_id, analysis_id=None):
+        """
+        Return position of a (RunID, SampleID[, AnalysisID]) sample
+        JDL 10/18/26
+        """
+        fil = (self.df_ids['RunID'] == run_id) & (self.df_ids['SampleID'] == sample_id)
+        if analysis_id is not None: fil &= self.df_ids['AnalysisID'] == analysis_id
+        lst_idx = np.flatnonzero(fil.to_numpy())
+        if len(lst_idx) == 0:
+            raise KeyError('No sample ' + str((run_id, sample_id, analysis_id)))
+        return int(lst_idx[0])
+
+    def curve(self, i):
+        """
+        Return sample i's (n_vars, n_points) values (view into values)
+        JDL 10/18/26
+        """
+        return self.values[:, self.offsets[i]:self.offsets[i + 1]]
+
+    def to_frame(self):
+        """
+        Return curves as a df_raw-style DataFrame (RunID, AnalysisID,
+        SampleID, idx and raw variable columns)
+        JDL 10/18/26
+        """
+        idx_sample = self.segment_ids()
+        df = self.df_ids.iloc[idx_sample].reset_index(drop=True)
+        df['SampleID'] = df['SampleID'].astype(np.int64)
+        df['idx'] = np.arange(self.offsets[-1], dtype=np.int64) - self.offsets[idx_sample]
+        for varname, vals in zip(self.varnames, self.values):
+            df[varname] = vals
+        return df
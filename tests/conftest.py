@@ -0,0 +1,61 @@
+#Version 10/18/26
+#Shared fixtures for tests of modules in libs
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import shutil
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' 
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+from curve_parse import TensileParsingRun
+
+#Test analysis files (in tests folder and path_folder copies)
+FILES = ['Run101620-1_Material X_val.csv', 'Run101620-2_Material Y_val.csv']
+
+@pytest.fixture()
+def parse_defn():
+    defn = {}
+    defn['run_id'] = ('_AnalysisName', 1, 0, 1) #Flag, col, row offset, col offset
+    defn['analysis_id'] = ('_AnalysisName', 1, 0, 1)
+
+    defn['params_start'] = ('BeginSample', 1, 1) #Flag, col, row offset
+    defn['params_end'] = ('BeginData', 1, -1)
+
+    defn['params_col_names'] = 1 #Column with param names
+    defn['params_col_offset'] = 1 #params_col_names to param vals offset
+
+    defn['raw_start'] = ('BeginData', 1, 3) #Flag, col, row offset
+    defn['raw_end'] = ('EndData', 1, -1) #Flag, col, row offset
+    defn['raw_var_names'] = (1, -2) #colStart, rowOffset from raw_start row
+    return defn
+
+@pytest.fixture()
+def path_folder(tmp_path):
+    """
+    Temporary folder with copies of the test analysis files (path string
+    with trailing separator, as used by TensileParsingRun)
+    JDL 10/18/26
+    """
+    for filename in os.listdir(current_dir):
+        if filename.endswith('.csv'):
+            shutil.copy(os.path.join(current_dir, filename), tmp_path)
+    return str(tmp_path) + os.sep
+
+@pytest.fixture()
+def parse_run(parse_defn):
+    """
+    Run (not yet parsed) over the test analysis files in the tests folder
+    JDL 10/18/26
+    """
+    return TensileParsingRun(parse_defn, current_dir + os.sep)
+
+@pytest.fixture()
+def parsed_run(parse_defn, path_folder):
+    """
+    Run over path_folder with all files parsed (reference outputs)
+    JDL 10/18/26
+    """
+    run = TensileParsingRun(parse_defn, path_folder)
+    run.read_files_procedure()
+    return run
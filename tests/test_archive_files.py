@@ -0,0 +1,139 @@
+#Version 10/18/26
+#python -m pytest test_archive_files.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import gzip
+import shutil
+import tarfile
+import zipfile
+from urllib.parse import quote
+import pandas as pd
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' 
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+from conftest import FILES
+from curve_parse import TensileParsingRun
+from parse_cache import ParseCache
+from file_discovery import FileFilter
+from archive_files import open_analysis_file, list_archive_members
+from block_index import IndexedAnalysisFile
+
+def write_archive(path_folder, archive_name):
+    """
+    Write the test analysis files to an archive (or .csv.gz files if
+    archive_name is 'gz') in path_folder
+    JDL 10/18/26
+    """
+    lst_paths = [current_dir + os.sep + f for f in FILES]
+    if archive_name == 'gz':
+        for filepath, filename in zip(lst_paths, FILES):
+            with open(filepath, 'rb') as f_in, gzip.open(path_folder + filename + '.gz', 'wb') as f_out:
+                shutil.copyfileobj(f_in, f_out)
+    elif archive_name.endswith('.zip'):
+        with zipfile.ZipFile(path_folder + archive_name, 'w', zipfile.ZIP_DEFLATED) as z:
+            for filepath, filename in zip(lst_paths, FILES):
+                z.write(filepath, 'batch/' + filename)
+            z.writestr('batch/readme.txt', 'not an analysis file')
+    else:
+        mode = 'w:gz' if archive_name.endswith('.gz') else 'w'
+        with tarfile.open(path_folder + archive_name, mode) as t:
+            for filepath, filename in zip(lst_paths, FILES):
+                t.add(filepath, 'batch/' + filename)
+
+"""
+=========================================================================
+Reading analysis files from archives
+=========================================================================
+"""
+def test_open_analysis_file(tmp_path):
+    """
+    Archive members and .gz files read the same bytes as the loose file
+    JDL 10/18/26
+    """
+    path_folder = str(tmp_path) + os.sep
+    write_archive(path_folder, 'batch.zip')
+    write_archive(path_folder, 'gz')
+    with open(current_dir + os.sep + FILES[0], 'rb') as f:
+        data = f.read()
+
+    assert list_archive_members(path_folder + 'batch.zip') == ['batch/' + f for f in FILES]
+    with open_analysis_file(path_folder + 'batch.zip::batch/' + FILES[0]) as f:
+        assert f.read() == data
+    with open_analysis_file(path_folder + FILES[0] + '.gz') as f:
+        assert f.read() == data
+
+@pytest.mark.parametrize('archive_name', ['batch.zip', 'batch.tar', 'batch.tar.gz', 'gz'])
+@pytest.mark.parametrize('streaming', [False, True])
+def test_read_files_procedure_archives(parse_defn, tmp_path, parse_run, archive_name, streaming):
+    """
+    Parsing files in archives gives the same output as loose files
+    JDL 10/18/26
+    """
+    parse_run.read_files_procedure()
+    path_folder = str(tmp_path) + os.sep
+    write_archive(path_folder, archive_name)
+    run = TensileParsingRun(parse_defn, path_folder, streaming=streaming,
+                            file_filter=FileFilter(recursive=False, archives=True))
+    assert len(run.list_analysis_files()) == 2
+    run.read_files_procedure()
+
+    pd.testing.assert_frame_equal(run.df_params, parse_run.df_params)
+    pd.testing.assert_frame_equal(run.df_raw, parse_run.df_raw)
+
+def test_archive_members_filter_and_cache(parse_defn, tmp_path, parse_run):
+    """
+    Filters apply to archive member names; members are cached by member
+    and invalidated when the archive changes
+    JDL 10/18/26
+    """
+    parse_run.read_files_procedure()
+    path_folder = str(tmp_path) + os.sep
+    write_archive(path_folder, 'batch.zip')
+    file_filter = FileFilter(run_ids=['Run101620-2'], archives=True)
+    assert file_filter.iter_files(path_folder).__next__() == 'batch.zip::batch/' + FILES[1]
+
+    cache = ParseCache(str(tmp_path / 'cache'))
+    file_filter = FileFilter(archives=True)
+    run = TensileParsingRun(parse_defn, path_folder, cache=cache, file_filter=file_filter)
+    run.read_files_procedure()
+    assert all(run.is_cached(f) for f in run.list_analysis_files())
+
+    run_cached = TensileParsingRun(parse_defn, path_folder, cache=cache, file_filter=file_filter)
+    run_cached.read_files_procedure()
+    pd.testing.assert_frame_equal(run_cached.df_raw, parse_run.df_raw)
+
+    write_archive(path_folder, 'batch.zip')
+    os.utime(path_folder + 'batch.zip', ns=(0, 0))
+    assert not run.is_cached(run.list_analysis_files()[0])
+
+def test_archives_opt_in(parse_defn, tmp_path):
+    """
+    Archives and .gz files are only discovered with FileFilter(archives=True)
+    JDL 10/18/26
+    """
+    path_folder = str(tmp_path) + os.sep
+    write_archive(path_folder, 'batch.zip')
+    write_archive(path_folder, 'gz')
+    assert TensileParsingRun(parse_defn, path_folder).list_analysis_files() == []
+    assert len(list(FileFilter(archives=True).iter_files(path_folder))) == 4
+
+@pytest.mark.parametrize('archive_name', ['batch.zip', 'batch.tar.gz'])
+def test_samples_indexed_archive(parse_defn, tmp_path, parse_run, archive_name):
+    """
+    Block index sidecars of archive members are written in an
+    <archive>.blockidx folder and give the same samples as loose files
+    JDL 10/18/26
+    """
+    parse_run.read_files_procedure()
+    path_folder = str(tmp_path) + os.sep
+    write_archive(path_folder, archive_name)
+    run = TensileParsingRun(parse_defn, path_folder,
+                            file_filter=FileFilter(archives=True))
+    lst_samples = list(run.samples(file_class=IndexedAnalysisFile))
+
+    assert sorted(os.listdir(path_folder + archive_name + '.blockidx')) == \
+           [quote('batch/' + f, safe='') + '.json' for f in FILES]
+    df_raw = pd.concat([s.df_raw for s in lst_samples], ignore_index=True)
+    pd.testing.assert_frame_equal(df_raw, parse_run.df_raw)
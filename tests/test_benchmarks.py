@@ -0,0 +1,52 @@
+#Version 10/18/26
+#python -m pytest test_benchmarks.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import json
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' 
+bench_dir = os.path.dirname(current_dir) +  os.sep + 'benchmarks' 
+for path in [libs_dir, bench_dir]:
+    if not path in sys.path: sys.path.append(path)
+from curve_parse import TensileParsingRun
+from synthetic_files import example_parse_defn, write_synthetic_folder
+import run_benchmarks
+
+"""
+=========================================================================
+Synthetic files and benchmark suite
+=========================================================================
+"""
+def test_write_synthetic_folder(tmp_path):
+    """
+    Synthetic files parse to the configured file/sample/point counts
+    JDL 10/18/26
+    """
+    path_folder = str(tmp_path) + os.sep
+    lst_files = write_synthetic_folder(path_folder, 3, 4, 25)
+    assert len(lst_files) == 3
+
+    run = TensileParsingRun(example_parse_defn(), path_folder)
+    run.read_files_procedure()
+    assert run.df_params.shape == (12, 8)
+    assert run.df_raw.shape == (300, 6)
+    assert run.df_raw['RunID'].unique().tolist() == ['Run101620-1', 'Run101620-2', 'Run101620-3']
+    assert run.df_raw.groupby(['RunID', 'SampleID'])['idx'].max().eq(24).all()
+
+def test_run_benchmarks_json(tmp_path):
+    """
+    Benchmark runner times each stage and writes results JSON
+    JDL 10/18/26
+    """
+    path_json = str(tmp_path / 'bench.json')
+    run_benchmarks.main(['--files', '2', '--samples', '2', '--points', '10',
+                         '--repeat', '1', '--formats', 'csv', '--json', path_json])
+    with open(path_json) as f:
+        results = json.load(f)
+
+    assert results['config']['raw_rows'] == 40
+    names = results['results'].keys()
+    assert 'read_files_procedure' in names
+    assert 'write_parsed_data[csv]' in names
+    assert 'ParseAnalysisFile.read_raw_data' in names
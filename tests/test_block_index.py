@@ -0,0 +1,95 @@
+#Version 10/18/26
+#python -m pytest test_block_index.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import pandas as pd
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' 
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+from curve_parse import TensileParsingRun, read_indexed_rows
+import block_index
+from block_index import IndexedAnalysisFile, build_block_index, load_block_index
+from block_index import SIDECAR_SUFFIX
+
+@pytest.fixture()
+def pathfile(path_folder):
+    return path_folder + 'Run101620-1_Material X_val.csv'
+
+"""
+=========================================================================
+Block index sidecar files
+=========================================================================
+"""
+def test_build_block_index(pathfile, parse_defn):
+    """
+    Return block index dictionary for an analysis file
+    JDL 10/18/26
+    """
+    index = build_block_index(pathfile, parse_defn)
+    assert index['run_id'] == ' "Run101620-1_Material X_Analysis 94623.mss"'
+    assert index['varnames'] == ['_Load', 'SlackExt']
+
+    #Row ranges match the ParseAnalysisFile idx lists
+    assert [p['row_start'] for p in index['params']] == [10, 26]
+    assert [p['row_end'] for p in index['params']] == [14, 30]
+    assert [p['row_start'] for p in index['raw']] == [18, 34]
+    assert [p['row_end'] for p in index['raw']] == [22, 38]
+
+def test_read_indexed_rows(pathfile, parse_defn):
+    """
+    Seek to a block's byte range and return its rows
+    JDL 10/18/26
+    """
+    index = build_block_index(pathfile, parse_defn)
+    rows = read_indexed_rows(pathfile, index['raw'][1])
+    assert rows == [['0', '0.001', ''], ['0.01', '0.091', ''], ['0.05', '0.149', ''],
+                    ['0.5', '0.218', ''], ['0.4', '0.298', '']]
+
+def test_load_block_index(pathfile, parse_defn, monkeypatch):
+    """
+    Sidecar is written on first load, reused while current and rebuilt
+    when the file changes
+    JDL 10/18/26
+    """
+    index = load_block_index(pathfile, parse_defn)
+    assert os.path.exists(pathfile + SIDECAR_SUFFIX)
+
+    lst_built = []
+    build = block_index.build_block_index
+    def record_build(pathfile, defn):
+        lst_built.append(pathfile)
+        return build(pathfile, defn)
+    monkeypatch.setattr(block_index, 'build_block_index', record_build)
+
+    assert load_block_index(pathfile, parse_defn) == index
+    assert lst_built == []
+
+    with open(pathfile, 'a') as f:
+        f.write('EndAnalysis,,\n')
+    index_new = load_block_index(pathfile, parse_defn)
+    assert lst_built == [pathfile]
+    assert index_new['fingerprint'] != index['fingerprint']
+
+"""
+=========================================================================
+IndexedAnalysisFile Class
+=========================================================================
+"""
+def test_samples_indexed(path_folder, parse_defn):
+    """
+    Indexed per-sample reads match reads from the loaded file
+    JDL 10/18/26
+    """
+    run = TensileParsingRun(parse_defn, path_folder)
+    lst_samples = list(run.samples())
+    lst_indexed = list(run.samples(file_class=IndexedAnalysisFile))
+
+    assert len(lst_indexed) == 4
+    for sample, indexed in zip(lst_samples, lst_indexed):
+        assert isinstance(indexed.parse_file, IndexedAnalysisFile)
+        assert indexed.run_id == sample.run_id
+        assert indexed.analysis_id == sample.analysis_id
+        assert indexed.params == sample.params
+        pd.testing.assert_frame_equal(indexed.df_raw, sample.df_raw)
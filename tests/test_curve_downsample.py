@@ -0,0 +1,75 @@
+#Version 10/18/26
+#python -m pytest test_curve_downsample.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import numpy as np
+import pandas as pd
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' 
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+from curve_parse import TensileParsingRun
+from curve_downsample import downsample_df_raw, minmax_bucket_mask
+
+"""
+=========================================================================
+Downsampling
+=========================================================================
+"""
+def test_minmax_bucket_mask():
+    """
+    Keep first/last points and each bucket's min and max; short segments
+    are kept whole
+    JDL 10/18/26
+    """
+    y = np.array([0., 5., 1., 2., 9., 3., 4., 1., 0., 7., 8., 1., 2.])
+    offsets = np.array([0, 10, 13])
+    is_kept = minmax_bucket_mask(y, offsets, n_points=6)
+
+    #Segment 1: 2 buckets of 5 points, [0 5 1 2 9] and [3 4 1 0 7]
+    assert np.flatnonzero(is_kept[:10]).tolist() == [0, 4, 8, 9]
+    assert is_kept[10:].all()
+
+@pytest.mark.parametrize('n_points', [0, 2, 3])
+def test_minmax_bucket_mask_n_points(n_points):
+    """
+    n_points too small for the first/last points plus one min/max bucket
+    raises ValueError
+    JDL 10/18/26
+    """
+    y = np.arange(10.)
+    with pytest.raises(ValueError, match='n_points'):
+        minmax_bucket_mask(y, np.array([0, 10]), n_points)
+
+def test_downsample_df_raw_keeps_peaks(parse_defn):
+    """
+    Downsampled curves of the example files keep every sample's peak and
+    original idx and have at most n_points points
+    JDL 10/18/26
+    """
+    run = TensileParsingRun(parse_defn, os.path.dirname(current_dir) + os.sep)
+    run.read_files_procedure()
+    df = downsample_df_raw(run.df_raw, n_points=100)
+
+    cols = ['RunID', 'AnalysisID', 'SampleID']
+    assert df.groupby(cols).size().max() <= 100
+    pd.testing.assert_series_equal(df.groupby(cols)['_Load'].max(),
+                                   run.df_raw.groupby(cols)['_Load'].max())
+    df_merged = df.merge(run.df_raw, on=cols + ['idx'], suffixes=('', '_full'))
+    assert (df_merged['SlackExt'] == df_merged['SlackExt_full']).all()
+
+def test_write_parsed_data_raw_points(parsed_run):
+    """
+    Write downsampled df_raw_reduced alongside or instead of df_raw
+    JDL 10/18/26
+    """
+    parsed_run.write_parsed_data('csv', raw_points=4)
+    df = pd.read_csv(parsed_run.path_folder + 'df_raw_reduced.csv')
+    assert df['idx'].tolist() == [0, 2, 4, 0, 3, 4, 0, 3, 4, 0, 1, 2, 3]
+    assert os.path.exists(parsed_run.path_folder + 'df_raw.csv')
+    assert 'df_raw_reduced.csv' not in parsed_run.list_analysis_files()
+
+    os.remove(parsed_run.path_folder + 'df_raw.csv')
+    parsed_run.write_parsed_data('csv', raw_points=4, full_raw=False)
+    assert not os.path.exists(parsed_run.path_folder + 'df_raw.csv')
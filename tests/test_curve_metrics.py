@@ -0,0 +1,85 @@
+#Version 10/18/26
+#python -m pytest test_curve_metrics.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import numpy as np
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' 
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+from curve_parse import TensileParsingRun
+from curve_metrics import compute_curve_metrics, compare_metrics, METRIC_COLS
+
+@pytest.fixture()
+def curves(parse_run):
+    return parse_run.read_raw_curves()
+
+def trapezoid(y, x):
+    return np.sum((y[1:] + y[:-1]) * np.diff(x)) / 2
+
+"""
+=========================================================================
+Segment Reductions
+=========================================================================
+"""
+def test_metrics_whole_curve(curves):
+    """
+    Without params, metrics are computed over each whole curve
+    JDL 10/18/26
+    """
+    df = compute_curve_metrics(curves, n_peaks=2)
+    assert list(df.columns[3:]) == METRIC_COLS
+    assert df['PeakLoad'].tolist() == [0.8, 0.5, 0.4, 0.2]
+    assert np.allclose(df['AverageLoad'], [0.296, 0.192, 0.152, 0.0925])
+    assert np.allclose(df['PeelMeanLoad'], df['AverageLoad'])
+    assert df['AvgNPeaks'].tolist() == [0.8, 0.5, 0.4, 0.2]
+
+    load, ext = curves.curve(0)
+    assert df['Energy'][0] == pytest.approx(trapezoid(load, ext))
+
+def test_metrics_peel_window(curves):
+    """
+    PeelStart/PeelEnd idx (inclusive) limit the windowed metrics
+    JDL 10/18/26
+    """
+    df_params = curves.df_ids.copy()
+    df_params['PeelStart'] = [1, 0, 0, 10]
+    df_params['PeelEnd'] = [3, 2, 4, 20]
+    df = compute_curve_metrics(curves, df_params)
+
+    assert df['PeelMeanLoad'][0] == pytest.approx((0.08 + 0.8 + 0.4) / 3)
+    assert np.isnan(df['AvgNPeaks'][1])
+    load, ext = curves.curve(0)
+    assert df['Energy'][0] == pytest.approx(trapezoid(load[1:4], ext[1:4]))
+
+    #Window past the end of the curve is empty
+    assert np.isnan(df['PeelMeanLoad'][3])
+    assert df['Energy'][3] == 0.0
+
+    #Whole-curve metrics are unaffected
+    assert df['PeakLoad'].tolist() == [0.8, 0.5, 0.4, 0.2]
+
+"""
+=========================================================================
+Validation Against Instrument Values
+=========================================================================
+"""
+def test_metrics_match_instrument(parse_defn):
+    """
+    PeakLoad and AverageLoad match the instrument params of example files.
+    The instrument's AvgNPeaks peak detection rule is not recorded in the
+    files (see curve_metrics.py), so AvgNPeaks is checked against the
+    measured bounds: max 0.158 N, mean absolute 0.060 N, unbiased mean
+    JDL 10/18/26
+    """
+    run = TensileParsingRun(parse_defn, os.path.dirname(current_dir) + os.sep)
+    run.read_files_procedure()
+    df = compare_metrics(run.curve_metrics(), run.df_params)
+
+    assert len(df) == 20
+    assert (df['PeakLoad_diff'] == 0).all()
+    assert (df['AverageLoad_diff'].abs() <= 0.005).all()
+    assert (df['AvgNPeaks_diff'].abs() <= 0.16).all()
+    assert df['AvgNPeaks_diff'].abs().mean() <= 0.065
+    assert abs(df['AvgNPeaks_diff'].mean()) <= 0.01
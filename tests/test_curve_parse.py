@@ -6,35 +6,19 @@ import sys, os
 import pandas as pd
 import numpy as np
 import pytest
+import threading
+import tracemalloc
 current_dir = os.path.dirname(os.path.abspath(__file__))
 libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' 
 if not libs_dir in sys.path: sys.path.append(libs_dir)
 from curve_parse import TensileParsingRun
 from curve_parse import ParseAnalysisFile
+from curve_parse import stream_analysis_blocks
+from curve_parse import convert_to_numeric, convert_block_to_numeric
+from curve_parse import concat_with_blocks
 
 IsPrint = False
 
-@pytest.fixture()
-def parse_defn():
-    defn = {}
-    defn['run_id'] = ('_AnalysisName', 1, 0, 1) #Flag, col, row offset, col offset
-    defn['analysis_id'] = ('_AnalysisName', 1, 0, 1)
-
-    defn['params_start'] = ('BeginSample', 1, 1) #Flag, col, row offset
-    defn['params_end'] = ('BeginData', 1, -1)
-
-    defn['params_col_names'] = 1 #Column with param names
-    defn['params_col_offset'] = 1 #params_col_names to param vals offset
-
-    defn['raw_start'] = ('BeginData', 1, 3) #Flag, col, row offset
-    defn['raw_end'] = ('EndData', 1, -1) #Flag, col, row offset
-    defn['raw_var_names'] = (1, -2) #colStart, rowOffset from raw_start row
-    return defn
-
-@pytest.fixture()
-def parse_run(parse_defn):
-    return TensileParsingRun(parse_defn, current_dir + os.sep)
-
 @pytest.fixture()
 def parse_file(parse_run):
     parse_run.file = 'Run101620-1_Material X_val.csv'
@@ -56,6 +40,231 @@ def test_read_files_procedure(parse_run):
     assert parse_run.df_params.shape == (4, 8)
     assert parse_run.df_raw.shape == (19, 6)
 
+def test_read_files_procedure_streaming(parse_defn, parse_run):
+    """
+    Streaming mode gives the same df_params and df_raw as the default
+    DataFrame-based parse
+    JDL 10/18/26
+    """
+    parse_run.read_files_procedure()
+    stream_run = TensileParsingRun(parse_defn, current_dir + os.sep, streaming=True)
+    stream_run.read_files_procedure()
+
+    pd.testing.assert_frame_equal(stream_run.df_params, parse_run.df_params)
+    pd.testing.assert_frame_equal(stream_run.df_raw, parse_run.df_raw)
+
+@pytest.mark.parametrize('streaming', [False, True])
+def test_read_files_procedure_raw_chunks(parse_defn, parse_run, streaming):
+    """
+    Raw blocks processed in chunks give the same df_raw (idx continuous
+    across chunks) as whole blocks
+    JDL 10/18/26
+    """
+    parse_run.read_files_procedure()
+    chunk_run = TensileParsingRun(parse_defn, current_dir + os.sep, streaming=streaming,
+                                  raw_chunk_rows=2)
+    chunk_run.read_files_procedure()
+
+    pd.testing.assert_frame_equal(chunk_run.df_params, parse_run.df_params)
+    pd.testing.assert_frame_equal(chunk_run.df_raw, parse_run.df_raw)
+
+@pytest.mark.parametrize('raw_chunk_rows', [0, -5, 2.5, True, '100'])
+def test_raw_chunk_rows_invalid(parse_defn, raw_chunk_rows):
+    """
+    A raw_chunk_rows that is not None or an integer >= 1 raises ValueError
+    when the run is created
+    JDL 10/18/26
+    """
+    with pytest.raises(ValueError, match='raw_chunk_rows'):
+        TensileParsingRun(parse_defn, current_dir + os.sep, raw_chunk_rows=raw_chunk_rows)
+
+def test_read_files_procedure_workers(parse_defn, parse_run):
+    """
+    Parsing files in a process pool gives the same output as serial
+    JDL 10/18/26
+    """
+    parse_run.read_files_procedure()
+    parallel_run = TensileParsingRun(parse_defn, current_dir + os.sep, workers=2)
+    parallel_run.read_files_procedure()
+
+    pd.testing.assert_frame_equal(parallel_run.df_params, parse_run.df_params)
+    pd.testing.assert_frame_equal(parallel_run.df_raw, parse_run.df_raw)
+
+def test_list_analysis_files(parse_run):
+    """
+    Return sorted list of .csv analysis filenames in path_folder
+    JDL 10/18/26
+    """
+    lst_expected = ['Run101620-1_Material X_val.csv', 'Run101620-2_Material Y_val.csv']
+    assert parse_run.list_analysis_files() == lst_expected
+
+def test_concat_blocks(parse_file):
+    """
+    Buffered sample blocks are concatenated to df_raw and df_params in one
+    step and the buffers are cleared
+    JDL 10/18/26
+    """
+    parse_file.parse_individual_file()
+    run = parse_file.run
+    assert len(run.lst_raw_blocks) == 2
+    assert len(run.lst_params_blocks) == 2
+
+    run.concat_blocks()
+    assert run.lst_raw_blocks == []
+    assert run.lst_params_blocks == []
+    assert run.df_raw.shape == (10, 6)
+    assert run.df_params.shape == (2, 8)
+    assert run.df_raw.index.tolist() == list(range(10))
+
+def test_read_files_procedure_compact_dtypes(parse_defn, parse_run):
+    """
+    compact_dtypes option builds df_raw with categorical IDs, small integer
+    SampleID/idx and (optionally) float32 raw variables
+    JDL 10/18/26
+    """
+    parse_run.read_files_procedure()
+    compact_run = TensileParsingRun(parse_defn, current_dir + os.sep, \
+                                    compact_dtypes=True, raw_float32=True)
+    compact_run.read_files_procedure()
+    df_raw = compact_run.df_raw
+
+    assert df_raw['RunID'].dtype == 'category'
+    assert df_raw['AnalysisID'].dtype == 'category'
+    assert df_raw['SampleID'].dtype == np.uint8
+    assert df_raw['idx'].dtype == np.uint8
+    assert df_raw['_Load'].dtype == np.float32
+    assert df_raw['RunID'].tolist() == parse_run.df_raw['RunID'].tolist()
+    assert np.allclose(df_raw['SlackExt'], parse_run.df_raw['SlackExt'])
+
+def test_concat_with_blocks_categories():
+    """
+    Categorical blocks with different categories concatenate to a
+    categorical column holding the union of categories
+    JDL 10/18/26
+    """
+    df1 = pd.DataFrame({'RunID':pd.Categorical(['a', 'a']), 'x':[1.0, 2.0]})
+    df2 = pd.DataFrame({'RunID':pd.Categorical(['b']), 'x':[3.0]})
+    df = concat_with_blocks(df1, [df2])
+
+    assert df['RunID'].dtype == 'category'
+    assert df['RunID'].tolist() == ['a', 'a', 'b']
+    assert df['RunID'].cat.categories.tolist() == ['a', 'b']
+
+def test_raw_memory_report(parse_defn):
+    """
+    Report df_raw memory use before and after compacting dtypes
+    JDL 10/18/26
+    """
+    compact_run = TensileParsingRun(parse_defn, current_dir + os.sep, \
+                                    compact_dtypes=True, raw_float32=True)
+    compact_run.read_files_procedure()
+    df = compact_run.raw_memory_report()
+
+    assert df.index.tolist() == ['RunID', 'AnalysisID', 'SampleID', 'idx', \
+                                 '_Load', 'SlackExt', 'total']
+    assert df.loc['idx', 'bytes_per_row_before'] == 8
+    assert df.loc['idx', 'bytes_per_row_after'] == 1
+    assert df.loc['_Load', 'bytes_per_row_after'] == 4
+    assert df.loc['total', 'bytes_after'] < df.loc['total', 'bytes_before']
+
+def test_samples(parse_run):
+    """
+    Lazy per-sample handles with IDs and params; raw data read on access
+    JDL 10/18/26
+    """
+    lst_samples = list(parse_run.samples())
+    assert len(lst_samples) == 4
+    assert [s.run_id for s in lst_samples] == ['Run101620-1'] * 2 + ['Run101620-2'] * 2
+    assert [s.sample_id for s in lst_samples] == [1, 2, 1, 2]
+
+    sample = lst_samples[1]
+    assert sample.analysis_id == 'Analysis 94623'
+    assert sample.params['AverageLoad'] == 0.97
+    assert sample._df_raw is None
+
+    col_Load = [0, 0.01, 0.05, 0.5, 0.4]
+    assert sample.df_raw['_Load'].tolist() == col_Load
+    assert sample.df_raw.columns.tolist() == ['RunID','AnalysisID','SampleID','idx','_Load','SlackExt']
+    assert (sample.df_raw['SampleID'] == 2).all()
+
+    #Handles read only indexed blocks (whole file is never loaded)
+    assert sample.parse_file.df_file is None
+
+    #Handles do not append to run outputs
+    assert parse_run.df_raw.empty
+
+def test_stage_summary(parse_defn, parse_run):
+    """
+    Instrumented runs record time, rows and peak memory of each stage per
+    file; uninstrumented runs record nothing
+    JDL 10/18/26
+    """
+    parse_run.read_files_procedure()
+    assert parse_run.stage_summary().empty
+
+    run = TensileParsingRun(parse_defn, current_dir + os.sep, instrument=True)
+    run.read_files_procedure()
+    df = run.stage_summary()
+    assert df.columns.tolist() == ['file', 'stage', 'secs', 'rows', 'peak_bytes']
+
+    df_file = df[df['file'] == 'Run101620-1_Material X_val.csv']
+    stages_expected = ['open_file', 'read_run_id', 'read_analysis_id',
+                       'set_param_idx_lists', 'read_params', 'set_raw_idx_lists',
+                       'read_raw_var_names', 'read_raw_data']
+    assert df_file['stage'].tolist() == stages_expected
+    assert df_file.set_index('stage').loc['open_file', 'rows'] == 42
+    assert df_file.set_index('stage').loc['read_raw_data', 'rows'] == 10
+    assert (df['secs'] > 0).all()
+    assert (df['peak_bytes'] >= 0).all()
+
+    df_stages = run.stage_summary(by_stage=True)
+    assert df_stages.loc['read_raw_data', 'rows'] == 19
+    assert df_stages.loc['read_raw_data', 'files'] == 2
+    assert df_stages.index[-1] == 'concat_blocks'
+
+def test_stage_summary_workers(parse_defn):
+    """
+    Stage records from worker processes are merged in file order
+    JDL 10/18/26
+    """
+    run = TensileParsingRun(parse_defn, current_dir + os.sep, instrument=True,
+                            workers=2, streaming=True)
+    run.read_files_procedure()
+    df = run.stage_summary()
+    assert df['stage'].tolist() == ['stream_individual_file'] * 2 + ['concat_blocks']
+    assert df['rows'].tolist()[:2] == [10, 9]
+
+def test_stage_summary_thread(parse_defn):
+    """
+    Stages run outside the main thread are timed but do not start/stop the
+    process-wide tracemalloc (peak_bytes is None)
+    JDL 10/18/26
+    """
+    run = TensileParsingRun(parse_defn, current_dir + os.sep, instrument=True)
+    thread = threading.Thread(target=run.read_files_procedure)
+    thread.start()
+    thread.join()
+
+    df = run.stage_summary()
+    assert len(df) == 17
+    assert df['peak_bytes'].isna().all()
+    assert not tracemalloc.is_tracing()
+
+def test_stage_summary_properties(parse_defn):
+    """
+    Reading df_raw and df_params after an instrumented run adds no stage
+    records (only read_files_procedure's concat_blocks is recorded)
+    JDL 10/18/26
+    """
+    run = TensileParsingRun(parse_defn, current_dir + os.sep, instrument=True)
+    run.read_files_procedure()
+    n_records = len(run.lst_stage_records)
+    for _ in range(5):
+        assert len(run.df_raw) == 19
+        assert len(run.df_params) == 4
+    assert len(run.lst_stage_records) == n_records
+    assert run.stage_summary()['stage'].tolist().count('concat_blocks') == 1
+
 def test_write_parsed_data(parse_run):
     """
     Read all analysis files in specified folder and append data to 
@@ -306,6 +515,111 @@ def test_ParseAnalysisFile_append_raw_block(parse_file):
     assert parse_file.run.df_raw['SlackExt'].tolist() == col_Extension
 
 
+def test_ParseAnalysisFile_read_sample_params(parse_file):
+    """
+    Return dictionary of a sample's param values by param name
+    JDL 10/18/26
+    """
+    parse_file.index_samples()
+    dict_expected = {'AverageLoad':0.91, 'AvgNPeaks':2.23, 'PeakLoad':2.58,
+                     'PeelEnd':402, 'PeelStart':38}
+    assert parse_file.read_sample_params(1) == dict_expected
+
+def test_ParseAnalysisFile_read_sample_raw(parse_file):
+    """
+    Return a sample's raw data as a df_raw block
+    JDL 10/18/26
+    """
+    parse_file.index_samples()
+    df = parse_file.read_sample_raw(2)
+    assert df['idx'].tolist() == [0, 1, 2, 3, 4]
+    assert df['SlackExt'].tolist() == [0.001, 0.091, 0.149, 0.218, 0.298]
+    assert parse_file.run.lst_raw_blocks == []
+
+"""
+=========================================================================
+Streaming tokenizer
+=========================================================================
+"""
+def test_stream_analysis_blocks(parse_defn):
+    """
+    Walk an analysis file once and yield IDs, param blocks and raw blocks
+    JDL 10/18/26
+    """
+    pathfile = current_dir + os.sep + 'Run101620-1_Material X_val.csv'
+    events = list(stream_analysis_blocks(pathfile, parse_defn))
+
+    assert [e[0] for e in events] == ['run_id', 'analysis_id', 'params',
+                                      'raw', 'params', 'raw']
+    sExpected = ' "Run101620-1_Material X_Analysis 94623.mss"'
+    assert events[0][1] == sExpected
+
+    names_expected = ['AverageLoad','AvgNPeaks','PeakLoad','PeelEnd','PeelStart']
+    assert events[2][1] == names_expected
+    assert events[2][2] == ['0.91', '2.23', '2.58', '402', '38']
+
+    assert events[3][1] == ['_Load', 'SlackExt']
+    assert events[3][2][0] == ['0', '0']
+    assert events[5][2][-1] == ['0.4', '0.298']
+    assert len(events[5][2]) == 5
+
+def test_stream_analysis_blocks_chunks(parse_defn):
+    """
+    With chunk_rows, raw blocks are yielded as chunks with the idx of their
+    first row
+    JDL 10/18/26
+    """
+    pathfile = current_dir + os.sep + 'Run101620-1_Material X_val.csv'
+    events = list(stream_analysis_blocks(pathfile, parse_defn, chunk_rows=2))
+
+    chunks = [e for e in events if e[0] == 'raw_chunk']
+    assert [e[0] for e in events if e[0] != 'raw_chunk'] == ['run_id', 'analysis_id',
+                                                             'params', 'params']
+    assert [e[3] for e in chunks] == [0, 2, 4, 0, 2, 4]
+    assert [len(e[2]) for e in chunks] == [2, 2, 1, 2, 2, 1]
+    assert chunks[0][1] == ['_Load', 'SlackExt']
+    assert chunks[-1][2] == [['0.4', '0.298']]
+
+def test_ParseAnalysisFile_stream_individual_file(parse_file):
+    """
+    Parse a single file in one line-by-line pass (streaming mode)
+    JDL 10/18/26
+    """
+    parse_file.stream_individual_file()
+
+    assert parse_file.run_id == 'Run101620-1'
+    assert parse_file.analysis_id == 'Analysis 94623'
+    assert parse_file.run.df_params.shape == (2, 8)
+    assert parse_file.run.df_raw.shape == (10, 6)
+    assert parse_file.run.df_raw['idx'].tolist() == [0, 1, 2, 3, 4, 0, 1, 2, 3, 4]
+    col_Load = [0, 0.08, 0.8, 0.4, 0.2, 0, 0.01, 0.05, 0.5, 0.4]
+    assert parse_file.run.df_raw['_Load'].tolist() == col_Load
+
+"""
+=========================================================================
+Utility functions
+=========================================================================
+"""
+def test_convert_block_to_numeric(parse_file):
+    """
+    Vectorized conversion matches df.apply(convert_to_numeric) for raw
+    blocks with and without the names/units rows
+    JDL 10/18/26
+    """
+    parse_file.open_file()
+    parse_file.set_raw_idx_lists()
+    for idx_start in [parse_file.lst_idx_raw_start[0], parse_file.lst_idx_raw_start[0] - 2]:
+        idx_end = parse_file.lst_idx_raw_end[0]
+        df = parse_file.df_file.loc[idx_start:idx_end, 0:1]
+
+        df_expected = df.apply(convert_to_numeric)
+        df_converted = convert_block_to_numeric(df)
+        assert df_converted.map(repr).values.tolist() == df_expected.map(repr).values.tolist()
+
+    #All-numeric block is float64; units row strings are kept as is
+    assert (df_converted.iloc[2:].map(type) == float).all().all()
+    assert df_converted.iloc[1].tolist() == ['N', ' "mm"']
+
 """
 =========================================================================
 Utility functions for Print()
@@ -0,0 +1,72 @@
+#Version 10/18/26
+#python -m pytest test_curve_resample.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import numpy as np
+import pandas as pd
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' 
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+from ragged_curves import RaggedCurves
+from curve_resample import resample_curves, curve_envelopes
+
+@pytest.fixture()
+def curves(parse_run):
+    return parse_run.read_raw_curves()
+
+"""
+=========================================================================
+Resampling
+=========================================================================
+"""
+def test_resample_curves(curves):
+    """
+    Batched resampling matches per-sample np.interp; grid values outside a
+    sample's extension range are NaN
+    JDL 10/18/26
+    """
+    grid = np.linspace(0, 0.4, 41)
+    df = resample_curves(curves, grid=grid)
+    assert df.shape == (4, 41)
+    assert df.index.names == ['RunID', 'AnalysisID', 'SampleID']
+    assert df.columns.name == 'SlackExt'
+
+    for i in range(curves.n_samples):
+        load, ext = curves.curve(i)
+        expected = np.interp(grid, ext, load, left=np.nan, right=np.nan)
+        np.testing.assert_allclose(df.iloc[i].to_numpy(), expected, equal_nan=True)
+    assert np.isnan(df.iloc[1, 0])
+    assert df.iloc[0, 0] == 0.0
+
+def test_resample_curves_unsorted_and_nan():
+    """
+    Points are sorted by extension within each sample and NaN points are
+    skipped; samples with < 2 points are all NaN
+    JDL 10/18/26
+    """
+    df_raw = pd.DataFrame({'RunID':['R1'] * 5 + ['R2'], 'AnalysisID':'A', 'SampleID':1,
+                           'idx':[0, 1, 2, 3, 4, 0],
+                           '_Load':[0.0, 2.0, 1.0, np.nan, 3.0, 5.0],
+                           'SlackExt':[0.0, 2.0, 1.0, 1.5, 3.0, 1.0]})
+    df = resample_curves(RaggedCurves.from_frame(df_raw), grid=[0.5, 1.5, 2.5, 3.5])
+    np.testing.assert_allclose(df.loc['R1'].to_numpy()[0], [0.5, 1.5, 2.5, np.nan])
+    assert df.loc['R2'].isna().all(axis=None)
+
+def test_curve_envelopes(parse_run):
+    """
+    Per-run mean/min/max curves from resampled samples
+    JDL 10/18/26
+    """
+    parse_run.read_files_procedure()
+    df = parse_run.resampled_curves(n_grid=11)
+    assert df.columns[0] == 0.0
+    assert df.columns[-1] == pytest.approx(0.357)
+
+    df_env = curve_envelopes(df)
+    assert df_env.index.tolist() == [(run_id, stat) for run_id in ['Run101620-1', 'Run101620-2']
+                                     for stat in ['mean', 'min', 'max']]
+    df_run = df.loc['Run101620-1']
+    np.testing.assert_allclose(df_env.loc[('Run101620-1', 'mean')], df_run.mean())
+    np.testing.assert_allclose(df_env.loc[('Run101620-1', 'max')], df_run.max())
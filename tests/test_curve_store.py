@@ -0,0 +1,78 @@
+#Version 10/18/26
+#python -m pytest test_curve_store.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import numpy as np
+import pandas as pd
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' 
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+from curve_parse import TensileParsingRun
+from curve_store import write_curve_store, open_curve_store
+from ragged_curves import RaggedCurves
+
+"""
+=========================================================================
+Memory-mapped curve store
+=========================================================================
+"""
+def test_write_raw_store(parse_defn, path_folder):
+    """
+    Store parsed from files reopens as a memory map matching df_raw
+    JDL 10/18/26
+    """
+    parse_run = TensileParsingRun(parse_defn, path_folder)
+    path_store = parse_run.write_raw_store()
+    assert path_store == parse_run.path_folder + 'df_raw.curves'
+
+    curves = open_curve_store(path_store)
+    assert isinstance(curves.values, np.memmap)
+    assert curves.values.dtype == np.float64
+
+    parse_run.read_files_procedure()
+    pd.testing.assert_frame_equal(curves.to_frame(), parse_run.df_raw)
+
+def test_write_raw_store_from_df_raw(parse_run, tmp_path):
+    """
+    Store written from already-parsed df_raw; single curve selection
+    JDL 10/18/26
+    """
+    parse_run.read_files_procedure()
+    path_store = str(tmp_path / 'store')
+    parse_run.write_raw_store(path_store)
+    parse_run.write_raw_store(path_store)
+
+    curves = open_curve_store(path_store)
+    arr = curves.curve(curves.sample_index('Run101620-2', 1))
+    fil = (parse_run.df_raw['RunID'] == 'Run101620-2') & (parse_run.df_raw['SampleID'] == 1)
+    assert arr[1].tolist() == parse_run.df_raw.loc[fil, 'SlackExt'].tolist()
+
+def test_write_curve_store(parse_run, tmp_path):
+    """
+    RaggedCurves written to a store directory (replacing an existing store)
+    reopen with the same values, offsets and sample IDs
+    JDL 10/18/26
+    """
+    curves = parse_run.read_raw_curves()
+    path_store = str(tmp_path / 'store')
+    write_curve_store(curves, path_store)
+    write_curve_store(curves, path_store)
+    assert not os.path.exists(path_store + '.tmp')
+
+    curves_store = open_curve_store(path_store)
+    assert curves_store.varnames == curves.varnames
+    assert curves_store.offsets.tolist() == curves.offsets.tolist()
+    assert np.array_equal(curves_store.values, curves.values)
+    pd.testing.assert_frame_equal(curves_store.df_ids, curves.df_ids)
+
+def test_from_frame(parse_run):
+    """
+    Build RaggedCurves from a df_raw-style DataFrame
+    JDL 10/18/26
+    """
+    parse_run.read_files_procedure()
+    curves = RaggedCurves.from_frame(parse_run.df_raw)
+    assert curves.offsets.tolist() == [0, 5, 10, 15, 19]
+    assert curves.varnames == ['_Load', 'SlackExt']
+    pd.testing.assert_frame_equal(curves.to_frame(), parse_run.df_raw)
@@ -0,0 +1,97 @@
+#Version 10/18/26
+#python -m pytest test_file_discovery.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import shutil
+import types
+import regex as re
+import pandas as pd
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' 
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+from curve_parse import TensileParsingRun
+from file_discovery import FileFilter
+
+@pytest.fixture()
+def archive_folder(tmp_path):
+    """
+    Archive tree (path string with trailing separator) of test analysis
+    files in year/month/instrument subfolders plus non-analysis files
+    JDL 10/18/26
+    """
+    dict_files = {'2020/10/mts1/Run101620-1_Material X.csv':'Run101620-1_Material X_val.csv',
+                  '2020/10/mts2/Run101620-2_Material Y.csv':'Run101620-2_Material Y_val.csv',
+                  '2020/11/mts1/Run111620-1_Material X.csv':'Run101620-1_Material X_val.csv',
+                  'tmp/Run101620-1_Material X.csv':'Run101620-1_Material X_val.csv'}
+    for rel_path, filename in dict_files.items():
+        os.makedirs(os.path.dirname(tmp_path / rel_path), exist_ok=True)
+        shutil.copy(current_dir + os.sep + filename, tmp_path / rel_path)
+    (tmp_path / '2020' / 'notes.txt').write_text('not an analysis file')
+    (tmp_path / '2020' / 'df_raw.csv').write_text('parsed output')
+    return str(tmp_path) + os.sep
+
+def rel_paths(lst_files):
+    return [f.replace(os.sep, '/') for f in lst_files]
+
+"""
+=========================================================================
+FileFilter Class
+=========================================================================
+"""
+def test_iter_files_recursive(archive_folder):
+    """
+    Files are streamed from a recursive scan in name order within folders
+    JDL 10/18/26
+    """
+    iter_files = FileFilter().iter_files(archive_folder)
+    assert isinstance(iter_files, types.GeneratorType)
+    assert rel_paths(iter_files) == ['2020/10/mts1/Run101620-1_Material X.csv',
+                                     '2020/10/mts2/Run101620-2_Material Y.csv',
+                                     '2020/11/mts1/Run111620-1_Material X.csv',
+                                     'tmp/Run101620-1_Material X.csv']
+    assert list(FileFilter(recursive=False).iter_files(archive_folder)) == []
+
+def test_iter_files_include_exclude(archive_folder):
+    """
+    Glob and regex include/exclude filters; excluded folders are pruned
+    JDL 10/18/26
+    """
+    file_filter = FileFilter(include=['2020/10/*'], exclude=['*Material Y*'])
+    assert rel_paths(file_filter.iter_files(archive_folder)) == \
+        ['2020/10/mts1/Run101620-1_Material X.csv']
+
+    file_filter = FileFilter(include=[re.compile(r'mts1/')], exclude=['tmp', '11'])
+    assert rel_paths(file_filter.iter_files(archive_folder)) == \
+        ['2020/10/mts1/Run101620-1_Material X.csv']
+
+def test_iter_files_run_ids(archive_folder):
+    """
+    RunIDs read from filenames filter by collection or function
+    JDL 10/18/26
+    """
+    file_filter = FileFilter(run_ids={'Run101620-2', 'Run111620-1'})
+    assert rel_paths(file_filter.iter_files(archive_folder)) == \
+        ['2020/10/mts2/Run101620-2_Material Y.csv',
+         '2020/11/mts1/Run111620-1_Material X.csv']
+
+    #RunID date (MMDDYY) range
+    file_filter = FileFilter(run_ids=lambda run_id: run_id[3:7] >= '1101', exclude=['tmp'])
+    assert rel_paths(file_filter.iter_files(archive_folder)) == \
+        ['2020/11/mts1/Run111620-1_Material X.csv']
+    assert file_filter.run_id('Run101620-1_Material X.csv') == 'Run101620-1'
+
+def test_read_files_procedure_file_filter(parse_defn, archive_folder):
+    """
+    Parsing discovered files matches parsing the same files in a flat folder
+    JDL 10/18/26
+    """
+    file_filter = FileFilter(include=['2020/10/*'])
+    run = TensileParsingRun(parse_defn, archive_folder, file_filter=file_filter)
+    run.read_files_procedure()
+
+    run_flat = TensileParsingRun(parse_defn, current_dir + os.sep)
+    run_flat.read_files_procedure()
+    pd.testing.assert_frame_equal(run.df_raw, run_flat.df_raw)
+    pd.testing.assert_frame_equal(run.df_params, run_flat.df_params)
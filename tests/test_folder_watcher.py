@@ -0,0 +1,127 @@
+#Version 10/18/26
+#python -m pytest test_folder_watcher.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import shutil
+import sqlite3
+import time
+import threading
+import pandas as pd
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' 
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+from conftest import FILES
+from curve_parse import TensileParsingRun
+from parse_sinks import SQLiteSink
+from folder_watcher import FolderWatcher
+
+@pytest.fixture()
+def watch_folder(tmp_path):
+    """
+    Empty folder (path string with trailing separator) that test files are
+    dropped into
+    JDL 10/18/26
+    """
+    return str(tmp_path) + os.sep
+
+def drop_file(watch_folder, filename):
+    shutil.copy(current_dir + os.sep + filename, watch_folder + filename)
+
+"""
+=========================================================================
+Polling and ingest
+=========================================================================
+"""
+def test_poll_waits_for_settled_file(parse_defn, watch_folder):
+    """
+    Files are only parsed once size and mtime are unchanged for settle_secs
+    JDL 10/18/26
+    """
+    run = TensileParsingRun(parse_defn, watch_folder)
+    watcher = FolderWatcher(run, settle_secs=0.2)
+    drop_file(watch_folder, FILES[0])
+
+    watcher.poll()
+    assert watcher.drain() == []
+
+    #File still being written restarts the settle timer
+    time.sleep(0.25)
+    with open(watch_folder + FILES[0], 'a') as f: f.write('\n')
+    watcher.poll()
+    assert watcher.drain() == []
+
+    time.sleep(0.25)
+    watcher.poll()
+    assert watcher.drain() == [FILES[0]]
+    assert run.df_raw.shape == (10, 6)
+
+    #Ingested files are not parsed again
+    watcher.poll()
+    assert watcher.drain() == []
+    assert run.df_raw.shape == (10, 6)
+
+def test_incremental_ingest_sqlite(parse_defn, watch_folder, tmp_path):
+    """
+    Each new file's rows are committed to the sink's database as soon as it
+    is parsed
+    JDL 10/18/26
+    """
+    path_db = str(tmp_path / 'parsed.db')
+    drop_file(watch_folder, FILES[0])
+    with SQLiteSink(path_db) as sink:
+        run = TensileParsingRun(parse_defn, watch_folder, sink=sink)
+        watcher = FolderWatcher(run, settle_secs=0, ingest_existing=False)
+
+        drop_file(watch_folder, FILES[1])
+        watcher.poll()
+        assert watcher.drain() == [FILES[1]]
+
+        #Readable from another connection before the sink is closed
+        with sqlite3.connect(path_db) as conn:
+            df = pd.read_sql('SELECT * FROM df_raw', conn)
+        assert df.shape == (9, 6)
+        assert set(df['RunID']) == {'Run101620-2'}
+
+def test_failed_file_retried_when_changed(parse_defn, watch_folder):
+    """
+    A file that fails to parse is skipped until it changes
+    JDL 10/18/26
+    """
+    run = TensileParsingRun(parse_defn, watch_folder)
+    watcher = FolderWatcher(run, settle_secs=0)
+    with open(watch_folder + FILES[0], 'w') as f: f.write('partial,file\n')
+
+    watcher.poll()
+    assert watcher.drain() == []
+    assert FILES[0] in watcher.dict_failed
+    watcher.poll()
+    assert watcher.dict_futures == {}
+
+    drop_file(watch_folder, FILES[0])
+    watcher.poll()
+    assert watcher.drain() == [FILES[0]]
+    assert watcher.dict_failed == {}
+
+def test_run_forever(parse_defn, watch_folder):
+    """
+    Watching in a background thread ingests files dropped over time and
+    matches read_files_procedure
+    JDL 10/18/26
+    """
+    run = TensileParsingRun(parse_defn, watch_folder)
+    watcher = FolderWatcher(run, poll_secs=0.02, settle_secs=0.05, workers=2)
+    stop_event = threading.Event()
+    thread = threading.Thread(target=watcher.run_forever, args=(stop_event,))
+    thread.start()
+    for filename in FILES:
+        drop_file(watch_folder, filename)
+        time.sleep(0.3)
+    stop_event.set()
+    thread.join()
+
+    run_all = TensileParsingRun(parse_defn, watch_folder)
+    run_all.read_files_procedure()
+    pd.testing.assert_frame_equal(run.df_raw, run_all.df_raw)
+    pd.testing.assert_frame_equal(run.df_params, run_all.df_params)
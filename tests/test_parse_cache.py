@@ -0,0 +1,96 @@
+#Version 10/18/26
+#python -m pytest test_parse_cache.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import pandas as pd
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' 
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+import curve_parse
+from curve_parse import TensileParsingRun
+from parse_cache import ParseCache
+
+@pytest.fixture()
+def cache(tmp_path):
+    return ParseCache(str(tmp_path / 'cache'))
+
+def fail_parse(run, filename):
+    raise AssertionError('Parsed ' + filename + ' instead of using cache')
+
+"""
+=========================================================================
+ParseCache Class
+=========================================================================
+"""
+def test_read_files_procedure_cache_hit(parse_defn, path_folder, cache, monkeypatch):
+    """
+    A second run over unchanged files loads all blocks from the cache
+    JDL 10/18/26
+    """
+    run = TensileParsingRun(parse_defn, path_folder, cache=cache)
+    run.read_files_procedure()
+
+    monkeypatch.setattr(curve_parse, 'parse_file_blocks', fail_parse)
+    run_cached = TensileParsingRun(parse_defn, path_folder, cache=cache)
+    run_cached.read_files_procedure()
+
+    pd.testing.assert_frame_equal(run_cached.df_params, run.df_params)
+    pd.testing.assert_frame_equal(run_cached.df_raw, run.df_raw)
+
+def test_read_files_procedure_changed_file(parse_defn, path_folder, cache, monkeypatch):
+    """
+    Only files whose size/mtime changed are re-parsed
+    JDL 10/18/26
+    """
+    run = TensileParsingRun(parse_defn, path_folder, cache=cache)
+    run.read_files_procedure()
+
+    pathfile = path_folder + 'Run101620-2_Material Y_val.csv'
+    stat = os.stat(pathfile)
+    os.utime(pathfile, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    lst_parsed = []
+    parse_file_blocks = curve_parse.parse_file_blocks
+    def record_parse(run, filename):
+        lst_parsed.append(filename)
+        return parse_file_blocks(run, filename)
+    monkeypatch.setattr(curve_parse, 'parse_file_blocks', record_parse)
+
+    run_cached = TensileParsingRun(parse_defn, path_folder, cache=cache)
+    run_cached.read_files_procedure()
+
+    assert lst_parsed == ['Run101620-2_Material Y_val.csv']
+    pd.testing.assert_frame_equal(run_cached.df_raw, run.df_raw)
+
+def test_load_defn_change(parse_defn, path_folder, cache):
+    """
+    Entries are invalid if the parse definition changes
+    JDL 10/18/26
+    """
+    pathfile = path_folder + 'Run101620-1_Material X_val.csv'
+    cache.store(pathfile, parse_defn, ['params'], ['raw'])
+    assert cache.load(pathfile, parse_defn) == (['params'], ['raw'])
+
+    parse_defn['raw_start'] = ('BeginData', 1, 2)
+    assert cache.load(pathfile, parse_defn) is None
+
+def test_evict(parse_defn, path_folder, tmp_path):
+    """
+    Least recently used entries are evicted above max_bytes
+    JDL 10/18/26
+    """
+    cache = ParseCache(str(tmp_path / 'cache'), max_bytes=10**9)
+    pathfile_1 = path_folder + 'Run101620-1_Material X_val.csv'
+    pathfile_2 = path_folder + 'Run101620-2_Material Y_val.csv'
+    cache.store(pathfile_1, parse_defn, [], [])
+    size_entry = os.path.getsize(cache.entry_path(pathfile_1))
+
+    #Make entry 1 the oldest, then store entry 2 with room for only one
+    os.utime(cache.entry_path(pathfile_1), ns=(0, 0))
+    cache.max_bytes = size_entry + 10
+    cache.store(pathfile_2, parse_defn, [], [])
+
+    assert not os.path.exists(cache.entry_path(pathfile_1))
+    assert cache.load(pathfile_2, parse_defn) == ([], [])
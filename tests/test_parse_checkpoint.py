@@ -0,0 +1,213 @@
+#Version 10/18/26
+#python -m pytest test_parse_checkpoint.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import sqlite3
+import pandas as pd
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' 
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+from conftest import FILES
+from curve_parse import TensileParsingRun
+from file_discovery import FileFilter
+from parse_checkpoint import ParseCheckpoint
+from parse_sinks import BaseSink, CSVSink, ParquetSink, SQLiteSink
+
+@pytest.fixture()
+def path_checkpoint(tmp_path):
+    return str(tmp_path / 'checkpoint')
+
+def parsed_files(run):
+    return sorted(set(record['file'] for record in run.lst_stage_records if record['file']))
+
+class InterruptedCheckpoint(ParseCheckpoint):
+    """
+    Checkpoint whose run is interrupted at the flush after the first
+    completed file (the sink has already received the next file's blocks)
+    JDL 10/18/26
+    """
+    def flush(self, run):
+        if self.dict_completed and self.dict_pending: raise KeyboardInterrupt
+        super().flush(run)
+
+def make_sink(sink_type, path_folder, overwrite=False):
+    if sink_type == 'csv': return CSVSink(path_folder, overwrite=overwrite)
+    if sink_type == 'parquet': return ParquetSink(path_folder, overwrite=overwrite)
+    return SQLiteSink(path_folder + 'parsed.db')
+
+def read_sink_raw(sink_type, path_folder):
+    if sink_type == 'csv': return pd.read_csv(path_folder + 'df_raw.csv')
+    if sink_type == 'parquet': return pd.read_parquet(path_folder + 'df_raw.parquet')
+    with sqlite3.connect(path_folder + 'parsed.db') as conn:
+        return pd.read_sql('SELECT * FROM df_raw', conn)
+
+def assert_outputs_equal(run, parsed_run):
+    pd.testing.assert_frame_equal(run.df_params, parsed_run.df_params)
+    pd.testing.assert_frame_equal(run.df_raw, parsed_run.df_raw)
+
+"""
+=========================================================================
+Checkpoint and resume
+=========================================================================
+"""
+def test_checkpointed_run(parse_defn, path_folder, path_checkpoint, parsed_run):
+    """
+    Completed files are flushed to parts and journaled; outputs match an
+    uncheckpointed run
+    JDL 10/18/26
+    """
+    checkpoint = ParseCheckpoint(path_checkpoint, flush_files=1)
+    run = TensileParsingRun(parse_defn, path_folder, checkpoint=checkpoint)
+    run.read_files_procedure()
+
+    assert_outputs_equal(run, parsed_run)
+    assert list(checkpoint.dict_completed.keys()) == FILES
+    assert sorted(f for f in os.listdir(path_checkpoint) if f.startswith('part_')) == \
+        ['part_00000.pkl', 'part_00001.pkl']
+
+def test_resume_skips_completed_files(parse_defn, path_folder, path_checkpoint, parsed_run):
+    """
+    A restarted run parses only files not completed by the interrupted run
+    JDL 10/18/26
+    """
+    #Interrupted run that only reached the first file
+    run = TensileParsingRun(parse_defn, path_folder, instrument=True,
+                            file_filter=FileFilter(include=[FILES[0]]),
+                            checkpoint=ParseCheckpoint(path_checkpoint))
+    run.read_files_procedure()
+    assert parsed_files(run) == [FILES[0]]
+
+    #Interrupted write of a journal line is ignored
+    with open(os.path.join(path_checkpoint, 'journal.jsonl'), 'a') as f:
+        f.write('{"file": "Run1016')
+
+    run = TensileParsingRun(parse_defn, path_folder, instrument=True,
+                            checkpoint=ParseCheckpoint(path_checkpoint))
+    run.read_files_procedure()
+    assert parsed_files(run) == [FILES[1]]
+    assert_outputs_equal(run, parsed_run)
+
+    #Files changed after completion are parsed again
+    os.utime(path_folder + FILES[0], ns=(0, 0))
+    run = TensileParsingRun(parse_defn, path_folder, instrument=True,
+                            checkpoint=ParseCheckpoint(path_checkpoint))
+    run.read_files_procedure()
+    assert parsed_files(run) == [FILES[0]]
+    assert run.df_raw.shape == (19, 6)
+
+def test_rebuild_current_files(parse_defn, path_folder, path_checkpoint):
+    """
+    Outputs are rebuilt from the files discovered now in discovery order:
+    a deleted file is left out and a changed (re-parsed) file keeps its
+    place
+    JDL 10/18/26
+    """
+    with open(path_folder + FILES[0]) as f:
+        text = f.read().replace('Run101620-1', 'Run101620-3')
+    with open(path_folder + 'Run101620-3_Material X_val.csv', 'w') as f: f.write(text)
+    checkpoint = ParseCheckpoint(path_checkpoint, flush_files=1)
+    TensileParsingRun(parse_defn, path_folder, checkpoint=checkpoint).read_files_procedure()
+
+    os.remove(path_folder + FILES[1])
+    os.utime(path_folder + FILES[0], ns=(0, 0))
+    run = TensileParsingRun(parse_defn, path_folder, instrument=True,
+                            checkpoint=ParseCheckpoint(path_checkpoint, flush_files=1))
+    run.read_files_procedure()
+    assert parsed_files(run) == [FILES[0]]
+    assert run.df_params['RunID'].tolist() == ['Run101620-1'] * 2 + ['Run101620-3'] * 2
+
+    full_run = TensileParsingRun(parse_defn, path_folder)
+    full_run.read_files_procedure()
+    assert_outputs_equal(run, full_run)
+
+def test_resume_parse_defn_changed(parse_defn, path_folder, path_checkpoint):
+    """
+    Files completed with a different parse definition are parsed again
+    JDL 10/18/26
+    """
+    run = TensileParsingRun(parse_defn, path_folder, checkpoint=ParseCheckpoint(path_checkpoint))
+    run.read_files_procedure()
+
+    parse_defn['raw_end'] = ('EndData', 1, -2)
+    run = TensileParsingRun(parse_defn, path_folder, instrument=True,
+                            checkpoint=ParseCheckpoint(path_checkpoint))
+    run.read_files_procedure()
+    assert parsed_files(run) == FILES
+    assert run.df_raw.shape == (15, 6)
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_malformed_file_quarantined(parse_defn, path_folder, path_checkpoint, parsed_run, workers):
+    """
+    Files that fail to parse are quarantined with their error instead of
+    aborting the batch, and are not retried until they change
+    JDL 10/18/26
+    """
+    with open(path_folder + 'Run101620-3_Bad.csv', 'w') as f: f.write('partial,file\n')
+    checkpoint = ParseCheckpoint(path_checkpoint)
+    run = TensileParsingRun(parse_defn, path_folder, workers=workers, checkpoint=checkpoint)
+    run.read_files_procedure()
+
+    assert_outputs_equal(run, parsed_run)
+    dict_errors = checkpoint.quarantined()
+    assert list(dict_errors.keys()) == ['Run101620-3_Bad.csv']
+    assert dict_errors['Run101620-3_Bad.csv'].startswith('IndexError')
+
+    checkpoint = ParseCheckpoint(path_checkpoint)
+    files = list(checkpoint.iter_pending(run, run.list_analysis_files()))
+    assert files == []
+    os.utime(path_folder + 'Run101620-3_Bad.csv', ns=(0, 0))
+    files = list(checkpoint.iter_pending(run, run.list_analysis_files()))
+    assert files == ['Run101620-3_Bad.csv']
+
+"""
+=========================================================================
+Resume with a sink
+=========================================================================
+"""
+@pytest.mark.parametrize('sink_type', ['csv', 'parquet', 'sqlite'])
+def test_resume_with_sink(parse_defn, path_folder, path_checkpoint, parsed_run, sink_type):
+    """
+    A run with a sink interrupted after its sink received unjournaled
+    blocks resumes to the same output as an uninterrupted run (blocks after
+    the last journaled flush are discarded and the file re-parsed)
+    JDL 10/18/26
+    """
+    if sink_type == 'parquet': pytest.importorskip('pyarrow.parquet')
+    checkpoint = InterruptedCheckpoint(path_checkpoint, flush_files=1)
+    with pytest.raises(KeyboardInterrupt):
+        with make_sink(sink_type, path_folder, overwrite=True) as sink:
+            run = TensileParsingRun(parse_defn, path_folder, sink=sink, checkpoint=checkpoint)
+            run.read_files_procedure()
+    assert list(checkpoint.dict_completed.keys()) == FILES[:1]
+
+    with make_sink(sink_type, path_folder) as sink:
+        run = TensileParsingRun(parse_defn, path_folder, sink=sink, instrument=True,
+                                checkpoint=ParseCheckpoint(path_checkpoint))
+        run.read_files_procedure()
+    assert parsed_files(run) == FILES[1:]
+
+    df_raw = read_sink_raw(sink_type, path_folder)
+    assert df_raw['_Load'].tolist() == parsed_run.df_raw['_Load'].tolist()
+    assert df_raw['RunID'].tolist() == parsed_run.df_raw['RunID'].tolist()
+
+def test_resume_sink_errors(parse_defn, path_folder, path_checkpoint):
+    """
+    Resuming raises ValueError if the sink overwrote its output or cannot
+    resume, or if the checkpoint's files went to the other kind of output
+    JDL 10/18/26
+    """
+    with CSVSink(path_folder) as sink:
+        TensileParsingRun(parse_defn, path_folder, sink=sink,
+                          checkpoint=ParseCheckpoint(path_checkpoint)).read_files_procedure()
+
+    for sink in [CSVSink(path_folder, overwrite=True), BaseSink()]:
+        run = TensileParsingRun(parse_defn, path_folder, sink=sink,
+                                checkpoint=ParseCheckpoint(path_checkpoint))
+        with pytest.raises(ValueError):
+            run.read_files_procedure()
+
+    run = TensileParsingRun(parse_defn, path_folder, checkpoint=ParseCheckpoint(path_checkpoint))
+    with pytest.raises(ValueError, match='sink'):
+        run.read_files_procedure()
@@ -0,0 +1,108 @@
+#Version 10/18/26
+#python -m pytest test_parse_output.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import sqlite3
+import pandas as pd
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' 
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+from parse_output import typed_columns, write_sqlite
+
+"""
+=========================================================================
+Output writers
+=========================================================================
+"""
+def test_typed_columns(parsed_run):
+    """
+    Return DataFrame with explicit dtypes for ID and index columns
+    JDL 10/18/26
+    """
+    df = typed_columns(parsed_run.df_raw)
+    assert df['RunID'].dtype == 'string'
+    assert df['AnalysisID'].dtype == 'string'
+    assert df['SampleID'].dtype == 'int64'
+    assert df['idx'].dtype == 'int64'
+    assert df['_Load'].dtype == 'float64'
+
+def test_write_parsed_data_csv(parsed_run):
+    """
+    Write df_params and df_raw to csv files
+    JDL 10/18/26
+    """
+    parsed_run.write_parsed_data('csv')
+    df_raw = pd.read_csv(parsed_run.path_folder + 'df_raw.csv')
+    assert df_raw.shape == (19, 6)
+    assert df_raw['_Load'].tolist() == parsed_run.df_raw['_Load'].tolist()
+
+    #Output csv files are not treated as analysis files on a re-run
+    assert 'df_raw.csv' not in parsed_run.list_analysis_files()
+
+def test_write_parsed_data_parquet(parsed_run):
+    """
+    Write Parquet datasets partitioned by RunID; re-writing replaces them
+    JDL 10/18/26
+    """
+    pytest.importorskip('pyarrow')
+    parsed_run.write_parsed_data('parquet')
+    parsed_run.write_parsed_data('parquet')
+
+    path_dataset = parsed_run.path_folder + 'df_raw.parquet'
+    assert sorted(os.listdir(path_dataset)) == ['RunID=Run101620-1', 'RunID=Run101620-2']
+
+    df_raw = pd.read_parquet(path_dataset)
+    assert df_raw.shape == (19, 6)
+    assert df_raw['SampleID'].dtype == 'int64'
+    assert sorted(df_raw['_Load'].tolist()) == sorted(parsed_run.df_raw['_Load'].tolist())
+
+def test_write_parsed_data_feather(parsed_run):
+    """
+    Write df_params and df_raw to Feather files with typed columns
+    JDL 10/18/26
+    """
+    pytest.importorskip('pyarrow')
+    parsed_run.write_parsed_data('feather')
+
+    df_raw = pd.read_feather(parsed_run.path_folder + 'df_raw.feather')
+    pd.testing.assert_frame_equal(df_raw, typed_columns(parsed_run.df_raw))
+
+def read_sqlite(path_folder, sql):
+    with sqlite3.connect(path_folder + 'parsed_data.sqlite') as conn:
+        return pd.read_sql(sql, conn)
+
+def test_write_parsed_data_sqlite(parsed_run):
+    """
+    Write df_params and df_raw tables with key indexes to a SQLite database;
+    re-writing replaces rows rather than duplicating them
+    JDL 10/18/26
+    """
+    parsed_run.write_parsed_data('sqlite')
+    parsed_run.write_parsed_data('sqlite')
+
+    df_raw = read_sqlite(parsed_run.path_folder, 'SELECT * FROM df_raw')
+    pd.testing.assert_frame_equal(df_raw, parsed_run.df_raw)
+    df_params = read_sqlite(parsed_run.path_folder, 'SELECT * FROM df_params')
+    assert df_params.shape == (4, 8)
+
+    df_index = read_sqlite(parsed_run.path_folder, "PRAGMA index_info('ix_df_raw_keys')")
+    assert df_index['name'].tolist() == ['RunID', 'AnalysisID', 'SampleID', 'idx']
+
+def test_write_sqlite_replaces_file_rows(parsed_run):
+    """
+    Writing a re-parsed file replaces all of that file's rows (including
+    samples no longer present) and keeps other files' rows
+    JDL 10/18/26
+    """
+    parsed_run.write_parsed_data('sqlite')
+    df = parsed_run.df_raw
+    df = df[(df['RunID'] == 'Run101620-1') & (df['SampleID'] == 1)].copy()
+    df['_Load'] = df['_Load'] + 1
+    write_sqlite(df, parsed_run.path_folder + 'df_raw')
+
+    sql = 'SELECT RunID, COUNT(*) AS n, MAX(_Load) AS max_load FROM df_raw GROUP BY RunID'
+    df_counts = read_sqlite(parsed_run.path_folder, sql)
+    assert df_counts['n'].tolist() == [5, 9]
+    assert df_counts['max_load'].tolist() == [1.8, 0.4]
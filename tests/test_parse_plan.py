@@ -0,0 +1,66 @@
+#Version 10/18/26
+#python -m pytest test_parse_plan.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import pickle
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' 
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+from curve_parse import TensileParsingRun
+from parse_plan import compile_parse_defn, as_parse_plan, IdCell, Marker
+
+"""
+=========================================================================
+Compiled parse definition
+=========================================================================
+"""
+def test_compile_parse_defn(parse_defn):
+    """
+    Compile parse_defn to 0-based columns, offsets and compiled patterns
+    JDL 10/18/26
+    """
+    plan = compile_parse_defn(parse_defn)
+    assert plan.run_id == IdCell('_AnalysisName', 0, 1)
+    assert plan.params_start == Marker('BeginSample', 0, 1)
+    assert plan.raw_end == Marker('EndData', 0, -1)
+    assert (plan.idx_col_names, plan.idx_col_vals) == (0, 1)
+    assert (plan.idx_col_raw, plan.names_row_offset) == (0, -2)
+    assert plan.quote_pattern.sub('', '"abc"') == 'abc'
+
+    #Plan is immutable and survives pickling to worker processes
+    with pytest.raises(AttributeError):
+        plan.idx_col_raw = 2
+    plan_unpickled = pickle.loads(pickle.dumps(plan))
+    assert plan_unpickled[:-3] == plan[:-3]
+    assert plan_unpickled.quote_pattern.pattern == plan.quote_pattern.pattern
+    assert as_parse_plan(plan) is plan
+
+@pytest.mark.parametrize('key, val, msg', [
+    ('raw_start', None, "parse_defn is missing key 'raw_start'"),
+    ('raw_start', ('BeginData', 1), "parse_defn['raw_start'] must be a tuple of length 3"),
+    ('params_end', ('', 1, -1), "parse_defn['params_end'] flag must be a non-empty string"),
+    ('run_id', ('_AnalysisName', 0, 0, 1), "parse_defn['run_id'] column must be >= 1"),
+    ('raw_end', ('EndData', 1, '-1'), "parse_defn['raw_end'] values must be integers"),
+    ('params_col_offset', -1, "parse_defn['params_col_offset'] value column must be >= 1")])
+def test_compile_parse_defn_invalid(parse_defn, key, val, msg):
+    """
+    Malformed definitions fail with a message naming the bad entry
+    JDL 10/18/26
+    """
+    if val is None: del parse_defn[key]
+    else: parse_defn[key] = val
+
+    with pytest.raises(ValueError) as excinfo:
+        compile_parse_defn(parse_defn)
+    assert str(excinfo.value) == msg
+
+def test_TensileParsingRun_invalid_defn(parse_defn):
+    """
+    A malformed definition fails when the run is created
+    JDL 10/18/26
+    """
+    del parse_defn['raw_var_names']
+    with pytest.raises(ValueError):
+        TensileParsingRun(parse_defn, current_dir + os.sep)
@@ -0,0 +1,99 @@
+#Version 10/18/26
+#python -m pytest test_parse_shards.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import subprocess
+import pandas as pd
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' 
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+from conftest import FILES
+from curve_parse import expand_df_raw
+from parse_shards import create_manifest, load_manifest, assign_shards, run_shard, merge_shards
+from parse_shards import main
+
+"""
+=========================================================================
+Manifest and shards
+=========================================================================
+"""
+def test_assign_shards():
+    """
+    Shards are contiguous runs of files balanced by bytes
+    JDL 10/18/26
+    """
+    assert assign_shards([10, 10, 10, 10], 2) == [0, 0, 1, 1]
+    assert assign_shards([30, 10, 10, 10], 2) == [0, 1, 1, 1]
+    assert assign_shards([10, 10], 3) == [0, 2]
+    assert assign_shards([0, 0, 0], 2) == [0, 0, 1]
+
+def test_create_manifest(parse_defn, path_folder, tmp_path):
+    """
+    Manifest lists files in discovery order with shards and round-trips
+    the parse definition
+    JDL 10/18/26
+    """
+    path_manifest = str(tmp_path / 'manifest.json')
+    manifest = create_manifest(parse_defn, path_folder, path_manifest, 2)
+    assert [entry['file'] for entry in manifest['files']] == FILES
+    assert [entry['shard'] for entry in manifest['files']] == [0, 1]
+
+    manifest = load_manifest(path_manifest)
+    assert manifest['parse_defn'] == parse_defn
+    assert create_manifest(parse_defn, path_folder, path_manifest, 2)['files'] == manifest['files']
+
+@pytest.mark.parametrize('n_shards', [2, 3])
+def test_shards_in_processes(parse_defn, path_folder, tmp_path, parsed_run, n_shards):
+    """
+    Shards run as separate processes merge to the single-node outputs
+    JDL 10/18/26
+    """
+    path_manifest, path_output = str(tmp_path / 'manifest.json'), str(tmp_path / 'shards')
+    create_manifest(parse_defn, path_folder, path_manifest, n_shards)
+
+    script = os.path.join(libs_dir, 'parse_shards.py')
+    procs = [subprocess.Popen([sys.executable, script, path_manifest, str(i), path_output])
+             for i in range(n_shards)]
+    assert [proc.wait() for proc in procs] == [0] * n_shards
+
+    df_params, df_raw = merge_shards(path_manifest, path_output)
+    pd.testing.assert_frame_equal(df_params, parsed_run.df_params)
+    pd.testing.assert_frame_equal(df_raw, parsed_run.df_raw)
+
+def test_merge_shards_missing(parse_defn, path_folder, tmp_path):
+    """
+    Merging raises ValueError until every shard has output
+    JDL 10/18/26
+    """
+    path_manifest, path_output = str(tmp_path / 'manifest.json'), str(tmp_path / 'shards')
+    create_manifest(parse_defn, path_folder, path_manifest, 2)
+    run_shard(path_manifest, 1, path_output)
+    with pytest.raises(ValueError, match='Missing output of shard 0'):
+        merge_shards(path_manifest, path_output)
+
+    run_shard(path_manifest, 0, path_output, streaming=True)
+    df_params, df_raw = merge_shards(path_manifest, path_output)
+    assert df_raw.shape == (19, 6)
+
+def test_run_shard_path_folder(parse_defn, path_folder, tmp_path, parsed_run):
+    """
+    Shards parse files from a node's own path_folder (the manifest's folder
+    need not exist there); compact_dtypes shards merge with categorical IDs
+    JDL 10/18/26
+    """
+    path_manifest, path_output = str(tmp_path / 'manifest.json'), str(tmp_path / 'shards')
+    create_manifest(parse_defn, path_folder, path_manifest, 2)
+    path_node = str(tmp_path / 'node_mount')
+    os.makedirs(path_node)
+    for filename in FILES:
+        os.rename(path_folder + filename, os.path.join(path_node, filename))
+
+    main([path_manifest, '0', path_output, '--path-folder', path_node, '--compact-dtypes'])
+    run_shard(path_manifest, 1, path_output, path_folder=path_node + os.sep, compact_dtypes=True)
+
+    df_params, df_raw = merge_shards(path_manifest, path_output)
+    assert df_raw['RunID'].dtype == 'category'
+    assert df_raw['RunID'].cat.categories.tolist() == ['Run101620-1', 'Run101620-2']
+    pd.testing.assert_frame_equal(expand_df_raw(df_raw), parsed_run.df_raw)
@@ -0,0 +1,196 @@
+#Version 10/18/26
+#python -m pytest test_parse_sinks.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import sqlite3
+import tempfile
+import tracemalloc
+import pandas as pd
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' 
+bench_dir = os.path.dirname(current_dir) +  os.sep + 'benchmarks' 
+for path in [libs_dir, bench_dir]:
+    if not path in sys.path: sys.path.append(path)
+from curve_parse import TensileParsingRun
+from parse_sinks import BaseSink, CSVSink, ParquetSink, SQLiteSink
+from synthetic_files import example_parse_defn, write_synthetic_file
+
+class RecordingSink(BaseSink):
+    """
+    Sink that records the kind of each written block
+    JDL 10/18/26
+    """
+    def __init__(self):
+        self.lst_writes = []
+
+    def write_params(self, df):
+        self.lst_writes.append('params')
+
+    def write_raw(self, df):
+        self.lst_writes.append('raw')
+
+def read_with_sink(parse_defn, path_folder, sink):
+    with sink:
+        run = TensileParsingRun(parse_defn, path_folder, sink=sink)
+        run.read_files_procedure()
+    return run
+
+"""
+=========================================================================
+Sinks
+=========================================================================
+"""
+def test_CSVSink(parse_defn, path_folder, parsed_run):
+    """
+    Streamed blocks are appended to csv files; nothing is held in the run
+    JDL 10/18/26
+    """
+    run = read_with_sink(parse_defn, path_folder, CSVSink(path_folder))
+    assert run.df_raw.empty
+    assert run.lst_raw_blocks == []
+
+    df_raw = pd.read_csv(path_folder + 'df_raw.csv')
+    df_params = pd.read_csv(path_folder + 'df_params.csv')
+    assert df_raw['_Load'].tolist() == parsed_run.df_raw['_Load'].tolist()
+    assert df_raw['SampleID'].tolist() == parsed_run.df_raw['SampleID'].tolist()
+    assert df_params['PeakLoad'].tolist() == parsed_run.df_params['PeakLoad'].tolist()
+
+    #Appending a second run (overwrite=False) doubles the rows
+    read_with_sink(parse_defn, path_folder, CSVSink(path_folder, overwrite=False))
+    assert len(pd.read_csv(path_folder + 'df_raw.csv')) == 2 * len(df_raw)
+
+def test_ParquetSink(parse_defn, path_folder, parsed_run):
+    """
+    Streamed blocks are written as Parquet part files of a dataset
+    JDL 10/18/26
+    """
+    pytest.importorskip('pyarrow.parquet')
+    read_with_sink(parse_defn, path_folder, ParquetSink(path_folder, rows_per_group=8))
+
+    path_dataset = path_folder + 'df_raw.parquet'
+    assert sorted(os.listdir(path_dataset)) == ['part-00000.parquet', 'part-00001.parquet']
+    df_raw = pd.read_parquet(path_dataset)
+    assert df_raw['SlackExt'].tolist() == parsed_run.df_raw['SlackExt'].tolist()
+    assert df_raw['RunID'].tolist() == parsed_run.df_raw['RunID'].tolist()
+
+    #Appending a second run (overwrite=False) adds parts
+    read_with_sink(parse_defn, path_folder, ParquetSink(path_folder, overwrite=False))
+    assert len(pd.read_parquet(path_dataset)) == 2 * len(df_raw)
+
+def test_ParquetSink_flush(path_folder):
+    """
+    Flushed blocks are readable before the sink is closed
+    JDL 10/18/26
+    """
+    pytest.importorskip('pyarrow.parquet')
+    sink = ParquetSink(path_folder)
+    sink.write_params(pd.DataFrame({'RunID':['a'], 'SampleID':[1], 'A':[1.0]}))
+    sink.flush()
+    assert pd.read_parquet(path_folder + 'df_params.parquet')['A'].tolist() == [1.0]
+
+    sink.write_params(pd.DataFrame({'RunID':['a'], 'SampleID':[2], 'A':[2.0]}))
+    sink.close()
+    assert pd.read_parquet(path_folder + 'df_params.parquet')['A'].tolist() == [1.0, 2.0]
+
+def test_SQLiteSink(parse_defn, path_folder, parsed_run):
+    """
+    Streamed blocks are written to the same df_params and df_raw tables
+    (with key indexes) as write_parsed_data('sqlite'); re-parsing files
+    replaces their rows
+    JDL 10/18/26
+    """
+    path_db = path_folder + 'parsed.db'
+    read_with_sink(parse_defn, path_folder, SQLiteSink(path_db))
+    read_with_sink(parse_defn, path_folder, SQLiteSink(path_db))
+
+    with sqlite3.connect(path_db) as conn:
+        df_raw = pd.read_sql('SELECT * FROM df_raw', conn)
+        df_params = pd.read_sql('SELECT * FROM df_params', conn)
+        df_index = pd.read_sql("PRAGMA index_info('ix_df_raw_keys')", conn)
+    assert df_raw.columns.tolist() == parsed_run.df_raw.columns.tolist()
+    assert df_raw['_Load'].tolist() == parsed_run.df_raw['_Load'].tolist()
+    assert df_params['AverageLoad'].tolist() == parsed_run.df_params['AverageLoad'].tolist()
+    assert df_index['name'].tolist() == ['RunID', 'AnalysisID', 'SampleID', 'idx']
+
+def test_CSVSink_block_columns(path_folder):
+    """
+    Blocks missing a column are written blank in the header's columns;
+    blocks with a column not in the header raise ValueError
+    JDL 10/18/26
+    """
+    with CSVSink(path_folder) as sink:
+        sink.write_params(pd.DataFrame({'SampleID':[1], 'A':[1.0], 'B':[2.0]}))
+        sink.write_params(pd.DataFrame({'B':[4.0], 'SampleID':[2]}))
+        with pytest.raises(ValueError, match='C'):
+            sink.write_params(pd.DataFrame({'SampleID':[3], 'C':[5.0]}))
+
+    df = pd.read_csv(path_folder + 'df_params.csv')
+    assert df.columns.tolist() == ['SampleID', 'A', 'B']
+    assert df['B'].tolist() == [2.0, 4.0]
+    assert df['A'].isna().tolist() == [False, True]
+
+def test_SQLiteSink_block_columns(path_folder):
+    """
+    Block columns missing from the table are NULL; columns new to the
+    table are added to it
+    JDL 10/18/26
+    """
+    path_db = path_folder + 'parsed.db'
+    with SQLiteSink(path_db) as sink:
+        sink.write_params(pd.DataFrame({'SampleID':[1], 'A':[1.0], 'B':[2.0]}))
+        sink.write_params(pd.DataFrame({'B':[4.0], 'SampleID':[2]}))
+        sink.write_params(pd.DataFrame({'SampleID':[3], 'C':[5.0]}))
+
+    with sqlite3.connect(path_db) as conn:
+        df = pd.read_sql('SELECT * FROM df_params', conn)
+    assert df.columns.tolist() == ['SampleID', 'A', 'B', 'C']
+    assert df['B'].tolist()[:2] == [2.0, 4.0]
+    assert df['A'].isna().tolist() == [False, True, True]
+    assert df['C'].tolist()[2] == 5.0
+
+def test_sink_sample_blocks(parse_defn, path_folder):
+    """
+    Serial streaming parses write each sample's blocks to the sink as the
+    sample is parsed (params and raw interleave); parallel parses write
+    each file's blocks once the file is parsed
+    JDL 10/18/26
+    """
+    sink = RecordingSink()
+    run = TensileParsingRun(parse_defn, path_folder, streaming=True, sink=sink)
+    run.read_files_procedure()
+    assert sink.lst_writes == ['params', 'raw'] * 4
+
+    sink = RecordingSink()
+    run = TensileParsingRun(parse_defn, path_folder, streaming=True, sink=sink, workers=2)
+    run.read_files_procedure()
+    assert sink.lst_writes == ['params', 'params', 'raw', 'raw'] * 2
+
+def peak_bytes_streamed(path_folder, n_points):
+    """
+    Return peak traced bytes of a streaming, chunked parse of a one-sample
+    synthetic file with n_points raw points to a CSVSink
+    JDL 10/18/26
+    """
+    path_file = tempfile.mkdtemp(dir=path_folder) + os.sep
+    write_synthetic_file(path_file + 'Run1_Material X.csv', 'Run1', 1, n_points)
+    tracemalloc.start()
+    with CSVSink(path_file) as sink:
+        run = TensileParsingRun(example_parse_defn(), path_file, streaming=True,
+                                raw_chunk_rows=500, sink=sink)
+        run.read_files_procedure()
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak_bytes
+
+def test_sink_raw_chunks_memory(path_folder):
+    """
+    Streaming raw chunks to a sink keeps peak memory flat as a sample's
+    raw block grows (chunks are written and released as they are read)
+    JDL 10/18/26
+    """
+    peak_bytes_streamed(path_folder, 2000)
+    peak_small = peak_bytes_streamed(path_folder, 2000)
+    peak_large = peak_bytes_streamed(path_folder, 8000)
+    assert peak_large - peak_small < 4 * (8000 - 2000)
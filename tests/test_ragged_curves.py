@@ -0,0 +1,67 @@
+#Version 10/18/26
+#python -m pytest test_ragged_curves.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import numpy as np
+import pandas as pd
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' 
+if not libs_dir in sys.path: sys.path.append(libs_dir)
+from ragged_curves import RaggedCurves
+
+@pytest.fixture()
+def curves(parse_run):
+    return parse_run.read_raw_curves()
+
+"""
+=========================================================================
+RaggedCurves Class
+=========================================================================
+"""
+def test_read_raw_curves(curves):
+    """
+    Raw data of all samples in one shared float64 buffer with offsets
+    JDL 10/18/26
+    """
+    assert curves.varnames == ['_Load', 'SlackExt']
+    assert curves.values.shape == (2, 19)
+    assert curves.values.dtype == np.float64
+    assert curves.values.flags['C_CONTIGUOUS']
+    assert curves.offsets.tolist() == [0, 5, 10, 15, 19]
+    assert curves.df_ids['RunID'].tolist() == ['Run101620-1'] * 2 + ['Run101620-2'] * 2
+    assert curves.df_ids['SampleID'].tolist() == [1, 2, 1, 2]
+
+def test_curve(curves):
+    """
+    Return one sample's values as a view into the shared buffer
+    JDL 10/18/26
+    """
+    i = curves.sample_index('Run101620-1', 2)
+    assert i == 1
+    arr = curves.curve(i)
+    assert arr[0].tolist() == [0, 0.01, 0.05, 0.5, 0.4]
+    assert np.shares_memory(arr, curves.values)
+
+    with pytest.raises(KeyError):
+        curves.sample_index('Run101620-1', 3)
+
+def test_to_frame(parse_run, curves):
+    """
+    Building the DataFrame on request matches df_raw
+    JDL 10/18/26
+    """
+    parse_run.read_files_procedure()
+    pd.testing.assert_frame_equal(curves.to_frame(), parse_run.df_raw)
+    assert curves.to_frame()['idx'].dtype == np.int64
+
+def test_concat(curves):
+    """
+    Concatenate RaggedCurves objects
+    JDL 10/18/26
+    """
+    curves_2 = RaggedCurves.concat([curves, curves])
+    assert curves_2.offsets.tolist() == [0, 5, 10, 15, 19, 24, 29, 34, 38]
+    assert curves_2.segment_ids().tolist()[17:22] == [3, 3, 4, 4, 4]
+    assert np.array_equal(curves_2.curve(7), curves.curve(3))